@@ -5,38 +5,68 @@ Creates and configures the Flask application with all routes, middleware,
 and error handlers.
 """
 
+import importlib
 import logging
+import os
 from pathlib import Path
-from flask import Flask, request, jsonify
+from time import perf_counter
+from flask import Flask, request, jsonify, render_template
 from flask_cors import CORS
 from werkzeug.middleware.proxy_fix import ProxyFix
 
-from ..utils.security.audit import default_auditor, SecurityEventType
+from ..utils.security.audit import (
+    APIAccessEvent, default_audit_writer, default_auditor, SecurityEventType
+)
 from ..utils.logging.setup import get_logger
-from ..utils.errors.handlers import register_error_handlers
+from ..utils.api.json_provider import init_json_provider
+from .middleware import FastPathMiddleware, is_api_request
 
 logger = get_logger(__name__)
 
+# Endpoints excluded from request/response audit logging
+_SKIP_LOG_ENDPOINTS = frozenset({'static', 'health_check', 'health.health_check'})
+
 # Initialize global variables
 DATABASE_AVAILABLE = False
 ASYNC_AVAILABLE = False
 init_database = None
 configure_celery = None
+_optional_imports_done = False
+
+
+def _load_optional_dependencies():
+    """
+    Import optional database and async processing support on first use.
+    
+    SQLAlchemy and Celery are only pulled in when an application is actually
+    created, so importing this module (CLI tooling, health-only workers) stays
+    cheap. Set EAGER_IMPORT=1 to resolve them at module import time instead.
+    """
+    global DATABASE_AVAILABLE, ASYNC_AVAILABLE, init_database, configure_celery
+    global _optional_imports_done
+    
+    if _optional_imports_done:
+        return
+    _optional_imports_done = True
+    
+    # Try to import optional dependencies with graceful fallback
+    try:
+        from ..database import init_app as init_database
+        DATABASE_AVAILABLE = True
+        logger.info("Database support available")
+    except ImportError as e:
+        logger.warning("Database not available - using in-memory storage only: %s", e)
+    
+    try:
+        from ..async_processing import configure_celery
+        ASYNC_AVAILABLE = True
+        logger.info("Async processing support available") 
+    except ImportError as e:
+        logger.warning("Async processing not available - using synchronous processing: %s", e)
 
-# Try to import optional dependencies with graceful fallback
-try:
-    from ..database import init_app as init_database
-    DATABASE_AVAILABLE = True
-    logger.info("Database support available")
-except ImportError as e:
-    logger.warning(f"Database not available - using in-memory storage only: {e}")
 
-try:
-    from ..async_processing import configure_celery
-    ASYNC_AVAILABLE = True
-    logger.info("Async processing support available") 
-except ImportError as e:
-    logger.warning(f"Async processing not available - using synchronous processing: {e}")
+if os.getenv('EAGER_IMPORT') == '1':
+    _load_optional_dependencies()
 
 
 def create_api_app(config) -> Flask:
@@ -50,6 +80,8 @@ def create_api_app(config) -> Flask:
         Configured Flask application
     """
     global DATABASE_AVAILABLE, ASYNC_AVAILABLE
+    _load_optional_dependencies()
+    
     # Create Flask app
     app = Flask(
         __name__,
@@ -62,9 +94,9 @@ def create_api_app(config) -> Flask:
         'SECRET_KEY': config.SECRET_KEY,
         'ENV': config.ENV,
         'DEBUG': config.DEBUG,
-        'UPLOAD_FOLDER': str(config.BASE_DIR / config.UPLOAD_FOLDER),
-        'TEMPLATES_FOLDER': str(config.BASE_DIR / config.TEMPLATES_FOLDER),
-        'REPORTS_FOLDER': str(config.BASE_DIR / config.REPORTS_FOLDER),
+        'UPLOAD_FOLDER': Path(config.BASE_DIR) / config.UPLOAD_FOLDER,
+        'TEMPLATES_FOLDER': Path(config.BASE_DIR) / config.TEMPLATES_FOLDER,
+        'REPORTS_FOLDER': Path(config.BASE_DIR) / config.REPORTS_FOLDER,
         'MAX_CONTENT_LENGTH': config.MAX_CONTENT_LENGTH,
         'TESTING': getattr(config, 'TESTING', False),
         # Database configuration
@@ -72,10 +104,19 @@ def create_api_app(config) -> Flask:
         'SQLALCHEMY_TRACK_MODIFICATIONS': False
     })
     
+    # Serialize JSON responses with orjson when available
+    init_json_provider(app)
+    
     # Add proxy fix for production deployments
     if config.ENV == 'production':
         app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_prefix=1)
     
+    # Answer liveness probes before CORS, request hooks and auditing, and tag API requests
+    from .routes.health import get_health_data
+    app.wsgi_app = FastPathMiddleware(
+        app.wsgi_app, '/api/health', app.json.dumps(get_health_data()).encode('utf-8')
+    )
+    
     # Enable CORS for all routes
     CORS(app, origins=['http://localhost:5000', 'http://127.0.0.1:5000'])
     
@@ -85,7 +126,7 @@ def create_api_app(config) -> Flask:
             init_database(app)
             logger.info("Database initialized successfully")
         except Exception as e:
-            logger.error(f"Database initialization failed: {e}")
+            logger.error("Database initialization failed: %s", e)
             DATABASE_AVAILABLE = False
     
     # Initialize async processing if available
@@ -94,18 +135,21 @@ def create_api_app(config) -> Flask:
             configure_celery(app)
             logger.info("Async processing initialized successfully")
         except Exception as e:
-            logger.error(f"Async processing initialization failed: {e}")
+            logger.error("Async processing initialization failed: %s", e)
             ASYNC_AVAILABLE = False
     
+    # Create upload/template/report directories once at startup
+    ensure_directories(app)
+    
     # Register error handlers
-    register_error_handlers(app)
+    _register_default_error_handlers(app)
+    
+    # Write API access audit events off the request thread
+    default_audit_writer.start()
     
     # Register middleware
     register_middleware(app, config)
     
-    # Register error handlers
-    register_error_handlers(app)
-    
     # Register routes
     register_routes(app, config)
     
@@ -117,7 +161,7 @@ def create_api_app(config) -> Flask:
         'port': config.PORT
     })
     
-    logger.info(f"Flask application created - Environment: {config.ENV}")
+    logger.info("Flask application created - Environment: %s", config.ENV)
     return app
 
 
@@ -125,98 +169,91 @@ def register_middleware(app: Flask, config):
     """Register application middleware"""
     
     @app.before_request
-    def log_request_info():
-        """Log incoming requests for security audit"""
+    def before_request():
+        """Start the request timer and log incoming requests for security audit"""
+        # Resolve the request proxy once; each attribute access through it is a lookup
+        req = request._get_current_object()
+        req._start_time = perf_counter()
+        
         # Skip logging for static files and health checks
-        if request.endpoint in ['static', 'health_check']:
+        if not logger.isEnabledFor(logging.DEBUG) or req.endpoint in _SKIP_LOG_ENDPOINTS:
             return
         
-        logger.debug(f"Request: {request.method} {request.path} from {request.remote_addr}")
-    
-    @app.before_request
-    def start_timer():
-        """Start timing the request"""
-        import time
-        request._start_time = time.time()
+        logger.debug("Request: %s %s from %s", req.method, req.path, req.remote_addr)
     
     @app.after_request
     def log_response_info(response):
         """Log response information"""
-        # Skip logging for static files and health checks
-        if request.endpoint in ['static', 'health_check']:
+        req = request._get_current_object()
+        
+        # Only API calls are audited; skip static files and health checks
+        path = req.path
+        if not is_api_request(req.environ, path) or req.endpoint in _SKIP_LOG_ENDPOINTS:
             return response
         
         # Calculate response time
-        import time
         response_time = 0.0
-        if hasattr(request, '_start_time'):
-            response_time = time.time() - request._start_time
+        start_time = getattr(req, '_start_time', None)
+        if start_time is not None:
+            response_time = perf_counter() - start_time
             response._response_time = response_time
         
         # Log API access for security audit
-        if request.path.startswith('/api/'):
-            default_auditor.log_api_access(
-                endpoint=request.path,
-                method=request.method,
-                status_code=response.status_code,
-                response_time=response_time,
-                user_ip=request.remote_addr,
-                user_agent=request.headers.get('User-Agent')
-            )
+        default_audit_writer.submit_api_access(APIAccessEvent(
+            endpoint=path,
+            method=req.method,
+            status_code=response.status_code,
+            response_time=response_time,
+            user_ip=req.remote_addr,
+            user_agent=req.headers.get('User-Agent')
+        ))
         
         return response
-    
-    @app.before_request
-    def ensure_directories():
-        """Ensure required directories exist"""
-        required_dirs = [
-            app.config['UPLOAD_FOLDER'],
-            app.config['TEMPLATES_FOLDER'], 
-            app.config['REPORTS_FOLDER']
-        ]
-        
-        for directory in required_dirs:
-            Path(directory).mkdir(parents=True, exist_ok=True)
 
 
-def register_error_handlers(app: Flask):
+def ensure_directories(app: Flask):
+    """Ensure required directories exist"""
+    for key in ('UPLOAD_FOLDER', 'TEMPLATES_FOLDER', 'REPORTS_FOLDER'):
+        app.config[key].mkdir(parents=True, exist_ok=True)
+
+
+def _register_default_error_handlers(app: Flask):
     """Register application error handlers"""
     
     @app.errorhandler(400)
     def bad_request(error):
         """Handle bad request errors"""
-        logger.warning(f"Bad request: {error}")
+        logger.warning("Bad request: %s", error)
         return jsonify({'error': 'Bad request', 'message': str(error)}), 400
     
     @app.errorhandler(404)
     def not_found(error):
         """Handle not found errors"""
-        logger.warning(f"Not found: {request.path}")
+        logger.warning("Not found: %s", request.path)
         
         # Differentiate between API and web requests
-        if request.path.startswith('/api/'):
+        if is_api_request(request.environ, request.path):
             return jsonify({'error': 'Endpoint not found'}), 404
         else:
             # Serve the main dashboard for web routes
-            from flask import render_template
             return render_template('dashboard.html'), 200
     
     @app.errorhandler(413)
     def payload_too_large(error):
         """Handle file too large errors"""
-        logger.warning(f"File too large: {error}")
+        logger.warning("File too large: %s", error)
         return jsonify({'error': 'File too large'}), 413
     
     @app.errorhandler(429)
     def rate_limit_exceeded(error):
         """Handle rate limit errors"""
-        logger.warning(f"Rate limit exceeded: {error}")
+        logger.warning("Rate limit exceeded: %s", error)
         return jsonify({'error': 'Rate limit exceeded'}), 429
     
     @app.errorhandler(500)
     def internal_error(error):
         """Handle internal server errors"""
-        logger.error(f"Internal server error: {error}")
+        logger.error("Internal server error: %s", error)
         
         # Log security event for server errors
         default_auditor.log_security_event(
@@ -252,10 +289,24 @@ def init_async_processing(app: Flask):
         app.celery = celery_app
         logger.info("Async processing initialized with Celery")
     except Exception as e:
-        logger.error(f"Failed to initialize async processing: {e}")
+        logger.error("Failed to initialize async processing: %s", e)
         # Don't fail app startup if Celery is not available
 
 
+# Route blueprints as (module, attribute, url_prefix); health must stay first.
+# A prefix of None keeps the blueprint's own url_prefix.
+_BLUEPRINTS = (
+    ('.routes.health', 'health_bp', '/api'),
+    ('.routes.contracts', 'contracts_bp', '/api'),
+    ('.routes.analysis', 'analysis_bp', '/api'),
+    ('.routes.reports', 'reports_bp', '/api'),
+    ('.routes.prompts', 'prompts_bp', '/api'),
+    ('.routes.compatibility', 'compatibility_bp', '/api'),  # Legacy compatibility
+    ('.routes.dashboard', 'dashboard_bp', None),  # Dashboard routes (includes /api prefix)
+    ('.async_routes', 'async_bp', None),  # Async processing routes
+)
+
+
 def register_routes(app: Flask, config):
     """Register application routes"""
     
@@ -263,33 +314,19 @@ def register_routes(app: Flask, config):
     @app.route('/')
     def index():
         """Main dashboard page"""
-        from flask import render_template
         return render_template('dashboard.html')
     
-    # Import and register route blueprints
-    from .routes.health import health_bp
-    from .routes.contracts import contracts_bp
-    from .routes.analysis import analysis_bp
-    from .routes.reports import reports_bp
-    from .routes.prompts import prompts_bp
-    from .routes.compatibility import compatibility_bp
-    from .routes.dashboard import dashboard_bp  # Add dashboard routes
-    from .async_routes import async_bp  # Add async processing routes
-    
-    # Register blueprints
-    app.register_blueprint(health_bp, url_prefix='/api')
-    app.register_blueprint(contracts_bp, url_prefix='/api')
-    app.register_blueprint(analysis_bp, url_prefix='/api')
-    app.register_blueprint(reports_bp, url_prefix='/api')
-    app.register_blueprint(prompts_bp, url_prefix='/api')
-    app.register_blueprint(compatibility_bp, url_prefix='/api')  # Legacy compatibility
-    app.register_blueprint(dashboard_bp)  # Dashboard routes (includes /api prefix)
-    app.register_blueprint(async_bp)  # Async processing routes
-    
-    # Initialize contracts store with existing uploaded files
-    with app.app_context():
-        from .routes.contracts import init_contracts_store
-        init_contracts_store()
+    # Import and register route blueprints; FLASK_MINIMAL=1 serves health routes only
+    blueprints = _BLUEPRINTS[:1] if os.getenv('FLASK_MINIMAL') == '1' else _BLUEPRINTS
+    for module_path, attr, url_prefix in blueprints:
+        module = importlib.import_module(module_path, __package__)
+        app.register_blueprint(getattr(module, attr), url_prefix=url_prefix)
+    
+    # Read prompt templates now so the first prompt requests are cache hits
+    if blueprints is _BLUEPRINTS:
+        from .routes.prompts import warm_prompt_cache
+        with app.app_context():
+            warm_prompt_cache()
     
     logger.info("Application routes registered")
 
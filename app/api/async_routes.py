@@ -2,43 +2,131 @@
 API routes for async processing operations
 """
 import logging
-from typing import Dict, Any, List
+import threading
+from typing import Dict, Any, List, Optional
 
 from flask import Blueprint, request, jsonify, current_app
-from marshmallow import Schema, fields, ValidationError
+from marshmallow import EXCLUDE, Schema, fields, validate, ValidationError
 
-from ..async_processing.task_manager import TaskManager
 from ..utils.errors.exceptions import TaskError, ValidationError as CustomValidationError
 from ..utils.errors.responses import create_error_response
+from ..utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 # Create blueprint
 async_bp = Blueprint('async', __name__, url_prefix='/api/async')
 
+
+# Short-lived cache for polled, read-only broker queries
+_status_cache = TTLCache(default_ttl=5.0)
+TASK_STATUS_TTL = 2.0
+
+
+def _cached_json_response(key, build, ttl: Optional[float] = None):
+    """
+    Serve a polled endpoint from its serialized JSON body
+    
+    build() returns (payload, status_code). The encoded body is cached with
+    the status so repeated polls within the TTL skip both the broker query
+    and re-serialization.
+    """
+    def render():
+        payload, status_code = build()
+        return current_app.json.response(payload).get_data(), status_code
+    
+    body, status_code = _status_cache.get_or_set(key, render, ttl)
+    return current_app.response_class(body, status=status_code, mimetype='application/json')
+
+
+# Shared TaskManager, created on first use so Celery is only imported when needed
+_task_manager = None
+_task_manager_lock = threading.Lock()
+
+
+def _get_task_manager():
+    """Get the process-wide TaskManager instance"""
+    global _task_manager
+    if _task_manager is None:
+        with _task_manager_lock:
+            if _task_manager is None:
+                from ..async_processing.task_manager import TaskManager
+                _task_manager = TaskManager()
+    return _task_manager
+
+
+# Maximum task IDs accepted by the batch status endpoint
+MAX_STATUS_BATCH = 100
+
 # Validation schemas
 class AnalysisTaskSchema(Schema):
     """Schema for analysis task submission"""
+    class Meta:
+        unknown = EXCLUDE
+    
     contract_id = fields.Str(required=True)
     template_id = fields.Str(required=True)
     analysis_options = fields.Dict(missing=dict)
 
 class ReportTaskSchema(Schema):
     """Schema for report generation task submission"""
+    class Meta:
+        unknown = EXCLUDE
+    
     analysis_id = fields.Str(required=True)
     output_formats = fields.List(fields.Str(), required=True)
     output_options = fields.Dict(missing=dict)
 
 class BatchAnalysisTaskSchema(Schema):
     """Schema for batch analysis task submission"""
+    class Meta:
+        unknown = EXCLUDE
+    
     contract_ids = fields.List(fields.Str(), required=True, validate=lambda x: len(x) > 0)
     template_id = fields.Str(required=True)
     batch_options = fields.Dict(missing=dict)
 
+class TaskStatusBatchSchema(Schema):
+    """Schema for batch task status lookup"""
+    class Meta:
+        unknown = EXCLUDE
+    
+    task_ids = fields.List(
+        fields.Str(), required=True, validate=validate.Length(min=1, max=MAX_STATUS_BATCH)
+    )
+
 # Initialize schemas
 analysis_task_schema = AnalysisTaskSchema()
 report_task_schema = ReportTaskSchema()
 batch_analysis_task_schema = BatchAnalysisTaskSchema()
+task_status_batch_schema = TaskStatusBatchSchema()
+
+
+def _required_field_errors(schema: Schema) -> Dict[str, List[str]]:
+    """Build the errors marshmallow reports for a payload missing every required field"""
+    return {
+        name: [field.error_messages['required']]
+        for name, field in schema.fields.items()
+        if field.required
+    }
+
+# Errors for empty payloads, computed once instead of running the schema
+_EMPTY_PAYLOAD_ERRORS = {
+    schema: _required_field_errors(schema)
+    for schema in (
+        analysis_task_schema, report_task_schema, batch_analysis_task_schema,
+        task_status_batch_schema
+    )
+}
+
+
+def _load_request_data(schema: Schema) -> Dict[str, Any]:
+    """Validate the JSON request body against schema"""
+    payload = request.get_json(silent=True)
+    if not payload:
+        raise ValidationError(_EMPTY_PAYLOAD_ERRORS[schema])
+    return schema.load(payload)
+
 
 # Routes
 @async_bp.route('/analysis', methods=['POST'])
@@ -65,12 +153,12 @@ def submit_analysis_task():
     """
     try:
         # Validate request data
-        data = analysis_task_schema.load(request.json or {})
+        data = _load_request_data(analysis_task_schema)
         
-        logger.info(f"Submitting analysis task for contract {data['contract_id']}")
+        logger.info("Submitting analysis task for contract %s", data['contract_id'])
         
         # Submit task
-        task_manager = TaskManager()
+        task_manager = _get_task_manager()
         task_id = task_manager.submit_analysis(
             contract_id=data['contract_id'],
             template_id=data['template_id'],
@@ -89,7 +177,7 @@ def submit_analysis_task():
     except TaskError as e:
         return create_error_response(e, 500)
     except Exception as e:
-        logger.error(f"Unexpected error in submit_analysis_task: {str(e)}")
+        logger.error("Unexpected error in submit_analysis_task: %s", e)
         return create_error_response(TaskError("submit_analysis", f"Failed to submit analysis task: {str(e)}"), 500)
 
 
@@ -117,12 +205,12 @@ def submit_report_task():
     """
     try:
         # Validate request data
-        data = report_task_schema.load(request.json or {})
+        data = _load_request_data(report_task_schema)
         
-        logger.info(f"Submitting report task for analysis {data['analysis_id']}")
+        logger.info("Submitting report task for analysis %s", data['analysis_id'])
         
         # Submit task
-        task_manager = TaskManager()
+        task_manager = _get_task_manager()
         task_id = task_manager.submit_report_generation(
             analysis_id=data['analysis_id'],
             output_formats=data['output_formats'],
@@ -141,7 +229,7 @@ def submit_report_task():
     except TaskError as e:
         return create_error_response(e, 500)
     except Exception as e:
-        logger.error(f"Unexpected error in submit_report_task: {str(e)}")
+        logger.error("Unexpected error in submit_report_task: %s", e)
         return create_error_response(TaskError("submit_report", f"Failed to submit report task: {str(e)}"), 500)
 
 
@@ -169,13 +257,13 @@ def submit_batch_analysis_task():
     """
     try:
         # Validate request data
-        data = batch_analysis_task_schema.load(request.json or {})
+        data = _load_request_data(batch_analysis_task_schema)
         
         contract_count = len(data['contract_ids'])
-        logger.info(f"Submitting batch analysis task for {contract_count} contracts")
+        logger.info("Submitting batch analysis task for %s contracts", contract_count)
         
         # Submit task
-        task_manager = TaskManager()
+        task_manager = _get_task_manager()
         task_id = task_manager.submit_batch_analysis(
             contract_ids=data['contract_ids'],
             template_id=data['template_id'],
@@ -197,7 +285,7 @@ def submit_batch_analysis_task():
     except TaskError as e:
         return create_error_response(e, 500)
     except Exception as e:
-        logger.error(f"Unexpected error in submit_batch_analysis_task: {str(e)}")
+        logger.error("Unexpected error in submit_batch_analysis_task: %s", e)
         return create_error_response(TaskError("submit_batch_analysis", f"Failed to submit batch analysis task: {str(e)}"), 500)
 
 
@@ -219,18 +307,75 @@ def get_task_status(task_id: str):
     }
     """
     try:
-        logger.debug(f"Getting status for task {task_id}")
+        logger.debug("Getting status for task %s", task_id)
         
-        task_manager = TaskManager()
-        status = task_manager.get_task_status(task_id)
+        task_manager = _get_task_manager()
+        status = _status_cache.get_or_set(
+            ('task_status', task_id),
+            lambda: task_manager.get_task_status(task_id),
+            ttl=TASK_STATUS_TTL
+        )
         
         return jsonify(status), 200
         
     except Exception as e:
-        logger.error(f"Unexpected error in get_task_status: {str(e)}")
+        logger.error("Unexpected error in get_task_status: %s", e)
         return create_error_response(TaskError("get_task_status", f"Failed to get task status: {str(e)}"), 500)
 
 
+@async_bp.route('/tasks/status', methods=['POST'])
+def get_task_statuses():
+    """
+    Get status of several async tasks in one call
+    
+    Request body:
+    {
+        "task_ids": ["celery_task_id_1", "celery_task_id_2"]
+    }
+    
+    Returns:
+    {
+        "statuses": {
+            "celery_task_id_1": {"task_id": "celery_task_id_1", "state": "SUCCESS", ...},
+            "celery_task_id_2": {"task_id": "celery_task_id_2", "state": "PENDING", ...}
+        },
+        "count": 2
+    }
+    """
+    try:
+        data = _load_request_data(task_status_batch_schema)
+        task_ids = list(dict.fromkeys(data['task_ids']))
+        
+        logger.debug("Getting status for %s tasks", len(task_ids))
+        
+        # Serve what's cached, fetch the rest from the backend in one round trip
+        statuses = {}
+        missing = []
+        for task_id in task_ids:
+            status = _status_cache.get(('task_status', task_id))
+            if status is None:
+                missing.append(task_id)
+            else:
+                statuses[task_id] = status
+        
+        if missing:
+            fetched = _get_task_manager().get_task_statuses(missing)
+            for task_id, status in fetched.items():
+                _status_cache.set(('task_status', task_id), status, TASK_STATUS_TTL)
+            statuses.update(fetched)
+        
+        return jsonify({
+            'statuses': statuses,
+            'count': len(statuses)
+        }), 200
+        
+    except ValidationError as e:
+        return create_error_response(CustomValidationError("Invalid request data", details=e.messages), 400)
+    except Exception as e:
+        logger.error("Unexpected error in get_task_statuses: %s", e)
+        return create_error_response(TaskError("get_task_statuses", f"Failed to get task statuses: {str(e)}"), 500)
+
+
 @async_bp.route('/tasks/<task_id>/cancel', methods=['POST'])
 def cancel_task(task_id: str):
     """
@@ -244,10 +389,11 @@ def cancel_task(task_id: str):
     }
     """
     try:
-        logger.info(f"Cancelling task {task_id}")
+        logger.info("Cancelling task %s", task_id)
         
-        task_manager = TaskManager()
+        task_manager = _get_task_manager()
         cancelled = task_manager.cancel_task(task_id)
+        _status_cache.delete(('task_status', task_id))
         
         if cancelled:
             return jsonify({
@@ -263,7 +409,7 @@ def cancel_task(task_id: str):
             }), 400
         
     except Exception as e:
-        logger.error(f"Unexpected error in cancel_task: {str(e)}")
+        logger.error("Unexpected error in cancel_task: %s", e)
         return create_error_response(TaskError("cancel_task", f"Failed to cancel task: {str(e)}"), 500)
 
 
@@ -288,16 +434,16 @@ def get_active_tasks():
     try:
         logger.debug("Getting active tasks")
         
-        task_manager = TaskManager()
-        active_tasks = task_manager.get_active_tasks()
+        task_manager = _get_task_manager()
         
-        return jsonify({
-            'active_tasks': active_tasks,
-            'count': len(active_tasks)
-        }), 200
+        def build():
+            active_tasks = task_manager.get_active_tasks()
+            return {'active_tasks': active_tasks, 'count': len(active_tasks)}, 200
+        
+        return _cached_json_response('active_tasks', build)
         
     except Exception as e:
-        logger.error(f"Unexpected error in get_active_tasks: {str(e)}")
+        logger.error("Unexpected error in get_active_tasks: %s", e)
         return create_error_response(TaskError("get_active_tasks", f"Failed to get active tasks: {str(e)}"), 500)
 
 
@@ -321,10 +467,13 @@ def get_task_history():
         limit = min(int(request.args.get('limit', 50)), 100)  # Max 100
         task_type = request.args.get('task_type')
         
-        logger.debug(f"Getting task history (limit: {limit}, type: {task_type})")
+        logger.debug("Getting task history (limit: %s, type: %s)", limit, task_type)
         
-        task_manager = TaskManager()
-        history = task_manager.get_task_history(limit=limit, task_type=task_type)
+        task_manager = _get_task_manager()
+        history = _status_cache.get_or_set(
+            ('task_history', limit, task_type),
+            lambda: task_manager.get_task_history(limit=limit, task_type=task_type)
+        )
         
         return jsonify({
             'task_history': history,
@@ -333,7 +482,7 @@ def get_task_history():
         }), 200
         
     except Exception as e:
-        logger.error(f"Unexpected error in get_task_history: {str(e)}")
+        logger.error("Unexpected error in get_task_history: %s", e)
         return create_error_response(TaskError("get_task_history", f"Failed to get task history: {str(e)}"), 500)
 
 
@@ -352,13 +501,13 @@ def get_queue_status():
     try:
         logger.debug("Getting queue status")
         
-        task_manager = TaskManager()
-        status = task_manager.get_queue_status()
-        
-        return jsonify(status), 200
+        task_manager = _get_task_manager()
+        return _cached_json_response(
+            'queue_status', lambda: (task_manager.get_queue_status(), 200)
+        )
         
     except Exception as e:
-        logger.error(f"Unexpected error in get_queue_status: {str(e)}")
+        logger.error("Unexpected error in get_queue_status: %s", e)
         return create_error_response(TaskError("get_queue_status", f"Failed to get queue status: {str(e)}"), 500)
 
 
@@ -378,14 +527,16 @@ def async_health_check():
     try:
         logger.debug("Performing async system health check")
         
-        task_manager = TaskManager()
-        health = task_manager.health_check()
+        task_manager = _get_task_manager()
+        
+        def build():
+            health = task_manager.health_check()
+            return health, 200 if health['status'] == 'healthy' else 503
         
-        status_code = 200 if health['status'] == 'healthy' else 503
-        return jsonify(health), status_code
+        return _cached_json_response('health', build)
         
     except Exception as e:
-        logger.error(f"Unexpected error in async_health_check: {str(e)}")
+        logger.error("Unexpected error in async_health_check: %s", e)
         return jsonify({
             'status': 'unhealthy',
             'error': str(e)
@@ -406,7 +557,7 @@ def schedule_cleanup():
     try:
         logger.info("Scheduling cleanup task")
         
-        task_manager = TaskManager()
+        task_manager = _get_task_manager()
         task_id = task_manager.schedule_cleanup()
         
         return jsonify({
@@ -415,7 +566,7 @@ def schedule_cleanup():
         }), 202
         
     except Exception as e:
-        logger.error(f"Unexpected error in schedule_cleanup: {str(e)}")
+        logger.error("Unexpected error in schedule_cleanup: %s", e)
         return create_error_response(TaskError("schedule_cleanup", f"Failed to schedule cleanup: {str(e)}"), 500)
 
 
@@ -0,0 +1,9 @@
+"""
+WSGI middleware package
+
+Provides middleware that runs ahead of Flask request dispatch.
+"""
+
+from .fast_path import FastPathMiddleware, IS_API_ENVIRON_KEY, is_api_request
+
+__all__ = ['FastPathMiddleware', 'IS_API_ENVIRON_KEY', 'is_api_request']
@@ -0,0 +1,56 @@
+"""
+WSGI fast path ahead of Flask dispatch
+
+Answers the health endpoint with a precomputed body, skipping CORS, request
+hooks and security auditing for load balancer probes, and tags API requests
+in the WSGI environ so later hooks don't re-check the path prefix.
+"""
+
+from typing import Any, Callable, Dict, Iterable
+
+# WSGI environ key set to True for /api/ requests
+IS_API_ENVIRON_KEY = 'contract_analyzer.is_api'
+
+
+class FastPathMiddleware:
+    """Serve a static JSON body for GET/HEAD on the health path"""
+
+    def __init__(self, wsgi_app: Callable, health_path: str, health_body: bytes):
+        """
+        Initialize middleware
+
+        Args:
+            wsgi_app: Wrapped WSGI application
+            health_path: Exact PATH_INFO to answer directly
+            health_body: Precomputed JSON response body
+        """
+        self.wsgi_app = wsgi_app
+        self.health_path = health_path
+        self.health_body = health_body
+        self.health_headers = [
+            ('Content-Type', 'application/json'),
+            ('Content-Length', str(len(health_body)))
+        ]
+
+    def __call__(self, environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        path = environ.get('PATH_INFO', '')
+
+        if path == self.health_path and environ.get('REQUEST_METHOD') in ('GET', 'HEAD'):
+            start_response('200 OK', list(self.health_headers))
+            if environ['REQUEST_METHOD'] == 'HEAD':
+                return [b'']
+            return [self.health_body]
+
+        environ[IS_API_ENVIRON_KEY] = path[:5] == '/api/'
+        return self.wsgi_app(environ, start_response)
+
+
+def is_api_request(environ: Dict[str, Any], path: str) -> bool:
+    """Check whether a request targets the API, using the middleware tag when present"""
+    is_api = environ.get(IS_API_ENVIRON_KEY)
+    if is_api is None:
+        return path.startswith('/api/')
+    return is_api
+
+
+__all__ = ['FastPathMiddleware', 'IS_API_ENVIRON_KEY', 'is_api_request']
@@ -6,7 +6,7 @@ Provides backward compatibility for frontend that expects different endpoint nam
 
 from flask import Blueprint, jsonify, request
 from .analysis import analysis_results_store
-from .contracts import contracts_store
+from .contracts import clear_all_contracts
 from ...config.settings import get_config
 from ...utils.logging.setup import get_logger
 
@@ -41,38 +41,14 @@ def legacy_clear_cache():
 
 @compatibility_bp.route('/clear-contracts', methods=['POST'])
 def legacy_clear_contracts():
-    """Legacy endpoint for clearing contracts"""
-    try:
-        contracts_store.clear()
-        return jsonify({
-            'success': True,
-            'message': 'All contracts cleared successfully'
-        }), 200
-        
-    except Exception as e:
-        logger.error(f"Error in legacy clear contracts endpoint: {e}")
-        return jsonify({
-            'success': False,
-            'error': 'Failed to clear contracts'
-        }), 500
+    """Legacy endpoint for clearing contracts; same as /api/contracts/clear"""
+    return clear_all_contracts()
 
 
 @compatibility_bp.route('/clear-files', methods=['POST'])
 def legacy_clear_files():
-    """Legacy endpoint for clearing all files"""
-    try:
-        contracts_store.clear()
-        return jsonify({
-            'success': True,
-            'message': 'All files cleared successfully'
-        }), 200
-        
-    except Exception as e:
-        logger.error(f"Error in legacy clear files endpoint: {e}")
-        return jsonify({
-            'success': False,
-            'error': 'Failed to clear files'
-        }), 500
+    """Legacy endpoint for clearing all files; same as /api/contracts/clear"""
+    return clear_all_contracts()
 
 
 
@@ -4,16 +4,22 @@ Contract management routes
 Handles contract upload, validation, and file management operations.
 """
 
+import hashlib
+import logging
 import os
-import uuid
-from datetime import datetime
+import secrets
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify, current_app, stream_with_context
 from werkzeug.utils import secure_filename
 
+from ...application.services.dashboard_service import invalidate_dashboard_metrics
 from ...core.models.contract import Contract, validate_contract_file
 from ...utils.security.validators import SecurityValidator
-from ...utils.security.audit import SecurityAuditor, SecurityEventType
+from ...utils.security.audit import SecurityEventType, queue_security_event
 from ...utils.logging.setup import get_logger
 from ...utils.errors.exceptions import ValidationError, NotFoundError, DatabaseError
 from ...utils.errors.validators import ValidationHandler, validate_schema, ContractUploadSchema
@@ -24,96 +30,72 @@ contracts_bp = Blueprint('contracts', __name__)
 
 # Initialize security components
 security_validator = SecurityValidator()
-security_auditor = SecurityAuditor()
 
 # Database repositories
 from ...database.repositories import ContractRepository
 
-# Legacy in-memory store (for migration compatibility)
-contracts_store = {}
+# Stateless; queries run on the request-scoped db.session
+contract_repository = ContractRepository()
 
+# Copy buffer for streaming contract uploads to disk
+UPLOAD_COPY_CHUNK_SIZE = 1024 * 1024
 
-def initialize_contracts_from_uploads():
-    """Load existing contract files from uploads directory into memory store"""
+# Contract listing size; clients can request NDJSON to stream large listings
+DEFAULT_LIST_LIMIT = 100
+MAX_LIST_LIMIT = 10000
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+# Concurrent unlinks when clearing, to overlap slow (e.g. network) filesystem calls
+CLEAR_UNLINK_WORKERS = 16
+# Files unlinked per batch, so clearing holds a bounded number of paths in memory
+CLEAR_UNLINK_BATCH = 256
+
+
+def _safe_unlink(file_path: str) -> int:
+    """Delete a contract file, returning 1 if removed and 0 otherwise"""
     try:
-        upload_dir = Path(current_app.config.get('UPLOAD_FOLDER', 'data/uploads'))
-        if not upload_dir.exists():
-            logger.info("Upload directory does not exist, skipping contract initialization")
-            return
-        
-        loaded_count = 0
-        for file_path in upload_dir.glob('*.docx'):
-            try:
-                # Extract contract info from filename (assuming format: contract_id_timestamp_originalname.docx)
-                filename = file_path.name
-                
-                # Try to extract contract ID from filename
-                # Expected format: Contract_###_Name_Date.docx
-                parts = filename.split('_')
-                if len(parts) >= 2 and parts[0].lower() == 'contract':
-                    contract_id = f"contract_{parts[1]}"
-                else:
-                    # Create a new contract ID based on filename
-                    contract_id = f"contract_{uuid.uuid4().hex[:8]}"
-                
-                # Skip if contract already exists
-                if contract_id in contracts_store:
-                    continue
-                
-                # Get file info
-                file_size = file_path.stat().st_size
-                upload_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-                
-                # Use the actual filename as original filename
-                original_filename = filename
-                
-                # Create contract object
-                contract = Contract(
-                    id=contract_id,
-                    filename=filename,
-                    original_filename=original_filename,
-                    file_path=str(file_path),
-                    file_size=file_size,
-                    upload_timestamp=upload_time,
-                    status="uploaded"
-                )
-                
-                contracts_store[contract_id] = contract
-                loaded_count += 1
-                
-            except Exception as e:
-                logger.warning(f"Failed to load contract from {file_path}: {e}")
-        
-        logger.info(f"Initialized {loaded_count} contracts from uploads directory")
-        
-    except Exception as e:
-        logger.error(f"Error initializing contracts from uploads: {e}")
+        os.unlink(file_path)
+        return 1
+    except FileNotFoundError:
+        return 0
+    except OSError as e:
+        logger.warning(f"Failed to delete contract file {file_path}: {e}")
+        return 0
 
 
-# Initialize contracts when module loads
-def init_contracts_store():
-    """Initialize contracts store with existing files"""
-    from flask import current_app
-    if current_app:
-        initialize_contracts_from_uploads()
+def _stream_contract_summaries(limit: int):
+    """Yield newline-delimited JSON contract summaries"""
+    provider = current_app.json
+    encode = getattr(provider, 'dumps_bytes', None) or (lambda obj: provider.dumps(obj).encode('utf-8'))
+    for contract in contract_repository.iter_recent(limit=limit):
+        yield encode(contract.summary) + b'\n'
 
 
 @contracts_bp.route('/contracts')
 def list_contracts():
     """List all uploaded contracts with metadata"""
     try:
+        limit = min(max(request.args.get('limit', DEFAULT_LIST_LIMIT, type=int), 1), MAX_LIST_LIMIT)
+        
+        # Stream one summary per line when asked, without building the whole listing
+        if request.accept_mimetypes.best_match(('application/json', NDJSON_MIMETYPE)) == NDJSON_MIMETYPE:
+            return current_app.response_class(
+                stream_with_context(_stream_contract_summaries(limit)), mimetype=NDJSON_MIMETYPE
+            )
+        
         # Get contracts from database
-        contract_repository = ContractRepository()
-        contracts = contract_repository.get_recent(limit=100)
+        contracts = contract_repository.get_recent(limit=limit)
         
         # Convert to summary format
-        contracts_list = [contract.get_summary() for contract in contracts]
+        contracts_list = [contract.summary for contract in contracts]
         
-        return jsonify({
+        response = jsonify({
             'success': True,
             'contracts': contracts_list,
             'total': len(contracts_list)
         })
+        response.add_etag()
+        return response.make_conditional(request)
         
     except Exception as e:
         logger.error(f"Error listing contracts: {e}")
@@ -124,10 +106,40 @@ def list_contracts():
 
 
 
+def _save_upload(stream, file_path: Path):
+    """
+    Stream an upload to disk in large chunks, hashing it on the way
+    
+    The file is opened with 'x' so an existing file is never overwritten.
+    Returns the number of bytes written and their SHA-256 hex digest.
+    """
+    hasher = hashlib.sha256()
+    stream.seek(0)
+    with open(file_path, 'xb') as fh:
+        for chunk in iter(lambda: stream.read(UPLOAD_COPY_CHUNK_SIZE), b''):
+            hasher.update(chunk)
+            fh.write(chunk)
+        return fh.tell(), hasher.hexdigest()
+
+
 @contracts_bp.route('/contracts/upload', methods=['POST'])
 def upload_contract():
     """Upload a new contract file"""
     try:
+        # Reject from the headers alone, before the multipart body is parsed and spooled
+        if request.mimetype != 'multipart/form-data':
+            return jsonify({
+                'success': False,
+                'error': 'Expected a multipart/form-data upload'
+            }), 400
+        
+        max_length = current_app.config.get('MAX_CONTENT_LENGTH')
+        if max_length and (request.content_length or 0) > max_length:
+            return jsonify({
+                'success': False,
+                'error': 'File too large'
+            }), 413
+        
         # Validate request data
         request_data = {
             'file': request.files.get('file'),
@@ -145,10 +157,10 @@ def upload_contract():
             max_size=50 * 1024 * 1024  # 50MB
         )
         
-        # Security validation
-        validation_result = security_validator.validate_file_content(file)
+        # Security validation; the content hash is computed while saving instead
+        validation_result = security_validator.validate_file_content(file, hash_content=False)
         if not validation_result.get('validation_passed', False):
-            security_auditor.log_security_event(
+            queue_security_event(
                 event_type=SecurityEventType.FILE_VALIDATION_FAILED,
                 details={'filename': file.filename, 'errors': validation_result.get('errors', [])},
                 severity='MEDIUM',
@@ -162,30 +174,23 @@ def upload_contract():
             }), 400
         
         # Generate unique contract ID
-        contract_id = f"contract_{uuid.uuid4().hex[:8]}"
+        contract_id = f"contract_{secrets.token_hex(4)}"
         
         # Secure filename
         original_filename = file.filename
         secure_name = secure_filename(file.filename)
         
         # Add timestamp to avoid conflicts
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        name_parts = secure_name.rsplit('.', 1)
-        if len(name_parts) == 2:
-            final_filename = f"{contract_id}_{timestamp}_{name_parts[0]}.{name_parts[1]}"
-        else:
-            final_filename = f"{contract_id}_{timestamp}_{secure_name}"
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        stem, extension = os.path.splitext(secure_name)
+        final_filename = f"{contract_id}_{timestamp}_{stem}{extension}"
         
-        # Ensure uploads directory exists
-        upload_dir = Path(current_app.config.get('UPLOAD_FOLDER', 'data/uploads'))
-        upload_dir.mkdir(parents=True, exist_ok=True)
+        # Created at startup by ensure_directories
+        upload_dir = Path(current_app.config['UPLOAD_FOLDER'])
         
         # Save file
         file_path = upload_dir / final_filename
-        file.save(str(file_path))
-        
-        # Get file size
-        file_size = file_path.stat().st_size
+        file_size, file_hash = _save_upload(file.stream, file_path)
         
         # Create contract object
         contract = Contract.create_from_upload(
@@ -197,19 +202,17 @@ def upload_contract():
         )
         
         # Store contract in database
-        contract_repository = ContractRepository()
         contract_repository.create_from_domain(contract)
-        
-        # Also store in memory for legacy compatibility
-        contracts_store[contract_id] = contract
+        invalidate_dashboard_metrics()
         
         # Log successful upload
-        security_auditor.log_security_event(
+        queue_security_event(
             event_type=SecurityEventType.FILE_UPLOAD,
             details={
                 'contract_id': contract_id,
                 'filename': original_filename,
-                'file_size': file_size
+                'file_size': file_size,
+                'file_hash': file_hash
             },
             severity='INFO',
             user_ip=request.remote_addr,
@@ -225,16 +228,16 @@ def upload_contract():
         })
         
     except Exception as e:
-        import traceback
-        error_details = str(e)
-        traceback_details = traceback.format_exc()
+        logger.exception("Error uploading contract: %s", e)
         
-        logger.error(f"Error uploading contract: {e}")
-        logger.error(f"Traceback: {traceback_details}")
+        # logger.exception already records the stack; only copy it into the audit log when debugging
+        error_details = {'error': str(e)}
+        if logger.isEnabledFor(logging.DEBUG):
+            error_details['traceback'] = traceback.format_exc()
         
-        security_auditor.log_security_event(
+        queue_security_event(
             event_type=SecurityEventType.ERROR_OCCURRED,
-            details={'error': str(e), 'traceback': traceback_details},
+            details=error_details,
             severity='HIGH',
             user_ip=request.remote_addr,
             user_agent=request.headers.get('User-Agent')
@@ -254,7 +257,6 @@ def get_contract(contract_id):
         validated_id = ValidationHandler.validate_contract_id(contract_id)
         
         # Get contract from database
-        contract_repository = ContractRepository()
         contract_model = contract_repository.get_by_id(validated_id)
         
         if not contract_model:
@@ -262,7 +264,7 @@ def get_contract(contract_id):
         
         return jsonify({
             'success': True,
-            'contract': contract_model.get_summary()
+            'contract': contract_model.summary
         })
         
     except (ValidationError, NotFoundError):
@@ -280,7 +282,6 @@ def delete_contract(contract_id):
         validated_id = ValidationHandler.validate_contract_id(contract_id)
         
         # Get contract from database
-        contract_repository = ContractRepository()
         contract_model = contract_repository.get_by_id(validated_id)
         
         if not contract_model:
@@ -294,21 +295,19 @@ def delete_contract(contract_id):
         
         # Delete file if it exists
         try:
-            file_path = Path(contract.file_path)
-            if file_path.exists():
-                file_path.unlink()
-                logger.info(f"Deleted contract file: {file_path}")
-        except Exception as e:
+            os.unlink(contract.file_path)
+            logger.info(f"Deleted contract file: {contract.file_path}")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
             logger.warning(f"Failed to delete contract file: {e}")
         
         # Remove from database
         contract_repository.delete(validated_id)
-        
-        # Also remove from legacy in-memory store if present
-        contracts_store.pop(contract_id, None)
+        invalidate_dashboard_metrics()
         
         # Log deletion
-        security_auditor.log_security_event(
+        queue_security_event(
             event_type=SecurityEventType.FILE_UPLOAD,  # Using closest available event type
             details={'contract_id': contract_id, 'filename': contract.original_filename, 'action': 'deleted'},
             severity='INFO',
@@ -333,22 +332,21 @@ def delete_contract(contract_id):
 def validate_contract_endpoint(contract_id):
     """Validate a contract file"""
     try:
-        if contract_id not in contracts_store:
+        contract_model = contract_repository.get_by_id(contract_id)
+        if not contract_model:
             return jsonify({
                 'success': False,
                 'error': 'Contract not found'
             }), 404
         
-        contract = contracts_store[contract_id]
-        
         # Validate file
-        is_valid = validate_contract_file(contract.file_path)
+        is_valid = validate_contract_file(contract_model.file_path)
         
         return jsonify({
             'success': True,
             'contract_id': contract_id,
             'valid': is_valid,
-            'file_path': contract.file_path
+            'file_path': contract_model.file_path
         })
         
     except Exception as e:
@@ -363,25 +361,23 @@ def validate_contract_endpoint(contract_id):
 def clear_all_contracts():
     """Clear all contracts (development/admin function)"""
     try:
+        # Delete all files in parallel, one bounded batch of streamed rows at a time
+        file_paths = (contract_model.file_path for contract_model in contract_repository.iter_all())
         deleted_count = 0
+        with ThreadPoolExecutor(max_workers=CLEAR_UNLINK_WORKERS, thread_name_prefix='contract-clear') as executor:
+            while batch := list(islice(file_paths, CLEAR_UNLINK_BATCH)):
+                deleted_count += sum(executor.map(_safe_unlink, batch))
         
-        # Delete all files and clear store
-        for contract in contracts_store.values():
-            try:
-                file_path = Path(contract.file_path)
-                if file_path.exists():
-                    file_path.unlink()
-                    deleted_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to delete contract file {contract.file_path}: {e}")
-        
-        contracts_store.clear()
+        contract_repository.clear_all_contracts()
+        invalidate_dashboard_metrics()
         
         # Log bulk deletion
-        security_auditor.log_security_event(
-            event_type='contracts_cleared',
+        queue_security_event(
+            event_type=SecurityEventType.CONTRACTS_CLEARED,
             details={'deleted_count': deleted_count},
-            request=request
+            severity='INFO',
+            user_ip=request.remote_addr,
+            user_agent=request.headers.get('User-Agent')
         )
         
         logger.info(f"Cleared {deleted_count} contracts")
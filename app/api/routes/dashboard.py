@@ -6,8 +6,8 @@ to DashboardService following architectural separation of concerns.
 """
 
 import logging
-from flask import Blueprint, request, jsonify
-from marshmallow import Schema, fields, ValidationError
+from flask import Blueprint, request, jsonify, current_app
+from marshmallow import Schema, fields, validate, ValidationError
 
 from ...application.services.dashboard_service import DashboardService, DashboardDataError
 from ...utils.errors.responses import create_error_response
@@ -20,13 +20,28 @@ dashboard_bp = Blueprint('dashboard', __name__, url_prefix='/api/dashboard')
 
 class DashboardRefreshSchema(Schema):
     """Schema for dashboard refresh requests."""
-    refresh_type = fields.Str(missing='full', validate=lambda x: x in ['full', 'metrics', 'results'])
+    refresh_type = fields.Str(missing='full', validate=lambda x: x in _REFRESH_HANDLERS)
     force_refresh = fields.Bool(missing=False)
+    limit = fields.Int(missing=None, allow_none=True, validate=validate.Range(min=1))
 
 
 # Initialize schemas
 dashboard_refresh_schema = DashboardRefreshSchema()
 
+# Shared service instance; DashboardService holds no per-request state
+dashboard_service = DashboardService()
+
+# Refresh type -> handler producing the refreshed payload
+_REFRESH_HANDLERS = {
+    'metrics': lambda service, options: {
+        'metrics': service.get_dashboard_metrics(force_refresh=options['force_refresh'])
+    },
+    'results': lambda service, options: {
+        'analysis_results': service.refresh_analysis_results(limit=options['limit'])
+    },
+    'full': lambda service, options: service.get_dashboard_data(force_refresh=options['force_refresh']),
+}
+
 
 @dashboard_bp.route('/data', methods=['GET'])
 def get_dashboard_data():
@@ -46,19 +61,16 @@ def get_dashboard_data():
     try:
         logger.info("Dashboard data requested")
         
-        # Delegate to application service
-        dashboard_service = DashboardService()
-        dashboard_data = dashboard_service.get_dashboard_data()
+        # Delegate to application service; repeat polls reuse the encoded payload
+        provider = current_app.json
+        encode = getattr(provider, 'dumps_bytes', None) or (lambda obj: provider.dumps(obj).encode('utf-8'))
+        dashboard_json = dashboard_service.get_dashboard_data_json(encode)
         
-        # Format HTTP response
-        response_data = {
-            'success': True,
-            'data': dashboard_data,
-            'message': 'Dashboard data retrieved successfully'
-        }
+        # Format HTTP response around the cached bytes
+        body = b'{"data":' + dashboard_json + b',"message":"Dashboard data retrieved successfully","success":true}\n'
         
-        logger.info(f"Dashboard data returned: {dashboard_data['metrics']['total_analyses']} analyses")
-        return jsonify(response_data), 200
+        logger.info("Dashboard data returned: %d bytes", len(body))
+        return current_app.response_class(body, mimetype='application/json')
         
     except DashboardDataError as e:
         logger.error(f"Dashboard data error: {e}")
@@ -96,27 +108,13 @@ def refresh_dashboard():
     """
     try:
         # Parse and validate HTTP request
-        request_data = dashboard_refresh_schema.load(request.json or {})
+        request_data = dashboard_refresh_schema.load(request.get_json(silent=True) or {})
         refresh_type = request_data['refresh_type']
         
         logger.info(f"Dashboard refresh requested: type={refresh_type}")
         
         # Delegate to application service
-        dashboard_service = DashboardService()
-        
-        if refresh_type == 'metrics':
-            # Metrics-only refresh
-            refreshed_data = {
-                'metrics': dashboard_service.get_dashboard_metrics()
-            }
-        elif refresh_type == 'results':
-            # Results-only refresh  
-            refreshed_data = {
-                'analysis_results': dashboard_service.refresh_analysis_results()
-            }
-        else:
-            # Full refresh (default)
-            refreshed_data = dashboard_service.get_dashboard_data()
+        refreshed_data = _REFRESH_HANDLERS[refresh_type](dashboard_service, request_data)
         
         # Format HTTP response
         response_data = {
@@ -168,7 +166,6 @@ def get_dashboard_metrics():
         logger.debug("Dashboard metrics requested")
         
         # Delegate to application service
-        dashboard_service = DashboardService()
         metrics = dashboard_service.get_dashboard_metrics()
         
         # Format HTTP response
@@ -179,7 +176,11 @@ def get_dashboard_metrics():
         }
         
         logger.debug(f"Dashboard metrics returned: {metrics}")
-        return jsonify(response_data), 200
+        
+        # Polling clients revalidate with If-None-Match and get 304 while metrics are unchanged
+        response = jsonify(response_data)
+        response.add_etag()
+        return response.make_conditional(request)
         
     except DashboardDataError as e:
         logger.error(f"Dashboard metrics error: {e}")
@@ -212,7 +213,6 @@ def dashboard_health_check():
         logger.debug("Dashboard health check requested")
         
         # Test dashboard service availability
-        dashboard_service = DashboardService()
         
         # Perform basic functionality test
         metrics = dashboard_service.get_dashboard_metrics()
@@ -11,19 +11,20 @@ logger = get_logger(__name__)
 health_bp = Blueprint('health', __name__)
 
 
+def get_health_data() -> dict:
+    """Build the basic health check payload"""
+    return {
+        **get_app_info(),
+        'status': 'healthy',
+        'message': 'Application is running'
+    }
+
+
 @health_bp.route('/health')
 def health_check():
     """Basic health check endpoint"""
     try:
-        app_info = get_app_info()
-        
-        health_data = {
-            **app_info,
-            'status': 'healthy',
-            'message': 'Application is running'
-        }
-        
-        return jsonify(health_data), 200
+        return jsonify(get_health_data()), 200
         
     except Exception as e:
         logger.error(f"Health check failed: {e}")
@@ -100,7 +101,7 @@ def cache_stats():
     """Get cache and memory statistics"""
     try:
         from ..routes.analysis import analysis_results_store
-        from ..routes.contracts import contracts_store
+        from ..routes.contracts import contract_repository
         
         return jsonify({
             'success': True,
@@ -109,7 +110,7 @@ def cache_stats():
                 'analysis_size': '0 MB',
                 'reports_count': 0,
                 'reports_size': '0 MB',
-                'memory_count': len(contracts_store),
+                'memory_count': contract_repository.count(),
                 'memory_size': '0 MB',
                 'total_size': '0 MB'
             }
@@ -6,10 +6,15 @@ to PromptManagementService following architectural separation of concerns.
 """
 
 import logging
-from flask import Blueprint, request, jsonify
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Mapping
+from flask import Blueprint, request, jsonify, current_app, stream_with_context
 from marshmallow import Schema, fields, ValidationError
+from werkzeug.exceptions import HTTPException
 
 from ...core.services.prompt_management_service import PromptManagementService, PromptStorageError, ValidationError as PromptValidationError
+from ...utils.cache import TTLCache
 from ...utils.errors.responses import create_error_response
 
 logger = logging.getLogger(__name__)
@@ -18,11 +23,30 @@ logger = logging.getLogger(__name__)
 prompts_bp = Blueprint('prompts', __name__)
 
 # Frontend compatibility mapping for legacy support
-PROMPT_TYPE_MAPPING = {
+PROMPT_TYPE_MAPPING = MappingProxyType({
     'individual_analysis': 'contract_analysis',
     'batch_analysis': 'contract_analysis', 
     'ultra_fast': 'change_classification'
-}
+})
+_LEGACY_PROMPT_TYPES = frozenset(PROMPT_TYPE_MAPPING)
+
+# Static error bodies; jsonify only reads them
+_ERR_PROMPT_NOT_FOUND = {'success': False, 'error': 'Prompt not found'}
+_ERR_SAVE_FAILED = {'success': False, 'error': 'Failed to save prompt'}
+
+# Error label per view for failures handled by handle_unexpected_error
+_UNEXPECTED_ERROR_LABELS = MappingProxyType({
+    'list_prompts': 'Failed to retrieve prompts',
+    'get_prompt': 'Failed to retrieve prompt',
+    'save_prompt': 'Failed to save prompt',
+    'delete_prompt': 'Failed to delete prompt',
+    'validate_prompt': 'Prompt validation failed',
+    'preview_prompt': 'Prompt preview failed',
+    'get_prompt_backups': 'Failed to retrieve backups',
+    'create_backup': 'Backup creation failed',
+    'get_prompt_statistics': 'Failed to retrieve statistics',
+    'get_prompt_bundle': 'Failed to retrieve prompt bundle'
+})
 
 
 class PromptSchema(Schema):
@@ -30,27 +54,79 @@ class PromptSchema(Schema):
     name = fields.Str(required=True)
     description = fields.Str(required=True)
     template = fields.Str(required=True)
-    variables = fields.List(fields.Str(), missing=[])
-
-
-class PromptValidationSchema(Schema):
-    """Schema for prompt validation requests."""
-    template = fields.Str(required=True)
-    variables = fields.List(fields.Str(), missing=[])
+    variables = fields.List(fields.Str(), load_default=list)
 
 
 class PromptPreviewSchema(Schema):
     """Schema for prompt preview requests."""
     template = fields.Str(required=True)
-    prompt_type = fields.Str(missing='')
-    sample_data = fields.Dict(missing={})
+    prompt_type = fields.Str(load_default='')
+    sample_data = fields.Dict(load_default=dict)
 
 
 # Initialize schemas
 prompt_schema = PromptSchema()
-validation_schema = PromptValidationSchema()
 preview_schema = PromptPreviewSchema()
 
+# Shared service instance; PromptManagementService resolves storage paths per call
+prompt_service = PromptManagementService()
+
+# Prompt templates change rarely; GET responses are served from memory until a write
+PROMPT_CACHE_TTL = 60.0
+_prompt_cache = TTLCache(default_ttl=PROMPT_CACHE_TTL, maxsize=256)
+
+
+# Clients can request NDJSON to receive one prompt per line as it is encoded
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+# Loads the independent parts of /prompts/bundle side by side
+_bundle_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='prompt-bundle')
+
+
+def _canonical_prompt_id(prompt_id: str) -> str:
+    """Map legacy frontend prompt ids to current ones; cache keys use the result"""
+    return PROMPT_TYPE_MAPPING[prompt_id] if prompt_id in _LEGACY_PROMPT_TYPES else prompt_id
+
+
+def invalidate_prompt_cache() -> None:
+    """Drop cached prompt reads after prompts or backups change"""
+    _prompt_cache.clear()
+
+
+def warm_prompt_cache() -> None:
+    """Load prompts and statistics into the cache so early requests are hits (needs app context)"""
+    try:
+        _prompt_cache.get_or_set('prompts', prompt_service.list_all_prompts)
+        _prompt_cache.get_or_set('statistics', prompt_service.get_prompt_statistics)
+    except PromptStorageError as e:
+        logger.warning("Prompt cache warmup failed: %s", e)
+
+
+def _stream_prompts(prompts: dict):
+    """Yield newline-delimited JSON prompt templates tagged with their IDs"""
+    provider = current_app.json
+    encode = getattr(provider, 'dumps_bytes', None) or (lambda obj: provider.dumps(obj).encode('utf-8'))
+    for prompt_id, prompt_data in prompts.items():
+        yield encode({'id': prompt_id, **prompt_data}) + b'\n'
+
+
+def _ok(**payload):
+    """JSON 200 response in the standard success envelope"""
+    return jsonify({'success': True, **payload}), 200
+
+
+def _ok_conditional(**payload):
+    """
+    Success response that clients revalidate with If-None-Match.
+    
+    Prompts are editable, so responses are marked no-cache rather than given a
+    max-age; unchanged payloads still come back as an empty 304.
+    """
+    response = jsonify({'success': True, **payload})
+    response.add_etag()
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
 
 @prompts_bp.route('/prompts', methods=['GET'])
 def list_prompts():
@@ -70,30 +146,24 @@ def list_prompts():
         logger.debug("Prompt listing requested")
         
         # Delegate to service
-        prompt_service = PromptManagementService()
-        prompts = prompt_service.list_all_prompts()
-        
-        # Format HTTP response
-        response_data = {
-            'success': True,
-            'prompts': prompts,
-            'count': len(prompts),
-            'message': 'Prompts retrieved successfully'
-        }
-        
-        logger.debug(f"Listed {len(prompts)} prompt templates")
-        return jsonify(response_data), 200
+        prompts = _prompt_cache.get_or_set('prompts', prompt_service.list_all_prompts)
+        
+        # Stream one prompt per line when asked, without encoding the whole catalog first
+        if request.accept_mimetypes.best_match(('application/json', NDJSON_MIMETYPE)) == NDJSON_MIMETYPE:
+            return current_app.response_class(
+                stream_with_context(_stream_prompts(prompts)), mimetype=NDJSON_MIMETYPE
+            )
+        
+        logger.debug("Listed %s prompt templates", len(prompts))
+        return _ok_conditional(
+            prompts=prompts,
+            count=len(prompts),
+            message='Prompts retrieved successfully'
+        )
         
     except PromptStorageError as e:
-        logger.error(f"Prompt storage error in list_prompts: {e}")
+        logger.error("Prompt storage error in list_prompts: %s", e)
         return create_error_response(e, 422)
-    except Exception as e:
-        logger.error(f"Unexpected error in list_prompts: {e}")
-        return jsonify({
-            'success': False,
-            'error': 'Failed to retrieve prompts',
-            'message': 'An unexpected error occurred while loading prompts'
-        }), 500
 
 
 @prompts_bp.route('/prompts/<prompt_id>', methods=['GET'])
@@ -110,41 +180,29 @@ def get_prompt(prompt_id: str):
     AI Context: HTTP adapter for single prompt retrieval. Delegates to service.
     """
     try:
-        logger.debug(f"Prompt requested: {prompt_id}")
+        logger.debug("Prompt requested: %s", prompt_id)
         
         # Apply compatibility mapping for legacy frontend support
-        mapped_prompt_id = PROMPT_TYPE_MAPPING.get(prompt_id, prompt_id)
+        mapped_prompt_id = _canonical_prompt_id(prompt_id)
         
         # Delegate to service
-        prompt_service = PromptManagementService()
-        prompt_data = prompt_service.get_prompt_by_id(mapped_prompt_id)
+        prompt_data = _prompt_cache.get_or_set(
+            ('prompt', mapped_prompt_id),
+            lambda: prompt_service.get_prompt_by_id(mapped_prompt_id)
+        )
         
         if not prompt_data:
-            return jsonify({
-                'success': False,
-                'error': 'Prompt not found'
-            }), 404
-        
-        # Format HTTP response
-        response_data = {
-            'success': True,
-            'prompt': prompt_data,
-            'message': f'Prompt {prompt_id} retrieved successfully'
-        }
+            return jsonify(_ERR_PROMPT_NOT_FOUND), 404
         
-        logger.debug(f"Retrieved prompt: {prompt_id}")
-        return jsonify(response_data), 200
+        logger.debug("Retrieved prompt: %s", prompt_id)
+        return _ok_conditional(
+            prompt=prompt_data,
+            message=f'Prompt {prompt_id} retrieved successfully'
+        )
         
     except PromptStorageError as e:
-        logger.error(f"Prompt storage error in get_prompt: {e}")
+        logger.error("Prompt storage error in get_prompt: %s", e)
         return create_error_response(e, 422)
-    except Exception as e:
-        logger.error(f"Unexpected error in get_prompt: {e}")
-        return jsonify({
-            'success': False,
-            'error': 'Failed to retrieve prompt',
-            'message': f'An unexpected error occurred while loading prompt {prompt_id}'
-        }), 500
 
 
 @prompts_bp.route('/prompts/<prompt_id>', methods=['POST', 'PUT'])
@@ -171,50 +229,36 @@ def save_prompt(prompt_id: str):
     """
     try:
         # Parse and validate HTTP request
-        request_data = prompt_schema.load(request.json or {})
+        request_data = prompt_schema.load(request.get_json(silent=True, cache=False) or {})
         
-        logger.info(f"Saving prompt: {prompt_id}")
+        logger.info("Saving prompt: %s", prompt_id)
         
         # Delegate to service
-        prompt_service = PromptManagementService()
         success = prompt_service.save_prompt(prompt_id, request_data)
+        invalidate_prompt_cache()
         
         if success:
-            response_data = {
-                'success': True,
-                'message': f'Prompt {prompt_id} saved successfully'
-            }
-            return jsonify(response_data), 200
+            return _ok(message=f'Prompt {prompt_id} saved successfully')
         else:
-            return jsonify({
-                'success': False,
-                'error': 'Failed to save prompt'
-            }), 422
+            return jsonify(_ERR_SAVE_FAILED), 422
             
     except ValidationError as e:
-        logger.warning(f"Validation error in save_prompt: {e.messages}")
+        logger.warning("Validation error in save_prompt: %s", e.messages)
         return jsonify({
             'success': False,
             'error': 'Request validation failed',
             'details': e.messages
         }), 400
     except PromptValidationError as e:
-        logger.warning(f"Prompt validation error in save_prompt: {e}")
+        logger.warning("Prompt validation error in save_prompt: %s", e)
         return jsonify({
             'success': False,
             'error': 'Prompt validation failed',
             'details': str(e)
         }), 400
     except PromptStorageError as e:
-        logger.error(f"Prompt storage error in save_prompt: {e}")
+        logger.error("Prompt storage error in save_prompt: %s", e)
         return create_error_response(e, 422)
-    except Exception as e:
-        logger.error(f"Unexpected error in save_prompt: {e}")
-        return jsonify({
-            'success': False,
-            'error': 'Failed to save prompt',
-            'message': f'An unexpected error occurred while saving prompt {prompt_id}'
-        }), 500
 
 
 @prompts_bp.route('/prompts/<prompt_id>', methods=['DELETE'])
@@ -231,41 +275,27 @@ def delete_prompt(prompt_id: str):
     AI Context: HTTP adapter for prompt deletion. Delegates to service.
     """
     try:
-        logger.info(f"Deleting prompt: {prompt_id}")
+        logger.info("Deleting prompt: %s", prompt_id)
         
         # Delegate to service
-        prompt_service = PromptManagementService()
         success = prompt_service.delete_prompt(prompt_id)
+        invalidate_prompt_cache()
         
         if success:
-            response_data = {
-                'success': True,
-                'message': f'Prompt {prompt_id} deleted successfully'
-            }
-            return jsonify(response_data), 200
+            return _ok(message=f'Prompt {prompt_id} deleted successfully')
         else:
-            return jsonify({
-                'success': False,
-                'error': 'Prompt not found'
-            }), 404
+            return jsonify(_ERR_PROMPT_NOT_FOUND), 404
             
     except PromptValidationError as e:
-        logger.warning(f"Validation error in delete_prompt: {e}")
+        logger.warning("Validation error in delete_prompt: %s", e)
         return jsonify({
             'success': False,
             'error': 'Cannot delete system prompt',
             'details': str(e)
         }), 400
     except PromptStorageError as e:
-        logger.error(f"Prompt storage error in delete_prompt: {e}")
+        logger.error("Prompt storage error in delete_prompt: %s", e)
         return create_error_response(e, 422)
-    except Exception as e:
-        logger.error(f"Unexpected error in delete_prompt: {e}")
-        return jsonify({
-            'success': False,
-            'error': 'Failed to delete prompt',
-            'message': f'An unexpected error occurred while deleting prompt {prompt_id}'
-        }), 500
 
 
 @prompts_bp.route('/prompts/validate', methods=['POST'])
@@ -285,41 +315,43 @@ def validate_prompt():
     AI Context: HTTP adapter for prompt validation. Delegates to service.
     """
     try:
-        # Parse and validate HTTP request
-        request_data = validation_schema.load(request.json or {})
+        # Check request shape only; the service validates the template itself
+        body = request.get_json(silent=True, cache=False)
+        if not isinstance(body, dict):
+            body = {}
+        template = body.get('template')
+        variables = body.get('variables', [])
+        
+        errors = {}
+        if template is None:
+            errors['template'] = ['Missing data for required field.']
+        elif not isinstance(template, str):
+            errors['template'] = ['Not a valid string.']
+        if not isinstance(variables, list) or not all(isinstance(v, str) for v in variables):
+            errors['variables'] = ['Not a valid list of strings.']
+        if errors:
+            raise ValidationError(errors)
         
         logger.debug("Prompt validation requested")
         
         # Delegate to service
-        prompt_service = PromptManagementService()
         validation_result = prompt_service.validate_prompt_template(
-            template=request_data['template'],
-            variables=request_data['variables']
+            template=template,
+            variables=variables
         )
         
-        # Format HTTP response
-        response_data = {
-            'success': True,
-            'validation': validation_result,
-            'message': 'Prompt validation completed'
-        }
-        
-        return jsonify(response_data), 200
+        return _ok(
+            validation=validation_result,
+            message='Prompt validation completed'
+        )
         
     except ValidationError as e:
-        logger.warning(f"Request validation error in validate_prompt: {e.messages}")
+        logger.warning("Request validation error in validate_prompt: %s", e.messages)
         return jsonify({
             'success': False,
             'error': 'Request validation failed',
             'details': e.messages
         }), 400
-    except Exception as e:
-        logger.error(f"Unexpected error in validate_prompt: {e}")
-        return jsonify({
-            'success': False,
-            'error': 'Prompt validation failed',
-            'message': f'An unexpected error occurred during validation: {str(e)}'
-        }), 500
 
 
 @prompts_bp.route('/prompts/preview', methods=['POST'])
@@ -344,46 +376,34 @@ def preview_prompt():
     """
     try:
         # Parse and validate HTTP request
-        request_data = preview_schema.load(request.json or {})
+        request_data = preview_schema.load(request.get_json(silent=True, cache=False) or {})
         
         logger.debug("Prompt preview requested")
         
         # Generate sample data if not provided
         sample_data = request_data.get('sample_data', {})
         if not sample_data:
-            sample_data = _get_sample_data_for_type(request_data.get('prompt_type', ''))
+            sample_data = dict(_get_sample_data_for_type(request_data.get('prompt_type', '')))
         
         # Delegate to service
-        prompt_service = PromptManagementService()
         preview_result = prompt_service.preview_prompt(
             template=request_data['template'],
             sample_data=sample_data
         )
         
-        # Format HTTP response
-        response_data = {
-            'success': True,
-            'preview': preview_result,
-            'sample_data_used': sample_data,
-            'message': 'Prompt preview generated successfully'
-        }
-        
-        return jsonify(response_data), 200
+        return _ok(
+            preview=preview_result,
+            sample_data_used=sample_data,
+            message='Prompt preview generated successfully'
+        )
         
     except ValidationError as e:
-        logger.warning(f"Request validation error in preview_prompt: {e.messages}")
+        logger.warning("Request validation error in preview_prompt: %s", e.messages)
         return jsonify({
             'success': False,
             'error': 'Request validation failed',
             'details': e.messages
         }), 400
-    except Exception as e:
-        logger.error(f"Unexpected error in preview_prompt: {e}")
-        return jsonify({
-            'success': False,
-            'error': 'Prompt preview failed',
-            'message': f'An unexpected error occurred during preview: {str(e)}'
-        }), 500
 
 
 @prompts_bp.route('/prompts/backups/<prompt_id>', methods=['GET'])
@@ -397,33 +417,22 @@ def get_prompt_backups(prompt_id: str):
     Returns:
         JSON response with backup list
     """
-    try:
-        logger.debug(f"Prompt backups requested for: {prompt_id}")
-        
-        # Apply compatibility mapping for legacy frontend support
-        mapped_prompt_id = PROMPT_TYPE_MAPPING.get(prompt_id, prompt_id)
-        
-        # Delegate to service
-        prompt_service = PromptManagementService()
-        backups = prompt_service.list_prompt_backups(mapped_prompt_id)
-        
-        response_data = {
-            'success': True,
-            'backups': backups,
-            'prompt_id': prompt_id,
-            'message': f'Backups for {prompt_id} retrieved successfully'
-        }
-        
-        return jsonify(response_data), 200
-        
-    except Exception as e:
-        logger.error(f"Unexpected error in get_prompt_backups: {e}")
-        return jsonify({
-            'success': False,
-            'error': 'Failed to retrieve backups',
-            'backups': [],
-            'message': f'An unexpected error occurred: {str(e)}'
-        }), 500
+    logger.debug("Prompt backups requested for: %s", prompt_id)
+    
+    # Apply compatibility mapping for legacy frontend support
+    mapped_prompt_id = _canonical_prompt_id(prompt_id)
+    
+    # Delegate to service
+    backups = _prompt_cache.get_or_set(
+        ('backups', mapped_prompt_id),
+        lambda: prompt_service.list_prompt_backups(mapped_prompt_id)
+    )
+    
+    return _ok_conditional(
+        backups=backups,
+        prompt_id=prompt_id,
+        message=f'Backups for {prompt_id} retrieved successfully'
+    )
 
 
 @prompts_bp.route('/prompts/backup', methods=['POST'])
@@ -442,112 +451,101 @@ def create_backup():
     AI Context: HTTP adapter for prompt backup creation. Delegates to service.
     """
     try:
-        request_data = request.get_json() or {}
+        request_data = request.get_json(silent=True, cache=False) or {}
         backup_name = request_data.get('backup_name')
         
-        logger.info(f"Prompt backup requested: {backup_name or 'auto-generated name'}")
+        logger.info("Prompt backup requested: %s", backup_name or 'auto-generated name')
         
         # Delegate to service
-        prompt_service = PromptManagementService()
         backup_path = prompt_service.create_backup(backup_name)
+        invalidate_prompt_cache()
         
-        # Format HTTP response
-        response_data = {
-            'success': True,
-            'backup_path': backup_path,
-            'message': 'Prompt backup created successfully'
-        }
-        
-        return jsonify(response_data), 200
+        return _ok(
+            backup_path=backup_path,
+            message='Prompt backup created successfully'
+        )
         
     except PromptStorageError as e:
-        logger.error(f"Backup creation error: {e}")
+        logger.error("Backup creation error: %s", e)
         return create_error_response(e, 422)
-    except Exception as e:
-        logger.error(f"Unexpected error in create_backup: {e}")
-        return jsonify({
-            'success': False,
-            'error': 'Backup creation failed',
-            'message': f'An unexpected error occurred during backup: {str(e)}'
-        }), 500
 
 
+@prompts_bp.route('/prompts/statistics', methods=['GET'])
 @prompts_bp.route('/prompts/stats', methods=['GET'])
-def get_prompt_stats():
+def get_prompt_statistics():
     """
-    Get prompt statistics (alias for statistics endpoint).
+    Get prompt usage and management statistics (also served at /prompts/stats).
     
     Returns:
         JSON response with prompt statistics
+    
+    AI Context: HTTP adapter for prompt statistics. Delegates to service.
     """
-    return get_prompt_statistics()
+    logger.debug("Prompt statistics requested")
+    
+    # Delegate to service
+    stats = _prompt_cache.get_or_set('statistics', prompt_service.get_prompt_statistics)
+    
+    return _ok_conditional(
+        statistics=stats,
+        message='Prompt statistics retrieved successfully'
+    )
+    
 
 
-@prompts_bp.route('/prompts/statistics', methods=['GET'])
-def get_prompt_statistics():
+def _load_cached(app, key, factory):
+    """Read through the prompt cache inside app's context (for executor threads)"""
+    with app.app_context():
+        return _prompt_cache.get_or_set(key, factory)
+
+
+@prompts_bp.route('/prompts/bundle', methods=['GET'])
+def get_prompt_bundle():
     """
-    Get prompt usage and management statistics.
+    Get prompt templates and statistics in one response.
     
     Returns:
-        JSON response with prompt statistics
+        JSON response with prompts, count and statistics
     
-    AI Context: HTTP adapter for prompt statistics. Delegates to service.
+    AI Context: Page-load endpoint combining /prompts and /prompts/statistics.
+    Both parts are loaded concurrently through the shared prompt cache.
     """
     try:
-        logger.debug("Prompt statistics requested")
-        
-        # Delegate to service
-        prompt_service = PromptManagementService()
-        stats = prompt_service.get_prompt_statistics()
-        
-        # Format HTTP response
-        response_data = {
-            'success': True,
-            'statistics': stats,
-            'message': 'Prompt statistics retrieved successfully'
-        }
-        
-        return jsonify(response_data), 200
+        logger.debug("Prompt bundle requested")
+        
+        app = current_app._get_current_object()
+        prompts_future = _bundle_executor.submit(_load_cached, app, 'prompts', prompt_service.list_all_prompts)
+        stats_future = _bundle_executor.submit(_load_cached, app, 'statistics', prompt_service.get_prompt_statistics)
+        prompts = prompts_future.result()
+        stats = stats_future.result()
+        
+        return _ok_conditional(
+            prompts=prompts,
+            count=len(prompts),
+            statistics=stats,
+            message='Prompt bundle retrieved successfully'
+        )
         
-    except Exception as e:
-        logger.error(f"Unexpected error in get_prompt_statistics: {e}")
-        return jsonify({
-            'success': False,
-            'error': 'Failed to retrieve statistics',
-            'message': f'An unexpected error occurred: {str(e)}'
-        }), 500
+    except PromptStorageError as e:
+        logger.error("Prompt storage error in get_prompt_bundle: %s", e)
+        return create_error_response(e, 422)
 
 
-def _get_sample_data_for_type(prompt_type: str) -> dict:
-    """
-    Generate sample data for different prompt types.
-    
-    Args:
-        prompt_type: Type of prompt for sample data generation
-    
-    Returns:
-        dict: Sample data appropriate for the prompt type
-    
-    AI Context: Helper function that provides realistic sample data for prompt
-    previews. Maps legacy frontend types to current prompt types.
-    """
-    # Map frontend types to backend types for compatibility
-    mapped_type = PROMPT_TYPE_MAPPING.get(prompt_type, prompt_type)
-    
-    sample_data_map = {
-        'contract_analysis': {
-            'template_text': 'SAMPLE TEMPLATE: This is the original contract template with standard payment terms of 30 days, liability cap of $50,000, and standard termination clauses...',
-            'contract_text': 'SAMPLE CONTRACT: This is the modified contract with updated payment terms of 45 days, increased liability cap of $100,000, and revised termination notice period...',
-            'changes_summary': '''DETECTED CHANGES:
+# Preview sample values per prompt type; read-only so requests can share them
+_SAMPLE_DATA_BY_TYPE = MappingProxyType({
+    'contract_analysis': MappingProxyType({
+        'template_text': 'SAMPLE TEMPLATE: This is the original contract template with standard payment terms of 30 days, liability cap of $50,000, and standard termination clauses...',
+        'contract_text': 'SAMPLE CONTRACT: This is the modified contract with updated payment terms of 45 days, increased liability cap of $100,000, and revised termination notice period...',
+        'changes_summary': '''DETECTED CHANGES:
 1. Payment terms changed from "30 days" to "45 days"
 2. Liability cap increased from "$50,000" to "$100,000"
 3. Termination notice period extended from "30 days" to "60 days"'''
-        },
-        'risk_assessment': {
-            'critical_count': '2',
-            'significant_count': '3',
-            'inconsequential_count': '5',
-            'changes_detail': '''Critical Changes:
+    }),
+    'risk_assessment': MappingProxyType({
+        'critical_count': '2',
+        'significant_count': '3',
+        'inconsequential_count': '5',
+        'changes_detail': '''Critical Changes:
 1. Payment terms modification (30 → 45 days)
 2. Liability cap increase ($50K → $100K)
 
@@ -555,19 +553,46 @@ Significant Changes:
 1. Termination notice extension (30 → 60 days)
 2. Service level agreement updates
 3. Compliance requirement additions'''
-        },
-        'change_classification': {
-            'original_text': 'Payment due within 30 days of invoice date',
-            'modified_text': 'Payment due within 45 days of invoice date',
-            'context': 'Payment terms section of service agreement'
-        }
+    }),
+    'change_classification': MappingProxyType({
+        'original_text': 'Payment due within 30 days of invoice date',
+        'modified_text': 'Payment due within 45 days of invoice date',
+        'context': 'Payment terms section of service agreement'
+    })
+})
+
+_DEFAULT_SAMPLE_DATA = MappingProxyType({
+    'template_text': 'Sample template content',
+    'contract_text': 'Sample contract content',
+    'changes_summary': 'Sample changes detected'
+})
+
+# Legacy frontend types resolved up front, so a lookup is a single probe
+_SAMPLE_DATA_LOOKUP = MappingProxyType({
+    **_SAMPLE_DATA_BY_TYPE,
+    **{
+        legacy_type: _SAMPLE_DATA_BY_TYPE[prompt_type]
+        for legacy_type, prompt_type in PROMPT_TYPE_MAPPING.items()
+        if prompt_type in _SAMPLE_DATA_BY_TYPE
     }
+})
+
+
+def _get_sample_data_for_type(prompt_type: str) -> Mapping[str, str]:
+    """
+    Get sample data for different prompt types.
     
-    return sample_data_map.get(mapped_type, {
-        'template_text': 'Sample template content',
-        'contract_text': 'Sample contract content',
-        'changes_summary': 'Sample changes detected'
-    })
+    Args:
+        prompt_type: Type of prompt for sample data generation
+    
+    Returns:
+        Mapping[str, str]: Read-only sample data appropriate for the prompt type
+    
+    AI Context: Helper function that provides realistic sample data for prompt
+    previews. Maps legacy frontend types to current prompt types. The result is
+    shared module state; copy it before serializing or modifying.
+    """
+    return _SAMPLE_DATA_LOOKUP.get(prompt_type, _DEFAULT_SAMPLE_DATA)
 
 
 # Register error handlers for prompts blueprint
@@ -585,4 +610,19 @@ def handle_validation_error(error):
         'error': 'Request validation failed',
         'details': error.messages
     }
-    return jsonify(error_response), 400
\ No newline at end of file
+    return jsonify(error_response), 400
+
+
+@prompts_bp.errorhandler(Exception)
+def handle_unexpected_error(error):
+    """Handle errors prompt routes do not map to a specific response."""
+    if isinstance(error, HTTPException):
+        return error
+    
+    view = (request.endpoint or '').rpartition('.')[2]
+    logger.error("Unexpected error in %s: %s", view or 'prompts', error)
+    return jsonify({
+        'success': False,
+        'error': _UNEXPECTED_ERROR_LABELS.get(view, 'Prompt request failed'),
+        'message': 'An unexpected error occurred'
+    }), 500
\ No newline at end of file
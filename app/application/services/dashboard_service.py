@@ -5,15 +5,237 @@ Handles dashboard data aggregation and business logic coordination.
 Following architectural standards: business logic separated from HTTP concerns.
 """
 
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from typing import Callable, Dict, Hashable, Iterator, List, Any, Mapping, Optional, Tuple
+from bisect import bisect_left, insort
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache, partial
+from itertools import islice
 import logging
+import re
+import threading
+import time
+
+from flask import current_app, has_app_context
 
 from ...core.services.analyzer import ContractAnalyzer
 from ...database.models.analysis_result import AnalysisResultModel
+from ...database.repositories import ContractRepository
+from ...utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Status substrings marking an analysis result as awaiting review
+PENDING_REVIEW_STATUSES = ('MEDIUM RISK', 'HIGH RISK', 'NEEDS REVIEW')
+_PENDING_REVIEW_RE = re.compile('|'.join(map(re.escape, PENDING_REVIEW_STATUSES)), re.IGNORECASE)
+
+# Analyses newer than this many days count as recent
+RECENT_ANALYSIS_DAYS = 7
+
+# Metrics are polled by the UI and health checks; bursts within the TTL share one calculation.
+# Entries are keyed by analysis store version, so new analyses miss immediately.
+METRICS_CACHE_TTL = 2.0
+_metrics_cache = TTLCache(default_ttl=METRICS_CACHE_TTL, maxsize=1)
+
+# Full dashboard payloads keyed by analysis store version, so new analyses miss immediately
+DASHBOARD_CACHE_TTL = 5.0
+_dashboard_cache = TTLCache(default_ttl=DASHBOARD_CACHE_TTL, maxsize=4)
+
+
+@dataclass
+class AnalysisResultView:
+    """
+    Dashboard row for one stored analysis result.
+    
+    Rows are built for every stored result on each aggregation, so they use
+    __slots__ instead of a per-row dict. JSON providers serialize dataclasses
+    directly.
+    """
+    __slots__ = ('id', 'contract', 'template', 'similarity', 'status', 'date', 'reviewer', 'changes_count')
+    
+    id: str
+    contract: str
+    template: str
+    similarity: float
+    status: str
+    date: str
+    reviewer: str
+    changes_count: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return asdict(self)
+
+
+class DashboardCounters:
+    """
+    Pre-aggregated analysis counts and date order kept in step with the analysis results store.
+    
+    Purpose: Lets dashboard metrics read totals, pending reviews and recent
+    analyses in O(1) instead of scanning every stored result per request,
+    and lets result listings walk keys newest first without sorting.
+    The store records and discards entries as it is mutated.
+    """
+    
+    def __init__(self):
+        """Initialize empty counters."""
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self) -> None:
+        """Forget every recorded result."""
+        with self._lock:
+            # Per-key contribution (pending, day ordinal, date) so replacements and removals can be undone
+            self._entries: Dict[Hashable, Tuple[bool, Optional[int], str]] = {}
+            self._by_day: Counter = Counter()
+            # (date, key) pairs in ascending date order
+            self._order: List[Tuple[str, Hashable]] = []
+            self.pending = 0
+    
+    @property
+    def total(self) -> int:
+        """Number of recorded results."""
+        return len(self._entries)
+    
+    def record(self, key: Hashable, result: Any) -> None:
+        """Count a stored result, replacing any previous result under key."""
+        entry = _counted_fields(result)
+        with self._lock:
+            self._forget(key)
+            self._entries[key] = entry
+            pending, day, result_date = entry
+            self.pending += pending
+            if day is not None:
+                self._by_day[day] += 1
+            insort(self._order, (result_date, key))
+    
+    def discard(self, key: Hashable) -> None:
+        """Stop counting the result stored under key, if any."""
+        with self._lock:
+            self._forget(key)
+    
+    def recent_sum(self, days: int = RECENT_ANALYSIS_DAYS) -> int:
+        """Number of results dated within the last days, counted by calendar day."""
+        cutoff = (date.today() - timedelta(days=days)).toordinal()
+        with self._lock:
+            return sum(count for day, count in self._by_day.items() if day >= cutoff)
+    
+    def newest_keys(self) -> List[Hashable]:
+        """Keys of recorded results, most recent date first."""
+        with self._lock:
+            return [key for _, key in reversed(self._order)]
+    
+    def _forget(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        pending, day, result_date = entry
+        self.pending -= pending
+        if day is not None:
+            self._by_day[day] -= 1
+            if not self._by_day[day]:
+                del self._by_day[day]
+        del self._order[bisect_left(self._order, (result_date, key))]
+
+
+def _counted_fields(result: Any) -> Tuple[bool, Optional[int], str]:
+    """Pending-review flag, day ordinal and ISO date of a stored analysis result."""
+    if not isinstance(result, Mapping):
+        return False, None, ''
+    
+    pending = _PENDING_REVIEW_RE.search(str(result.get('status', ''))) is not None
+    
+    # Undated results are formatted with the current time, so they order and count as now
+    result_date = result.get('date')
+    if result_date is None:
+        return pending, date.today().toordinal(), datetime.now().isoformat()
+    result_date = str(result_date)
+    
+    # Prefer the epoch timestamp stored at ingestion over parsing the ISO date
+    date_ts = result.get('date_ts')
+    if date_ts is not None:
+        return pending, date.fromtimestamp(date_ts).toordinal(), result_date
+    try:
+        return pending, datetime.fromisoformat(result_date).toordinal(), result_date
+    except (ValueError, TypeError):
+        return pending, None, result_date
+
+
+# Shared counters updated by the analysis results store
+analysis_counters = DashboardCounters()
+
+
+# Templates are handled in the contracts route, not a separate templates route.
+# Mock data until a proper templates repository is implemented; the entries are
+# shared between payloads, so they must not be mutated.
+_TEMPLATES_SUMMARY = (
+    {
+        'id': 'TYPE_SOW_Standard_v1',
+        'filename': 'TYPE_SOW_Standard_v1.docx',
+        'display_name': 'Standard SOW Template v1',
+        'type': 'SOW'
+    },
+    {
+        'id': 'TYPE_CHANGEORDER_Standard_v1',
+        'filename': 'TYPE_CHANGEORDER_Standard_v1.docx',
+        'display_name': 'Standard Change Order Template v1',
+        'type': 'CHANGEORDER'
+    },
+)
+
+# Dashboard sources are independent, so they are fetched concurrently
+_fetch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='dashboard-fetch')
+
+# Health probes run in the background once the last snapshot is this old
+HEALTH_REFRESH_INTERVAL = 10.0
+
+
+def _current_app_or_none() -> Any:
+    """The active Flask app for handing to executor threads, or None outside an app context"""
+    return current_app._get_current_object() if has_app_context() else None
+
+
+def _call_in_app_context(app: Any, fetch: Callable[[], Any]) -> Any:
+    """Run fetch inside app's context (for executor threads), or directly without an app"""
+    if app is None:
+        return fetch()
+    with app.app_context():
+        return fetch()
+
+
+def invalidate_dashboard_metrics() -> None:
+    """Drop cached metrics and dashboard data so the next request recalculates them"""
+    _metrics_cache.clear()
+    _dashboard_cache.clear()
+
+
+@lru_cache(maxsize=1)
+def _analysis_routes() -> Any:
+    """Analysis routes module owning the results store, imported once on first use"""
+    # Imported lazily: the analysis routes import this module for the shared counters
+    from ...api.routes import analysis
+    return analysis
+
+
+@lru_cache(maxsize=1)
+def _templates_store() -> Mapping:
+    """Templates store, or an empty mapping when no templates route provides one"""
+    try:
+        from ...api.routes.templates import templates_store
+        return templates_store
+    except ImportError:
+        return {}
+
+
+def _analysis_store_version() -> int:
+    """Mutation count of the analysis results store, or 0 if it is unavailable"""
+    try:
+        return _analysis_routes().analysis_results_store.version
+    except ImportError:
+        return 0
+
 
 class DashboardService:
     """
@@ -30,13 +252,24 @@ class DashboardService:
     def __init__(self):
         """Initialize dashboard service with required dependencies."""
         self.analyzer = None  # Will be injected via dependency injection
+        self.contract_repository = ContractRepository()
+        self.counters = analysis_counters
+        self._health_lock = threading.Lock()
+        self._last_health = self._probe_system_health()
+        self._health_checked_at = time.monotonic()
+        self._health_refresh_pending = False
     
-    def get_dashboard_data(self) -> Dict[str, Any]:
+    def get_dashboard_data(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Aggregates all dashboard data from multiple sources.
         
         Purpose: Provides complete dashboard state in a single operation,
         reducing multiple HTTP requests and ensuring data consistency.
+        Results are cached for DASHBOARD_CACHE_TTL seconds or until the
+        analysis results store changes.
+        
+        Args:
+            force_refresh: Re-aggregate instead of using cached data
         
         Returns:
             Dict[str, Any]: Dashboard data containing:
@@ -53,14 +286,52 @@ class DashboardService:
         incorrect data, start debugging here. Validates data consistency
         across all sources before returning.
         """
+        if force_refresh:
+            invalidate_dashboard_metrics()
+        key = ('data', _analysis_store_version())
+        return dict(_dashboard_cache.get_or_set(key, self._aggregate_dashboard_data))
+    
+    def get_dashboard_data_json(self, encode: Callable[[Any], bytes],
+                                force_refresh: bool = False) -> bytes:
+        """
+        Returns dashboard data already serialized to JSON bytes.
+        
+        Purpose: Lets polling endpoints serve repeat requests without
+        re-encoding the payload. Bytes are cached under the same TTL and
+        invalidation as get_dashboard_data.
+        
+        Args:
+            encode: Serializer producing JSON bytes, e.g. the app's JSON provider
+            force_refresh: Re-aggregate instead of using cached data
+        
+        Returns:
+            bytes: JSON encoding of the dashboard data
+        """
+        if force_refresh:
+            invalidate_dashboard_metrics()
+        key = ('json', _analysis_store_version())
+        return _dashboard_cache.get_or_set(key, lambda: encode(self._aggregate_dashboard_data()))
+    
+    def _aggregate_dashboard_data(self) -> Dict[str, Any]:
+        """Builds the dashboard payload from all data sources."""
         try:
             logger.info("Aggregating dashboard data from all sources")
             
-            # Gather data from various sources
-            analysis_results = self._get_analysis_results()
-            contracts = self._get_contracts_summary()
-            templates = self._get_templates_summary()
-            system_status = self._get_system_health()
+            # One timestamp serves as last_updated and as the fallback for undated records
+            now_iso = datetime.now().isoformat()
+            
+            # Gather data from various sources concurrently
+            app = _current_app_or_none()
+            futures = [
+                _fetch_executor.submit(_call_in_app_context, app, fetch)
+                for fetch in (
+                    partial(self._get_analysis_results, now_iso=now_iso),
+                    partial(self._get_contracts_summary, now_iso=now_iso),
+                    self._get_templates_summary,
+                    self._get_system_health,
+                )
+            ]
+            analysis_results, contracts, templates, system_status = [future.result() for future in futures]
             
             # Calculate metrics
             metrics = self._calculate_metrics(
@@ -75,7 +346,7 @@ class DashboardService:
                 'contracts': contracts,
                 'templates': templates,
                 'system_status': system_status,
-                'last_updated': datetime.now().isoformat()
+                'last_updated': now_iso
             }
             
             logger.info(f"Dashboard data aggregated successfully: {len(analysis_results)} results, {metrics['total_contracts']} contracts")
@@ -85,15 +356,18 @@ class DashboardService:
             logger.error(f"Failed to aggregate dashboard data: {e}")
             raise DashboardDataError(f"Dashboard data aggregation failed: {str(e)}")
     
-    def refresh_analysis_results(self) -> List[Dict[str, Any]]:
+    def refresh_analysis_results(self, limit: Optional[int] = None) -> List[AnalysisResultView]:
         """
         Refreshes and returns current analysis results.
         
         Purpose: Provides fresh analysis results data for dashboard refresh
         operations without full page reload.
         
+        Args:
+            limit: Return only the most recent results, all if None
+        
         Returns:
-            List[Dict[str, Any]]: Current analysis results with metadata
+            List[AnalysisResultView]: Current analysis results with metadata
         
         AI Context: Used by refresh operations. If dashboard refresh fails,
         this function should be checked first for data retrieval issues.
@@ -101,7 +375,7 @@ class DashboardService:
         try:
             logger.info("Refreshing analysis results data")
             
-            analysis_results = self._get_analysis_results()
+            analysis_results = self._get_analysis_results(limit=limit)
             
             logger.info(f"Analysis results refreshed: {len(analysis_results)} results")
             return analysis_results
@@ -110,12 +384,16 @@ class DashboardService:
             logger.error(f"Failed to refresh analysis results: {e}")
             raise DashboardDataError(f"Analysis results refresh failed: {str(e)}")
     
-    def get_dashboard_metrics(self) -> Dict[str, Any]:
+    def get_dashboard_metrics(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Calculates and returns dashboard metrics only.
         
         Purpose: Provides lightweight metrics calculation for frequent updates
-        without retrieving full analysis result details.
+        without retrieving full analysis result details. Results are cached for
+        METRICS_CACHE_TTL seconds or until the analysis results store changes.
+        
+        Args:
+            force_refresh: Recalculate instead of using cached metrics
         
         Returns:
             Dict[str, Any]: Metrics containing counts and summary statistics
@@ -123,20 +401,23 @@ class DashboardService:
         AI Context: Used for metric-only updates. Optimized for performance
         when only counts are needed without full data.
         """
+        if force_refresh:
+            invalidate_dashboard_metrics()
+        key = ('metrics', _analysis_store_version())
+        return dict(_metrics_cache.get_or_set(key, self._compute_dashboard_metrics))
+    
+    def _compute_dashboard_metrics(self) -> Dict[str, Any]:
+        """Calculates dashboard metrics from current contracts and analysis results."""
         try:
             logger.debug("Calculating dashboard metrics")
             
-            # Get summary data for metrics calculation
-            analysis_results = self._get_analysis_results()
-            contracts_count = self._get_contracts_count()
-            templates_count = self._get_templates_count()
-            
+            # Analysis counts are pre-aggregated as the results store changes
             metrics = {
-                'total_contracts': contracts_count,
-                'total_templates': templates_count, 
-                'total_analyses': len(analysis_results),
-                'pending_reviews': self._count_pending_reviews(analysis_results),
-                'recent_analyses': self._count_recent_analyses(analysis_results)
+                'total_contracts': self._get_contracts_count(),
+                'total_templates': self._get_templates_count(), 
+                'total_analyses': self.counters.total,
+                'pending_reviews': self._count_pending_reviews(),
+                'recent_analyses': self._count_recent_analyses()
             }
             
             logger.debug(f"Dashboard metrics calculated: {metrics}")
@@ -146,82 +427,88 @@ class DashboardService:
             logger.error(f"Failed to calculate dashboard metrics: {e}")
             raise DashboardDataError(f"Metrics calculation failed: {str(e)}")
     
-    def _get_analysis_results(self) -> List[Dict[str, Any]]:
+    def _get_analysis_results(self, limit: Optional[int] = None,
+                              now_iso: Optional[str] = None) -> List[AnalysisResultView]:
         """
-        Retrieves current analysis results from data store.
+        Retrieves current analysis results from data store, most recent first.
+        
+        Args:
+            limit: Return only the most recent results, all if None
+            now_iso: Date given to undated results, the current time if None
         
         Returns:
-            List[Dict[str, Any]]: Analysis results with required fields
+            List[AnalysisResultView]: Analysis results with required fields
         
         AI Context: Internal data retrieval method. Mock implementation
         should be replaced with actual repository pattern.
         """
+        # The counters keep keys in date order, so the newest rows are a prefix
+        return list(islice(self._iter_analysis_results(now_iso), limit))
+    
+    def _iter_analysis_results(self, now_iso: Optional[str] = None) -> Iterator[AnalysisResultView]:
+        """
+        Yields formatted analysis results from data store, most recent first.
+        
+        Args:
+            now_iso: Date given to undated results, the current time if None
+        
+        Yields:
+            AnalysisResultView: Analysis result with required fields
+        """
         # TODO: Replace with actual repository implementation
         # This is a placeholder that should be refactored to use
         # proper repository pattern with dependency injection
         
+        if now_iso is None:
+            now_iso = datetime.now().isoformat()
+        
         try:
-            # Import here to avoid circular dependencies during refactor
-            from ...api.routes.analysis import analysis_results_store
-            
-            results = []
-            for result_id, result_data in analysis_results_store.items():
-                formatted_result = {
-                    'id': result_id,
-                    'contract': result_data.get('contract', 'Unknown Contract'),
-                    'template': result_data.get('template', 'Unknown Template'),
-                    'similarity': result_data.get('similarity', 0),
-                    'status': result_data.get('status', 'Unknown'),
-                    'date': result_data.get('date', datetime.now().isoformat()),
-                    'reviewer': result_data.get('reviewer', 'System'),
-                    'changes_count': len(result_data.get('changes', []))
-                }
-                results.append(formatted_result)
-            
-            # Sort by date, most recent first
-            results.sort(key=lambda x: x['date'], reverse=True)
-            
-            return results
+            store = _analysis_routes().analysis_results_store
+            for result_id in self.counters.newest_keys():
+                result_data = store.get(result_id)
+                if result_data is None:
+                    # Removed since the key list was taken
+                    continue
+                yield AnalysisResultView(
+                    id=result_id,
+                    contract=result_data.get('contract', 'Unknown Contract'),
+                    template=result_data.get('template', 'Unknown Template'),
+                    similarity=result_data.get('similarity', 0),
+                    status=result_data.get('status', 'Unknown'),
+                    date=result_data.get('date', now_iso),
+                    reviewer=result_data.get('reviewer', 'System'),
+                    changes_count=len(result_data.get('changes', []))
+                )
             
         except Exception as e:
             logger.error(f"Failed to retrieve analysis results: {e}")
-            return []  # Return empty list rather than failing completely
+            return  # Stop iterating rather than failing completely
     
-    def _get_contracts_summary(self) -> List[Dict[str, Any]]:
+    def _get_contracts_summary(self, now_iso: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Retrieves contract summary information.
         
+        Args:
+            now_iso: Upload date given to contracts without one, the current time if None
+        
         Returns:
             List[Dict[str, Any]]: Contract summaries
         """
+        if now_iso is None:
+            now_iso = datetime.now().isoformat()
+        
         try:
-            # TODO: Replace with repository pattern
-            from ...api.routes.contracts import contracts_store
-            
-            contracts = []
-            for contract_id, contract_data in contracts_store.items():
-                # Handle both Contract objects and dictionary data
-                if hasattr(contract_data, '__dict__'):
-                    # Contract object
-                    summary = {
-                        'id': contract_id,
-                        'filename': getattr(contract_data, 'filename', 'Unknown'),
-                        'original_filename': getattr(contract_data, 'original_filename', 'Unknown'),
-                        'upload_date': getattr(contract_data, 'upload_date', datetime.now().isoformat()),
-                        'status': getattr(contract_data, 'status', 'uploaded')
-                    }
-                else:
-                    # Dictionary data
-                    summary = {
-                        'id': contract_id,
-                        'filename': contract_data.get('filename', 'Unknown'),
-                        'original_filename': contract_data.get('original_filename', 'Unknown'),
-                        'upload_date': contract_data.get('upload_date', datetime.now().isoformat()),
-                        'status': contract_data.get('status', 'uploaded')
-                    }
-                contracts.append(summary)
-            
-            return contracts
+            return [
+                {
+                    'id': contract_id,
+                    'filename': filename,
+                    'original_filename': original_filename,
+                    'upload_date': upload_timestamp.isoformat() if upload_timestamp else now_iso,
+                    'status': status
+                }
+                for contract_id, filename, original_filename, upload_timestamp, status
+                in self.contract_repository.iter_summary_rows()
+            ]
             
         except Exception as e:
             logger.error(f"Failed to retrieve contracts summary: {e}")
@@ -234,47 +521,45 @@ class DashboardService:
         Returns:
             List[Dict[str, Any]]: Template summaries
         """
-        try:
-            # Templates are handled in the contracts route, not a separate templates route
-            # For now, return mock data until proper templates repository is implemented
-            templates = [
-                {
-                    'id': 'TYPE_SOW_Standard_v1',
-                    'filename': 'TYPE_SOW_Standard_v1.docx',
-                    'display_name': 'Standard SOW Template v1',
-                    'type': 'SOW'
-                },
-                {
-                    'id': 'TYPE_CHANGEORDER_Standard_v1', 
-                    'filename': 'TYPE_CHANGEORDER_Standard_v1.docx',
-                    'display_name': 'Standard Change Order Template v1',
-                    'type': 'CHANGEORDER'
-                }
-            ]
-            
-            return templates
-            
-        except Exception as e:
-            logger.error(f"Failed to retrieve templates summary: {e}")
-            return []
+        return list(_TEMPLATES_SUMMARY)
     
     def _get_contracts_count(self) -> int:
         """Returns total number of contracts."""
         try:
-            from ...api.routes.contracts import contracts_store
-            return len(contracts_store)
+            return self.contract_repository.count()
         except Exception:
             return 0
     
     def _get_templates_count(self) -> int:
         """Returns total number of templates."""  
-        try:
-            from ...api.routes.templates import templates_store
-            return len(templates_store)
-        except Exception:
-            return 0
+        return len(_templates_store())
     
     def _get_system_health(self) -> Dict[str, Any]:
+        """
+        Returns the latest system health snapshot without probing.
+        
+        Snapshots older than HEALTH_REFRESH_INTERVAL are refreshed in the
+        background; the caller gets the previous snapshot meanwhile.
+        
+        Returns:
+            Dict[str, Any]: System health information
+        """
+        with self._health_lock:
+            stale = time.monotonic() - self._health_checked_at >= HEALTH_REFRESH_INTERVAL
+            if stale and not self._health_refresh_pending:
+                self._health_refresh_pending = True
+                _fetch_executor.submit(_call_in_app_context, _current_app_or_none(), self._refresh_system_health)
+            return dict(self._last_health)
+    
+    def _refresh_system_health(self) -> None:
+        """Probes system health and stores the result as the latest snapshot."""
+        health = self._probe_system_health()
+        with self._health_lock:
+            self._last_health = health
+            self._health_checked_at = time.monotonic()
+            self._health_refresh_pending = False
+    
+    def _probe_system_health(self) -> Dict[str, Any]:
         """
         Checks system health and availability.
         
@@ -308,7 +593,7 @@ class DashboardService:
                 'error': str(e)
             }
     
-    def _calculate_metrics(self, analysis_results: List[Dict], contracts: List[Dict], templates: List[Dict]) -> Dict[str, Any]:
+    def _calculate_metrics(self, analysis_results: List[AnalysisResultView], contracts: List[Dict], templates: List[Dict]) -> Dict[str, Any]:
         """
         Calculates dashboard metrics from provided data.
         
@@ -324,58 +609,32 @@ class DashboardService:
             'total_contracts': len(contracts),
             'total_templates': len(templates),
             'total_analyses': len(analysis_results),
-            'pending_reviews': self._count_pending_reviews(analysis_results),
-            'recent_analyses': self._count_recent_analyses(analysis_results)
+            'pending_reviews': self._count_pending_reviews(),
+            'recent_analyses': self._count_recent_analyses()
         }
         
         return metrics
     
-    def _count_pending_reviews(self, analysis_results: List[Dict]) -> int:
+    def _count_pending_reviews(self) -> int:
         """
         Counts analysis results that require review.
         
-        Args:
-            analysis_results: List of analysis results
-        
         Returns:
             int: Number of pending reviews
         """
-        pending_statuses = ['MEDIUM RISK', 'HIGH RISK', 'NEEDS REVIEW']
-        
-        count = 0
-        for result in analysis_results:
-            status = result.get('status', '').upper()
-            if any(pending_status in status for pending_status in pending_statuses):
-                count += 1
-        
-        return count
+        return self.counters.pending
     
-    def _count_recent_analyses(self, analysis_results: List[Dict], days: int = 7) -> int:
+    def _count_recent_analyses(self, days: int = RECENT_ANALYSIS_DAYS) -> int:
         """
         Counts analyses performed within specified days.
         
         Args:
-            analysis_results: List of analysis results
             days: Number of days to consider as "recent"
         
         Returns:
             int: Number of recent analyses
         """
-        from datetime import datetime, timedelta
-        
-        cutoff_date = datetime.now() - timedelta(days=days)
-        
-        count = 0
-        for result in analysis_results:
-            try:
-                result_date = datetime.fromisoformat(result.get('date', ''))
-                if result_date >= cutoff_date:
-                    count += 1
-            except (ValueError, TypeError):
-                # Skip results with invalid dates
-                continue
-        
-        return count
+        return self.counters.recent_sum(days)
 
 
 class DashboardDataError(Exception):
@@ -5,10 +5,12 @@ Orchestrates the complete contract analysis workflow following clean architectur
 Business logic separated from HTTP concerns, following architectural standards.
 """
 
+import json
 import logging
 import uuid
 from datetime import datetime
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 from ...core.services.analyzer import create_contract_analyzer
@@ -17,6 +19,26 @@ from ...utils.errors.exceptions import ValidationError, NotFoundError, AnalysisE
 
 logger = logging.getLogger(__name__)
 
+# Distinct analyzer configurations kept alive; requests usually share the defaults
+ANALYZER_CACHE_SIZE = 32
+
+
+def _canonical_config_key(config: Dict[str, Any]) -> str:
+    """Canonical JSON for config, so equal configurations share one cache entry"""
+    return json.dumps(config, sort_keys=True, separators=(',', ':'))
+
+
+@lru_cache(maxsize=ANALYZER_CACHE_SIZE)
+def _get_or_create_analyzer(config_key: str):
+    """
+    Get the shared analyzer for a canonical configuration, creating it on first use.
+    
+    Analyzers hold clients and pipelines but no per-analysis state, so one
+    instance serves concurrent requests (as the /analyze-contract route already
+    does). Hit rates are available from _get_or_create_analyzer.cache_info().
+    """
+    return create_contract_analyzer(json.loads(config_key))
+
 
 class AnalyzeContractUseCase:
     """
@@ -130,7 +152,7 @@ class AnalyzeContractUseCase:
         """
         # Import here to avoid circular dependencies during refactoring
         from ...utils.validation import ValidationHandler
-        from ...api.routes.contracts import contracts_store
+        from ...api.routes.contracts import contract_repository
         
         # Validate contract ID format
         try:
@@ -141,14 +163,14 @@ class AnalyzeContractUseCase:
             raise
         
         # Check contract existence
-        logger.debug(f"Checking contract {validated_contract_id} in store")
-        logger.debug(f"Available contracts: {list(contracts_store.keys())}")
+        logger.debug(f"Looking up contract {validated_contract_id}")
+        contract_model = contract_repository.get_by_id(validated_contract_id)
         
-        if validated_contract_id not in contracts_store:
+        if contract_model is None:
             logger.warning(f"Contract {validated_contract_id} not found")
             raise NotFoundError("contract", validated_contract_id)
         
-        return contracts_store[validated_contract_id]
+        return contract_model.to_domain_object()
     
     def _find_best_template(self, contract) -> str:
         """
@@ -252,8 +274,14 @@ class AnalyzeContractUseCase:
             AnalysisError: If analyzer creation fails
         """
         try:
-            analyzer = create_contract_analyzer(config)
-            logger.debug(f"Analyzer created: {type(analyzer)}")
+            try:
+                config_key = _canonical_config_key(config)
+            except (TypeError, ValueError):
+                # Options that are not plain JSON cannot be keyed; build a private analyzer
+                analyzer = create_contract_analyzer(config)
+            else:
+                analyzer = _get_or_create_analyzer(config_key)
+            logger.debug(f"Analyzer ready: {type(analyzer)}")
             return analyzer
         except Exception as e:
             logger.error(f"Failed to create analyzer: {e}")
@@ -24,11 +24,13 @@ def configure_celery(app=None):
         timezone='UTC',
         enable_utc=True,
         
-        # Task routing
+        # Task routing (keyed by registered task name) so long batch jobs
+        # never share a queue with short analysis/report work
         task_routes={
-            'app.async_processing.tasks.analyze_contract': {'queue': 'analysis'},
-            'app.async_processing.tasks.generate_report': {'queue': 'reports'},
-            'app.async_processing.tasks.batch_analysis': {'queue': 'batch'},
+            'app.async_processing.tasks.analyze_contract_async': {'queue': 'analysis'},
+            'app.async_processing.tasks.generate_report_async': {'queue': 'reports'},
+            'app.async_processing.tasks.batch_analysis_async': {'queue': 'batch'},
+            'app.async_processing.tasks.cleanup_old_results': {'queue': 'default'},
         },
         
         # Queue definitions
@@ -42,12 +44,18 @@ def configure_celery(app=None):
         ),
         
         # Task execution settings
+        # Long-running tasks: prefetch one at a time and only ack on completion,
+        # requeueing if the worker dies mid-task
         task_time_limit=1800,  # 30 minutes
         task_soft_time_limit=1500,  # 25 minutes
         worker_prefetch_multiplier=1,
         task_acks_late=True,
+        task_reject_on_worker_lost=True,
         worker_max_tasks_per_child=100,
         
+        # Must exceed task_time_limit so unacked tasks aren't redelivered mid-run
+        broker_transport_options={'visibility_timeout': 3600},
+        
         # Results settings
         result_expires=3600,  # 1 hour
         task_ignore_result=False,
@@ -2,10 +2,11 @@
 Task management service for async processing
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime, timedelta
 
-from celery import current_app
+from celery import current_app, states
 from celery.result import AsyncResult
 
 from .tasks import (
@@ -18,6 +19,16 @@ from ..utils.errors.exceptions import TaskError
 
 logger = logging.getLogger(__name__)
 
+# Runs worker inspect broadcasts side by side; each one blocks for the reply timeout
+_inspect_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='celery-inspect')
+
+
+def _inspect_concurrently(inspect, *methods: str) -> List[Any]:
+    """Call several inspect methods in parallel and return their replies in order"""
+    futures = [_inspect_executor.submit(getattr(inspect, method)) for method in methods]
+    return [future.result() for future in futures]
+
+
 class TaskManager:
     """
     Service for managing async tasks and monitoring their status
@@ -138,26 +149,11 @@ class TaskManager:
         try:
             result = AsyncResult(task_id, app=self.celery_app)
             
-            status_info = {
-                'task_id': task_id,
-                'state': result.state,
-                'ready': result.ready(),
-                'successful': result.successful() if result.ready() else None,
-                'failed': result.failed() if result.ready() else None,
-            }
-            
-            # Add result or error info
-            if result.ready():
-                if result.successful():
-                    status_info['result'] = result.result
-                else:
-                    status_info['error'] = str(result.result) if result.result else 'Unknown error'
-            else:
-                # Get progress info if available
-                if hasattr(result, 'info') and result.info:
-                    status_info['info'] = result.info
+            # Read the state once; every ready()/successful() call is a backend round trip
+            state = result.state
+            value = result.result if state in states.READY_STATES else result.info
             
-            return status_info
+            return self._build_status_info(task_id, state, value)
             
         except Exception as exc:
             logger.error(f"Failed to get task status for {task_id}: {str(exc)}")
@@ -167,6 +163,70 @@ class TaskManager:
                 'error': f"Failed to get status: {str(exc)}"
             }
     
+    def get_task_statuses(self, task_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get status of several tasks with one result backend round trip
+        
+        Key/value backends (e.g. Redis) are read with a single MGET; other
+        backends fall back to one lookup per task.
+        
+        Args:
+            task_ids: Task IDs to check
+            
+        Returns:
+            Dict mapping each task ID to its status information
+        """
+        backend = self.celery_app.backend
+        if not (hasattr(backend, 'mget') and hasattr(backend, 'get_key_for_task')):
+            return {task_id: self.get_task_status(task_id) for task_id in task_ids}
+        
+        try:
+            keys = [backend.get_key_for_task(task_id) for task_id in task_ids]
+            payloads = backend.mget(keys)
+        except Exception as exc:
+            logger.error(f"Failed to batch fetch task statuses: {str(exc)}")
+            return {task_id: self.get_task_status(task_id) for task_id in task_ids}
+        
+        statuses = {}
+        for task_id, payload in zip(task_ids, payloads):
+            if not payload:
+                statuses[task_id] = self._build_status_info(task_id, states.PENDING, None)
+                continue
+            
+            meta = backend.decode_result(payload)
+            state = meta['status']
+            value = meta.get('result')
+            if state in states.EXCEPTION_STATES:
+                value = backend.exception_to_python(value)
+            statuses[task_id] = self._build_status_info(task_id, state, value)
+        
+        return statuses
+    
+    def _build_status_info(self, task_id: str, state: str, value: Any) -> Dict[str, Any]:
+        """Build the status payload from a task state and its result/progress value"""
+        ready = state in states.READY_STATES
+        successful = state == states.SUCCESS
+        
+        status_info = {
+            'task_id': task_id,
+            'state': state,
+            'ready': ready,
+            'successful': successful if ready else None,
+            'failed': state == states.FAILURE if ready else None,
+        }
+        
+        # Add result or error info
+        if ready:
+            if successful:
+                status_info['result'] = value
+            else:
+                status_info['error'] = str(value) if value else 'Unknown error'
+        elif value:
+            # Progress info if available
+            status_info['info'] = value
+        
+        return status_info
+    
     def cancel_task(self, task_id: str) -> bool:
         """
         Cancel a running task
@@ -287,14 +347,14 @@ class TaskManager:
             }
             
             if inspect:
+                active_queues, stats = _inspect_concurrently(inspect, 'active_queues', 'stats')
+                
                 # Get queue lengths
-                active_queues = inspect.active_queues()
                 if active_queues:
                     for worker, queues in active_queues.items():
                         queue_info['workers'][worker] = queues
                 
                 # Get worker stats
-                stats = inspect.stats()
                 if stats:
                     queue_info['stats'] = stats
             
@@ -323,13 +383,13 @@ class TaskManager:
             }
             
             if inspect:
+                stats, active_queues = _inspect_concurrently(inspect, 'stats', 'active_queues')
+                
                 # Check worker availability
-                stats = inspect.stats()
                 if stats:
                     health_info['workers'] = len(stats)
                     
                 # Check queue availability
-                active_queues = inspect.active_queues()
                 if active_queues:
                     all_queues = set()
                     for worker, queues in active_queues.items():
@@ -4,7 +4,7 @@ Core Domain Models Package
 Business domain entities and value objects for contract analysis.
 """
 
-from .contract import Contract, validate_contract_file
+from .contract import Contract, validate_contract_file, discover_contract_files
 from .analysis_result import (
     AnalysisResult, 
     Change, 
@@ -20,5 +20,6 @@ __all__ = [
     'ChangeClassification',
     'ChangeType',
     'validate_contract_file',
+    'discover_contract_files',
     'create_change_from_diff'
 ]
\ No newline at end of file
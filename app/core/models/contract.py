@@ -4,6 +4,8 @@ Contract Domain Model
 Represents contract entities and related business logic.
 """
 
+import os
+import secrets
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
@@ -262,4 +264,63 @@ def validate_contract_file(file_path: str) -> bool:
         return False
 
 
-__all__ = ['Contract', 'validate_contract_file']
\ No newline at end of file
+def discover_contract_files(upload_dir: str) -> Dict[str, Contract]:
+    """
+    Build contracts for the .docx files already in an upload directory
+    
+    Used by offline migration tooling to register files that predate the
+    database; request handlers read contracts from the repository instead.
+    
+    Args:
+        upload_dir: Directory to scan
+        
+    Returns:
+        Contracts keyed by contract ID
+    """
+    upload_path = Path(upload_dir)
+    if not upload_path.exists():
+        logger.info(f"Upload directory {upload_path} does not exist, no contracts discovered")
+        return {}
+    
+    contracts = {}
+    # Scanning an open directory fd makes each DirEntry.stat() an fstatat()
+    # relative to it, skipping per-file path resolution (slow on network mounts)
+    dir_fd = os.open(upload_path, os.O_RDONLY) if os.scandir in os.supports_fd else None
+    try:
+        with os.scandir(upload_path if dir_fd is None else dir_fd) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.docx') or not entry.is_file(follow_symlinks=False):
+                    continue
+                try:
+                    # Expected format: Contract_###_Name_Date.docx
+                    filename = entry.name
+                    parts = filename.split('_')
+                    if len(parts) >= 2 and parts[0].lower() == 'contract':
+                        contract_id = f"contract_{parts[1]}"
+                    else:
+                        contract_id = f"contract_{secrets.token_hex(4)}"
+                
+                    if contract_id in contracts:
+                        continue
+                
+                    stat_result = entry.stat(follow_symlinks=False)
+                    contracts[contract_id] = Contract(
+                        id=contract_id,
+                        filename=filename,
+                        original_filename=filename,
+                        file_path=str(upload_path / filename),
+                        file_size=stat_result.st_size,
+                        upload_timestamp=datetime.fromtimestamp(stat_result.st_mtime),
+                        status="uploaded"
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to load contract from {upload_path / entry.name}: {e}")
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+    
+    logger.info(f"Discovered {len(contracts)} contracts in {upload_path}")
+    return contracts
+
+
+__all__ = ['Contract', 'validate_contract_file', 'discover_contract_files']
\ No newline at end of file
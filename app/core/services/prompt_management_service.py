@@ -12,6 +12,11 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 from flask import current_app
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -563,6 +568,9 @@ Response format:
             if not prompts_file.exists():
                 return None
             
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            if orjson is not None:
+                return orjson.loads(prompts_file.read_bytes())
             with open(prompts_file, 'r', encoding='utf-8') as f:
                 return json.load(f)
                 
@@ -2,7 +2,8 @@
 Contract database model
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text
+from functools import cached_property
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, event
 from sqlalchemy.orm import relationship
 from ..database import db
 
@@ -85,8 +86,9 @@ class ContractModel(db.Model):
             analysis_count=getattr(contract, 'analysis_count', 0)
         )
     
-    def get_summary(self):
-        """Get contract summary for API responses"""
+    @cached_property
+    def summary(self):
+        """Contract summary for API responses, cached until a summarised field changes"""
         return {
             'id': self.id,
             'filename': self.original_filename,
@@ -97,5 +99,26 @@ class ContractModel(db.Model):
             'last_analyzed': self.last_analyzed.isoformat() if self.last_analyzed else None
         }
     
+    def get_summary(self):
+        """Get contract summary for API responses"""
+        return self.summary
+    
     def __repr__(self):
-        return f'<ContractModel {self.id}: {self.original_filename}>'
\ No newline at end of file
+        return f'<ContractModel {self.id}: {self.original_filename}>'
+
+
+# Fields rendered by ContractModel.summary; writes, expiry and refresh drop the cached dict
+_SUMMARY_FIELDS = (
+    'id', 'original_filename', 'file_size', 'upload_timestamp',
+    'status', 'analysis_count', 'last_analyzed'
+)
+
+
+def _reset_summary(target, *args):
+    target.__dict__.pop('summary', None)
+
+
+for _field in _SUMMARY_FIELDS:
+    event.listen(getattr(ContractModel, _field), 'set', _reset_summary)
+event.listen(ContractModel, 'expire', _reset_summary)
+event.listen(ContractModel, 'refresh', _reset_summary)
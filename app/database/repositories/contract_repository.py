@@ -1,9 +1,9 @@
 """
 Contract repository for database operations
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from datetime import datetime
-from sqlalchemy import desc
+from sqlalchemy import Row, bindparam, desc, select
 from sqlalchemy.exc import SQLAlchemyError
 
 from .base_repository import BaseRepository, RepositoryError
@@ -12,6 +12,24 @@ from ...utils.logging.setup import get_logger
 
 logger = get_logger(__name__)
 
+# Statements for the per-request lookups are built once; SQLAlchemy caches their
+# compiled SQL, so each call only binds parameters. get_by_id stays on
+# Session.get, which answers from the identity map without any SQL.
+_SELECT_BY_FILENAME = select(ContractModel)\
+    .where(ContractModel.original_filename == bindparam('filename'))\
+    .limit(1)
+_SELECT_RECENT = select(ContractModel)\
+    .order_by(desc(ContractModel.upload_timestamp))\
+    .limit(bindparam('limit'))
+# Column projection for listings that need no ORM objects
+_SELECT_SUMMARY_COLUMNS = select(
+    ContractModel.id,
+    ContractModel.filename,
+    ContractModel.original_filename,
+    ContractModel.upload_timestamp,
+    ContractModel.status,
+)
+
 
 class ContractRepository(BaseRepository):
     """Repository for contract database operations"""
@@ -35,9 +53,7 @@ class ContractRepository(BaseRepository):
     def get_by_filename(self, filename: str) -> Optional[ContractModel]:
         """Get contract by original filename"""
         try:
-            return self.db.session.query(ContractModel)\
-                .filter_by(original_filename=filename)\
-                .first()
+            return self.db.session.execute(_SELECT_BY_FILENAME, {'filename': filename}).scalar_one_or_none()
         except SQLAlchemyError as e:
             logger.error(f"Error retrieving contract by filename {filename}: {e}")
             raise RepositoryError(f"Failed to retrieve contract: {e}")
@@ -68,14 +84,41 @@ class ContractRepository(BaseRepository):
     def get_recent(self, limit: int = 10) -> List[ContractModel]:
         """Get most recently uploaded contracts"""
         try:
-            return self.db.session.query(ContractModel)\
-                .order_by(desc(ContractModel.upload_timestamp))\
-                .limit(limit)\
-                .all()
+            return self.db.session.execute(_SELECT_RECENT, {'limit': limit}).scalars().all()
         except SQLAlchemyError as e:
             logger.error(f"Error retrieving recent contracts: {e}")
             raise RepositoryError(f"Failed to retrieve recent contracts: {e}")
     
+    def iter_recent(self, limit: int = 10, batch_size: int = 500) -> Iterator[ContractModel]:
+        """Stream the most recently uploaded contracts in batches"""
+        try:
+            yield from self.db.session.execute(
+                _SELECT_RECENT, {'limit': limit}, execution_options={'yield_per': batch_size}
+            ).scalars()
+        except SQLAlchemyError as e:
+            logger.error(f"Error streaming recent contracts: {e}")
+            raise RepositoryError(f"Failed to retrieve recent contracts: {e}")
+    
+    def iter_all(self, batch_size: int = 500) -> Iterator[ContractModel]:
+        """Stream all contracts, fetching rows in batches instead of loading them at once"""
+        try:
+            yield from self.db.session.query(ContractModel)\
+                .execution_options(stream_results=True)\
+                .yield_per(batch_size)
+        except SQLAlchemyError as e:
+            logger.error(f"Error streaming contracts: {e}")
+            raise RepositoryError(f"Failed to retrieve contracts: {e}")
+    
+    def iter_summary_rows(self, batch_size: int = 500) -> Iterator[Row]:
+        """Stream (id, filename, original_filename, upload_timestamp, status) rows without loading models"""
+        try:
+            yield from self.db.session.execute(
+                _SELECT_SUMMARY_COLUMNS, execution_options={'yield_per': batch_size}
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Error streaming contract summaries: {e}")
+            raise RepositoryError(f"Failed to retrieve contracts: {e}")
+    
     def get_by_status(self, status: str) -> List[ContractModel]:
         """Get contracts by status"""
         try:
@@ -5,5 +5,6 @@ Provides common utilities for API endpoints.
 """
 
 from .responses import APIResponse
+from .json_provider import OrjsonProvider, init_json_provider
 
-__all__ = ['APIResponse']
\ No newline at end of file
+__all__ = ['APIResponse', 'OrjsonProvider', 'init_json_provider']
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""
+orjson-backed JSON provider for Flask
+
+Serializes jsonify() responses with orjson when it is installed, producing
+bytes directly instead of building a str and re-encoding it. Output matches
+Flask's default provider: sorted keys, RFC 822 dates, Decimal/UUID as strings.
+Enums serialize as their value and domain objects through their to_dict().
+"""
+
+import logging
+from enum import Enum
+from typing import Any
+
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider using orjson, falling back to json for unsupported input"""
+
+    # Dates go through Flask's default() so they keep the HTTP date format
+    option = (
+        orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if HAS_ORJSON else 0
+    )
+
+    @staticmethod
+    def default(o: Any) -> Any:
+        """Serialize types neither orjson nor Flask handle natively"""
+        if isinstance(o, Enum):
+            return o.value
+        if hasattr(o, 'to_dict'):
+            return o.to_dict()
+        return DefaultJSONProvider.default(o)
+
+    def dumps_bytes(self, obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes"""
+        option = self.option | orjson.OPT_INDENT_2 if indent else self.option
+        try:
+            return orjson.dumps(obj, default=self.default, option=option)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles these
+            return super().dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a JSON string"""
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj).decode('utf-8')
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserialize JSON from str or bytes"""
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Build a JSON response without an intermediate str"""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            self.dumps_bytes(obj, indent=indent) + b'\n',
+            mimetype=self.mimetype
+        )
+
+
+def init_json_provider(app: Flask) -> None:
+    """Use the orjson provider for app if orjson is available"""
+    if not HAS_ORJSON:
+        logger.info("orjson not installed - using default JSON provider")
+        return
+
+    app.json = OrjsonProvider(app)
+
+
+__all__ = ['OrjsonProvider', 'init_json_provider', 'HAS_ORJSON']
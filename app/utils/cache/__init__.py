@@ -0,0 +1,10 @@
+"""
+Caching utilities package
+
+Provides in-process caches for hot read-only paths.
+"""
+
+from .ttl_cache import TTLCache
+from .versioned_store import LRUStore, VersionedStore
+
+__all__ = ['TTLCache', 'VersionedStore', 'LRUStore']
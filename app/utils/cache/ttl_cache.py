@@ -0,0 +1,121 @@
+"""
+In-process TTL cache
+
+Small thread-safe cache used to absorb polling traffic on read-only
+endpoints without adding an external cache dependency.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe key/value cache with per-entry expiry"""
+
+    def __init__(self, default_ttl: float = 5.0, maxsize: int = 1024):
+        """
+        Initialize cache
+
+        Args:
+            default_ttl: Seconds an entry stays valid when no ttl is given
+            maxsize: Maximum number of entries kept before the oldest are evicted
+        """
+        self.default_ttl = default_ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._loading: Dict[Hashable, threading.Lock] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value, or default if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+            return default
+
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value for ttl seconds (default_ttl if not given)"""
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                self._evict()
+            self._entries[key] = (expires_at, value)
+
+    def get_or_set(
+        self,
+        key: Hashable,
+        factory: Callable[[], Any],
+        ttl: Optional[float] = None
+    ) -> Any:
+        """
+        Get a cached value, computing and storing it on a miss
+
+        Concurrent misses for the same key wait for a single factory call
+        rather than each running it.
+
+        Args:
+            key: Cache key
+            factory: Zero-argument callable producing the value
+            ttl: Optional expiry override in seconds
+
+        Returns:
+            Cached or freshly computed value
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            key_lock = self._loading.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                value = self.get(key, _MISSING)
+                if value is _MISSING:
+                    value = factory()
+                    self.set(key, value, ttl)
+        finally:
+            with self._lock:
+                if self._loading.get(key) is key_lock:
+                    del self._loading[key]
+        return value
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a key if present"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the oldest ones if still full (lock held)"""
+        now = time.monotonic()
+        expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+
+        # Dicts keep insertion order, so the first keys are the oldest writes
+        while len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+
+
+__all__ = ['TTLCache']
@@ -0,0 +1,110 @@
+"""
+Versioned in-memory store
+
+Dict that counts its mutations, so read endpoints can cache views derived
+from it and rebuild them only after the store has changed. LRUStore adds a
+size bound for long-running workers.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, List, Tuple
+
+
+class VersionedStore(OrderedDict):
+    """Dict whose version attribute is bumped on every mutation"""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        self.version = 0
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: Hashable) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self.version += 1
+        return value
+
+    def popitem(self, last: bool = True) -> Any:
+        item = super().popitem(last)
+        self.version += 1
+        return item
+
+    def setdefault(self, key: Hashable, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+
+class LRUStore(VersionedStore):
+    """
+    VersionedStore that evicts its least recently used entries past maxsize
+
+    Mutations and recency updates hold an internal lock, so readers on other
+    threads should iterate snapshot() rather than the store itself.
+    """
+
+    def __init__(self, maxsize: int = 512, *args: Any, **kwargs: Any):
+        """
+        Initialize store
+
+        Args:
+            maxsize: Maximum number of entries kept
+        """
+        self.maxsize = maxsize
+        self._lock = threading.RLock()
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.maxsize:
+                self.popitem(last=False)
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            super().__delitem__(key)
+
+    def pop(self, *args: Any) -> Any:
+        with self._lock:
+            return super().pop(*args)
+
+    def popitem(self, last: bool = True) -> Any:
+        with self._lock:
+            return super().popitem(last)
+
+    def clear(self) -> None:
+        with self._lock:
+            super().clear()
+
+    def touch(self, key: Hashable) -> None:
+        """Mark key as recently used; missing keys are ignored"""
+        with self._lock:
+            try:
+                self.move_to_end(key)
+            except KeyError:
+                pass
+
+    def snapshot(self) -> List[Tuple[Hashable, Any]]:
+        """Copy of the (key, value) pairs, safe to iterate while other threads mutate the store"""
+        with self._lock:
+            return list(self.items())
+
+
+__all__ = ['VersionedStore', 'LRUStore']
@@ -3,6 +3,7 @@ Input validation utilities with comprehensive error handling
 """
 import re
 import os
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 from pathlib import Path
 from marshmallow import Schema, fields, ValidationError as MarshmallowValidationError, validate
@@ -13,6 +14,38 @@ from ..logging.setup import get_logger
 logger = get_logger(__name__)
 
 
+_CONTRACT_ID_PATTERN = re.compile(r'[a-zA-Z0-9_]+')
+
+
+# Contract IDs seen by the API are few and re-validated on every request
+@lru_cache(maxsize=4096)
+def _validate_contract_id_format(contract_id: str) -> str:
+    """Check contract ID format; only valid IDs are cached, since errors propagate"""
+    # Allow alphanumeric characters and underscores
+    if not _CONTRACT_ID_PATTERN.fullmatch(contract_id):
+        raise ValidationError(
+            "Contract ID can only contain letters, numbers, and underscores",
+            field="contract_id",
+            value=contract_id
+        )
+    
+    if len(contract_id) > 50:
+        raise ValidationError(
+            "Contract ID cannot exceed 50 characters",
+            field="contract_id",
+            value=f"Length: {len(contract_id)}"
+        )
+    
+    if len(contract_id) < 3:
+        raise ValidationError(
+            "Contract ID must be at least 3 characters",
+            field="contract_id",
+            value=f"Length: {len(contract_id)}"
+        )
+    
+    return contract_id
+
+
 class ValidationHandler:
     """Enhanced validation handler with detailed error messages"""
     
@@ -36,29 +69,7 @@ class ValidationHandler:
         if not isinstance(contract_id, str):
             raise ValidationError("Contract ID must be a string", field="contract_id", value=contract_id)
         
-        # Allow alphanumeric characters and underscores
-        if not re.match(r'^[a-zA-Z0-9_]+$', contract_id):
-            raise ValidationError(
-                "Contract ID can only contain letters, numbers, and underscores",
-                field="contract_id",
-                value=contract_id
-            )
-        
-        if len(contract_id) > 50:
-            raise ValidationError(
-                "Contract ID cannot exceed 50 characters",
-                field="contract_id",
-                value=f"Length: {len(contract_id)}"
-            )
-        
-        if len(contract_id) < 3:
-            raise ValidationError(
-                "Contract ID must be at least 3 characters",
-                field="contract_id",
-                value=f"Length: {len(contract_id)}"
-            )
-        
-        return contract_id
+        return _validate_contract_id_format(contract_id)
     
     @staticmethod
     def validate_analysis_id(analysis_id: str) -> str:
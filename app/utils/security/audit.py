@@ -4,14 +4,32 @@ Security audit logging for Contract Analyzer
 Provides comprehensive security event logging and monitoring capabilities.
 """
 
+import atexit
 import json
 import logging
+import queue
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, NamedTuple, Optional
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_event(event_data: Dict[str, Any]) -> str:
+    """Encode an audit event as JSON, using orjson when it can handle the data"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(event_data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(event_data, ensure_ascii=False)
+
 
 class SecurityEventType(Enum):
     """Security event types for categorization"""
@@ -35,6 +53,12 @@ class SecurityEventType(Enum):
     REPORT_GENERATION_COMPLETED = "report_generation_completed"
     REPORT_GENERATION_FAILED = "report_generation_failed"
     REPORT_GENERATION_ERROR = "report_generation_error"
+    ANALYSIS_STARTED = "analysis_started"
+    ANALYSIS_COMPLETED = "analysis_completed"
+    ANALYSIS_FAILED = "analysis_failed"
+    ANALYSIS_ERROR = "analysis_error"
+    ANALYSIS_DELETED = "analysis_deleted"
+    CONTRACTS_CLEARED = "contracts_cleared"
 
 
 class SecurityAuditor:
@@ -91,7 +115,7 @@ class SecurityAuditor:
         }
         
         # Log as JSON for structured logging
-        log_message = json.dumps(event_data, ensure_ascii=False)
+        log_message = _dumps_event(event_data)
         
         # Log at appropriate level
         if severity == "CRITICAL":
@@ -325,8 +349,113 @@ class SecurityAuditor:
         return hashlib.md5(data.encode()).hexdigest()[:8]
 
 
+class APIAccessEvent(NamedTuple):
+    """API access details captured on the request thread"""
+    endpoint: str
+    method: str
+    status_code: int
+    response_time: float
+    user_ip: Optional[str] = None
+    user_agent: Optional[str] = None
+
+
+class SecurityEvent(NamedTuple):
+    """Security event details captured on the request thread"""
+    event_type: SecurityEventType
+    details: Dict[str, Any]
+    severity: str = "INFO"
+    user_ip: Optional[str] = None
+    user_agent: Optional[str] = None
+
+
+class BackgroundAuditWriter:
+    """
+    Writes API access and security events from a daemon thread
+    
+    Request threads only enqueue events; formatting and file I/O happen on
+    the writer thread in batches. Until start() is called, events are
+    written synchronously. The queue holds at most max_queued events;
+    further events are dropped with a warning rather than growing memory.
+    """
+    
+    def __init__(self, auditor: SecurityAuditor, batch_size: int = 256, max_queued: int = 10000):
+        """Initialize writer for auditor"""
+        self.auditor = auditor
+        self.batch_size = batch_size
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queued)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def start(self):
+        """Start the writer thread if it is not already running"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="security-audit-writer", daemon=True
+            )
+            self._thread.start()
+            atexit.register(self.flush)
+    
+    def submit_api_access(self, event: APIAccessEvent):
+        """Queue an API access event for logging"""
+        if self._thread is None:
+            self.auditor.log_api_access(*event)
+        else:
+            self._enqueue(event)
+    
+    def submit_security_event(self, event: SecurityEvent):
+        """Queue a security event for logging"""
+        if self._thread is None:
+            self.auditor.log_security_event(*event)
+        else:
+            self._enqueue(event)
+    
+    def _enqueue(self, event: NamedTuple):
+        """Queue an event, dropping it if the writer has fallen behind"""
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.auditor.logger.warning(f"Audit queue full, dropped {type(event).__name__}: {event[0]}")
+    
+    def flush(self):
+        """Write all queued events on the calling thread, batch_size at a time"""
+        while True:
+            batch = self._drain([])
+            if not batch:
+                return
+            self._write(batch)
+    
+    def _write(self, batch: List[NamedTuple]):
+        """Write a drained batch in the order the events were queued"""
+        for event in batch:
+            if isinstance(event, APIAccessEvent):
+                self.auditor.log_api_access(*event)
+            else:
+                self.auditor.log_security_event(*event)
+    
+    def _drain(self, batch: List[NamedTuple]) -> List[NamedTuple]:
+        """Move queued events into batch without blocking, up to batch_size"""
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+    
+    def _run(self):
+        """Writer thread loop"""
+        while True:
+            batch = self._drain([self._queue.get()])
+            try:
+                self._write(batch)
+            except Exception as e:
+                self.auditor.logger.error(f"Failed to write audit events: {e}")
+
+
 # Create default auditor instance
 default_auditor = SecurityAuditor()
+default_audit_writer = BackgroundAuditWriter(default_auditor)
 
 # Convenience functions
 def audit_security_event(
@@ -339,6 +468,18 @@ def audit_security_event(
     """Log security event using default auditor"""
     default_auditor.log_security_event(event_type, details, severity, user_ip, user_agent)
 
+def queue_security_event(
+    event_type: SecurityEventType,
+    details: Dict[str, Any],
+    severity: str = "INFO",
+    user_ip: Optional[str] = None,
+    user_agent: Optional[str] = None
+):
+    """Log security event on the default background writer"""
+    default_audit_writer.submit_security_event(
+        SecurityEvent(event_type, details, severity, user_ip, user_agent)
+    )
+
 def audit_file_upload(
     filename: str,
     file_size: int,
@@ -365,7 +506,12 @@ __all__ = [
     'SecurityAuditor',
     'SecurityEventType',
     'default_auditor',
+    'APIAccessEvent',
+    'SecurityEvent',
+    'BackgroundAuditWriter',
+    'default_audit_writer',
     'audit_security_event',
+    'queue_security_event',
     'audit_file_upload',
     'audit_api_access'
 ]
\ No newline at end of file
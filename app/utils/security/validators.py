@@ -161,7 +161,7 @@ class SecurityValidator:
         
         return filename
     
-    def validate_file_content(self, file_storage: FileStorage) -> Dict[str, Any]:
+    def validate_file_content(self, file_storage: FileStorage, hash_content: bool = True) -> Dict[str, Any]:
         """
         Validate file content and metadata with comprehensive security checks.
         
@@ -171,6 +171,8 @@ class SecurityValidator:
         
         Args:
             file_storage: Uploaded file object
+            hash_content: Read the whole file to hash it; callers that stream the
+                file elsewhere can hash it there and pass False
             
         Returns:
             Validation results dictionary containing:
@@ -178,7 +180,7 @@ class SecurityValidator:
             - validated_filename: Sanitized filename
             - file_size: File size in bytes
             - mime_type: Detected MIME type
-            - file_hash: SHA-256 hash for integrity
+            - file_hash: SHA-256 hash for integrity (None if hash_content is False)
             
         Raises:
             FileValidationError: If file fails validation
@@ -215,7 +217,7 @@ class SecurityValidator:
                 raise FileValidationError(f"MIME type '{detected_mime}' not allowed for extension '{extension}'")
         
         # Calculate file hash for integrity
-        file_hash = self._calculate_file_hash(file_storage)
+        file_hash = self._calculate_file_hash(file_storage) if hash_content else None
         
         return {
             'original_filename': file_storage.filename,
@@ -348,9 +350,9 @@ def validate_filename(filename: str) -> str:
     """Validate filename using default validator"""
     return default_validator.validate_filename(filename)
 
-def validate_file_content(file_storage: FileStorage) -> Dict[str, Any]:
+def validate_file_content(file_storage: FileStorage, hash_content: bool = True) -> Dict[str, Any]:
     """Validate file content using default validator"""
-    return default_validator.validate_file_content(file_storage)
+    return default_validator.validate_file_content(file_storage, hash_content)
 
 def validate_path(file_path: str, base_directory: str) -> str:
     """Validate file path using default validator"""
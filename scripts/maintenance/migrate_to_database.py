@@ -13,9 +13,10 @@ sys.path.insert(0, str(project_root))
 from flask import Flask
 from app.database import init_app, db
 from app.database.repositories import ContractRepository, AnalysisRepository
+from app.core.models.contract import discover_contract_files
 
-# Legacy stores will be empty initially - we'll populate from files
-contracts_store = {}
+# Contracts are discovered from the upload directory; analysis results start empty
+UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER', 'data/uploads')
 analysis_results_store = {}
 
 def create_migration_app():
@@ -49,7 +50,8 @@ def migrate_data():
             contract_repo = ContractRepository()
             analysis_repo = AnalysisRepository()
             
-            # Migrate contracts
+            # Migrate contracts found in the upload directory
+            contracts_store = discover_contract_files(UPLOAD_FOLDER)
             print(f"📦 Migrating {len(contracts_store)} contracts...")
             migrated_contracts = contract_repo.migrate_from_memory_store(contracts_store)
             print(f"✅ Migrated {migrated_contracts} contracts to database")
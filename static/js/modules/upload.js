@@ -506,22 +506,43 @@ class UploadModule {
         try {
             const response = await utils?.apiRequest('/api/analyze-contract', {
                 method: 'POST',
-                body: JSON.stringify({ contract_id: contractId })
+                body: JSON.stringify({ contract_id: contractId, async: true })
             });
 
-            if (response?.success) {
-                notifications?.success('Contract analyzed successfully');
-                this.refreshData();
-            } else {
+            if (!response?.success) {
                 throw new Error(response?.error || 'Analysis failed');
             }
 
+            // Analysis runs in the background; poll until it finishes
+            const status = await this.waitForAnalysis(response.status_url);
+            if (status?.state !== 'done') {
+                throw new Error(status?.error || 'Analysis failed');
+            }
+
+            notifications?.success('Contract analyzed successfully');
+            this.refreshData();
+
         } catch (error) {
             console.error('Upload: Error analyzing contract:', error);
             notifications?.error(`Contract analysis failed: ${error.message}`);
         }
     }
 
+    /**
+     * Poll a background analysis job until it completes
+     */
+    async waitForAnalysis(statusUrl, intervalMs = 2000) {
+        const utils = window.ContractApp?.modules?.utils;
+
+        while (true) {
+            const status = await utils?.apiRequest(statusUrl);
+            if (!status?.success || status.state === 'done' || status.state === 'error') {
+                return status;
+            }
+            await new Promise(resolve => setTimeout(resolve, intervalMs));
+        }
+    }
+
     /**
      * Edit template
      */
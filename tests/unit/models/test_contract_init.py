@@ -1,58 +1,42 @@
 #!/usr/bin/env python3
 """
-Test contract initialization and storage
+Test contract discovery from the uploads directory
 """
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-def test_contract_initialization():
-    """Test how contracts are initialized"""
-    print("🔍 Testing Contract Store Initialization")
+def test_contract_initialization(tmp_path):
+    """Test how contracts are discovered from uploaded files"""
+    print("🔍 Testing Contract Discovery")
     print("=" * 80)
     
-    # Import the contracts module
-    from app.api.routes.contracts import contracts_store, initialize_contracts_from_uploads
-    from pathlib import Path
+    from app.core.models.contract import discover_contract_files
+    
+    (tmp_path / 'Contract_001_Acme_2024.docx').write_bytes(b'docx')
+    (tmp_path / 'renamed_upload.docx').write_bytes(b'docx')
+    (tmp_path / 'notes.txt').write_text('ignored')
     
-    # Check initial state
-    print(f"\nInitial contracts in store: {len(contracts_store)}")
-    if contracts_store:
-        print("First 5 contracts:")
-        for i, (cid, contract) in enumerate(list(contracts_store.items())[:5]):
-            print(f"  {cid}: {contract.filename}")
+    print("\n🔄 Running discover_contract_files()...")
+    contracts = discover_contract_files(str(tmp_path))
     
-    # Manually initialize with Flask context
-    from app.api.app import create_api_app
-    from app.config.settings import get_config
+    print(f"\nContracts discovered: {len(contracts)}")
+    for cid, contract in contracts.items():
+        print(f"{cid}: {contract.filename}")
     
-    config = get_config()
-    app = create_api_app(config)
+    assert len(contracts) == 2
+    assert contracts['contract_001'].filename == 'Contract_001_Acme_2024.docx'
+    assert contracts['contract_001'].file_size == 4
+    assert contracts['contract_001'].file_path == str(tmp_path / 'Contract_001_Acme_2024.docx')
+    assert all(contract.status == 'uploaded' for contract in contracts.values())
     
-    with app.app_context():
-        print("\n🔄 Running initialize_contracts_from_uploads()...")
-        initialize_contracts_from_uploads()
-        
-        print(f"\nContracts in store after init: {len(contracts_store)}")
-        if contracts_store:
-            print("\nAll contracts in store:")
-            print("-" * 60)
-            for cid, contract in contracts_store.items():
-                print(f"{cid}: {contract.filename}")
-        
-        # Check uploads directory
-        upload_dir = Path(app.config.get('UPLOAD_FOLDER', 'data/uploads'))
-        print(f"\n📁 Upload directory: {upload_dir}")
-        print(f"Directory exists: {upload_dir.exists()}")
-        
-        if upload_dir.exists():
-            docx_files = list(upload_dir.glob('*.docx'))
-            print(f"DOCX files in directory: {len(docx_files)}")
-            print("\nFirst 5 files:")
-            for f in docx_files[:5]:
-                print(f"  - {f.name}")
+    # Missing directories discover nothing
+    assert discover_contract_files(str(tmp_path / 'missing')) == {}
     
     return True
 
 if __name__ == "__main__":
-    test_contract_initialization()
\ No newline at end of file
+    import tempfile
+    from pathlib import Path
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        test_contract_initialization(Path(tmp_dir))
\ No newline at end of file
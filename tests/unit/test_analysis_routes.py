@@ -0,0 +1,163 @@
+"""
+Unit tests for analysis route response handling
+"""
+
+import json
+import threading
+import time
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from app.api.routes import analysis
+from app.core.models.analysis_result import AnalysisResult, Change, ChangeType, ChangeClassification
+
+
+def _analysis_result(analysis_id: str, change_count: int) -> AnalysisResult:
+    changes = [
+        Change(
+            change_id=f'change_{i}',
+            change_type=ChangeType.MODIFICATION,
+            classification=ChangeClassification.SIGNIFICANT,
+            deleted_text='old "term"',
+            inserted_text='new term'
+        )
+        for i in range(change_count)
+    ]
+    return AnalysisResult(
+        analysis_id=analysis_id,
+        contract_id='contract_1',
+        template_id='template_1',
+        analysis_timestamp=datetime(2024, 1, 1),
+        total_changes=change_count,
+        changes=changes
+    )
+
+
+@pytest.fixture
+def results_store():
+    """Clear the analysis results store around each test"""
+    analysis.analysis_results_store.clear()
+    yield analysis.analysis_results_store
+    analysis.analysis_results_store.clear()
+
+
+class TestAnalysisRoutes:
+    """Test suite for analysis result endpoints"""
+
+    @pytest.mark.parametrize('change_count', [3, analysis.STREAM_CHANGES_THRESHOLD + 1])
+    def test_get_analysis_result_payload(self, app, client, results_store, change_count):
+        """Test small and streamed results produce the same JSON"""
+        result = _analysis_result('analysis_1', change_count)
+        results_store[result.analysis_id] = result
+
+        response = client.get('/api/analysis/analysis_1')
+
+        assert response.status_code == 200
+        assert response.get_json() == {
+            'success': True,
+            'analysis_result': json.loads(app.json.dumps(result.to_dict()))
+        }
+
+    def test_get_analysis_changes_grouped_and_cached(self, client, results_store):
+        """Test changes are grouped by classification and refreshed when the result is replaced"""
+        result = _analysis_result('analysis_1', 2)
+        result.changes[0].classification = ChangeClassification.CRITICAL
+        results_store[result.analysis_id] = result
+
+        body = client.get('/api/analysis/analysis_1/changes').get_json()
+        assert [len(body['changes_by_type'][key]) for key in ('critical', 'significant', 'inconsequential')] == [1, 1, 0]
+        assert client.get('/api/analysis/analysis_1/changes').get_json() == body
+
+        results_store[result.analysis_id] = _analysis_result('analysis_1', 3)
+        body = client.get('/api/analysis/analysis_1/changes').get_json()
+        assert len(body['changes_by_type']['significant']) == 3
+
+    def test_analysis_results_rebuilt_after_store_change(self, client, results_store):
+        """Test the cached listing reflects inserts and deletes"""
+        results_store['a'] = {'contract': 'Contract A', 'similarity': 0.5}
+        assert [r['id'] for r in client.get('/api/analysis-results').get_json()] == ['a']
+
+        results_store['b'] = {'contract': 'Contract B', 'similarity': 80}
+        listing = client.get('/api/analysis-results').get_json()
+        assert [(r['id'], r['similarity']) for r in listing] == [('a', 50.0), ('b', 80)]
+
+        del results_store['a']
+        assert [r['id'] for r in client.get('/api/analysis-results').get_json()] == ['b']
+
+    def test_listings_survive_concurrent_reads(self, results_store):
+        """Test touching results on one thread does not break listings built on another"""
+        for i in range(200):
+            results_store[f'analysis_{i}'] = _analysis_result(f'analysis_{i}', 1)
+        stop = threading.Event()
+
+        def touch_results():
+            while not stop.is_set():
+                for i in range(200):
+                    results_store.touch(f'analysis_{i}')
+
+        reader = threading.Thread(target=touch_results)
+        reader.start()
+        try:
+            for _ in range(20):
+                assert analysis._build_analysis_list()['total'] == 200
+                assert len(analysis._build_frontend_results()) == 200
+        finally:
+            stop.set()
+            reader.join()
+
+    def test_background_stores_keep_counters_consistent(self, results_store):
+        """Test results stored from executor threads evict and count safely alongside listings"""
+        from app.application.services.dashboard_service import analysis_counters
+        record = analysis_counters.record
+
+        def slow_record(key, result):
+            # Let the other workers evict the first result before it is counted
+            if key == 'analysis_0_0':
+                time.sleep(0.2)
+            record(key, result)
+
+        def store_results(worker):
+            for i in range(100):
+                results_store[f'analysis_{worker}_{i}'] = {'contract': f'Contract {i}', 'date': '2024-01-01'}
+
+        with patch.object(results_store, 'maxsize', 20), \
+             patch.object(analysis_counters, 'record', slow_record):
+            futures = [analysis._analysis_executor.submit(store_results, worker) for worker in range(4)]
+            while not all(future.done() for future in futures):
+                assert len(analysis._build_frontend_results()) <= 20
+            for future in futures:
+                future.result()
+
+        assert len(results_store) == 20
+        assert analysis_counters.total == 20
+        assert set(analysis_counters.newest_keys()) == set(results_store)
+
+    def test_analyze_contract_async_job(self, client, results_store):
+        """Test an async analysis returns 202 and its result through the status endpoint"""
+        contract = Mock(id='contract_1')
+        contract.get_display_name.return_value = 'Contract 1'
+        repository = Mock()
+        repository.get_by_id.return_value.to_domain_object.return_value = contract
+        analyzer = Mock()
+        analyzer.analyze_contract.return_value = _analysis_result('analysis_1', 2)
+
+        with patch.object(analysis, 'contract_repository', repository), \
+             patch.object(analysis, '_get_analyzer', return_value=analyzer), \
+             patch.object(analysis.template_matching_service, 'find_best_template', return_value='template.docx'):
+            response = client.post('/api/analyze-contract', json={'contract_id': 'contract_1', 'async': True})
+            assert response.status_code == 202
+            job_id = response.get_json()['job_id']
+            analysis._analysis_jobs[job_id].result(timeout=5)
+
+        status = client.get(response.get_json()['status_url']).get_json()
+        assert status['state'] == 'done'
+        assert status['result']['id'] == 'analysis_1'
+        assert len(status['result']['analysis']) == 2
+        assert status['result']['date'] == '2024-01-01T00:00:00'
+        assert 'analysis_1' in results_store
+        repository.update_analysis_tracking.assert_called_once_with('contract_1', template_used='template.docx')
+
+    def test_analysis_job_status_unknown(self, client):
+        """Test unknown job IDs return 404"""
+        assert client.get('/api/analysis/job_missing/status').status_code == 404
@@ -0,0 +1,51 @@
+"""
+Unit tests for the analyze contract use case
+"""
+
+import pytest
+from unittest.mock import patch, sentinel
+
+from app.application.use_cases import analyze_contract_use_case as use_case_module
+
+
+@pytest.fixture
+def analyzer_cache():
+    """Start each test with no cached analyzers"""
+    use_case_module._get_or_create_analyzer.cache_clear()
+    yield
+    use_case_module._get_or_create_analyzer.cache_clear()
+
+
+class TestAnalyzerCache:
+    """Test suite for reusing analyzers across executions"""
+
+    def test_equal_configs_share_one_analyzer(self, analyzer_cache):
+        """Test configurations equal up to key order build a single analyzer"""
+        use_case = use_case_module.AnalyzeContractUseCase()
+        with patch.object(use_case_module, 'create_contract_analyzer', return_value=sentinel.analyzer) as create:
+            first = use_case._create_analyzer({'a': 1, 'b': {'c': 2, 'd': 3}})
+            second = use_case._create_analyzer({'b': {'d': 3, 'c': 2}, 'a': 1})
+            other = use_case._create_analyzer(use_case._build_analyzer_config({'llm_settings': {'model': 'gpt-4o-mini'}}))
+
+        assert first is second is other is sentinel.analyzer
+        assert create.call_count == 2
+        create.assert_any_call({'a': 1, 'b': {'c': 2, 'd': 3}})
+        assert use_case_module._get_or_create_analyzer.cache_info().hits == 1
+
+    def test_unserializable_config_builds_private_analyzer(self, analyzer_cache):
+        """Test configs that cannot be keyed bypass the cache"""
+        use_case = use_case_module.AnalyzeContractUseCase()
+        config = {'callback': object()}
+        with patch.object(use_case_module, 'create_contract_analyzer', return_value=sentinel.analyzer) as create:
+            assert use_case._create_analyzer(config) is sentinel.analyzer
+
+        create.assert_called_once_with(config)
+        assert use_case_module._get_or_create_analyzer.cache_info().currsize == 0
+
+    def test_creation_errors_not_cached(self, analyzer_cache):
+        """Test a failed construction is retried on the next request"""
+        with patch.object(use_case_module, 'create_contract_analyzer',
+                          side_effect=[RuntimeError('no client'), sentinel.analyzer]):
+            with pytest.raises(RuntimeError):
+                use_case_module._get_or_create_analyzer('{"a":1}')
+            assert use_case_module._get_or_create_analyzer('{"a":1}') is sentinel.analyzer
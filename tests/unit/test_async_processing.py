@@ -9,6 +9,7 @@ from celery.result import AsyncResult
 
 from app.async_processing.tasks import analyze_contract_async, generate_report_async, batch_analysis_async
 from app.async_processing.task_manager import TaskManager
+from app.api import async_routes
 from app.utils.errors.exceptions import TaskError, AnalysisError
 
 
@@ -341,6 +342,35 @@ class TestTaskManager:
         assert status['failed'] == True
         assert 'error' in status
     
+    def test_get_task_statuses_uses_single_mget(self, task_manager):
+        """Test batch status lookup reads all keys in one backend call"""
+        backend = task_manager.celery_app.backend
+        backend.get_key_for_task.side_effect = lambda task_id: f'key-{task_id}'.encode()
+        backend.mget.return_value = [b'payload', None]
+        backend.decode_result.return_value = {'status': 'SUCCESS', 'result': {'analysis_id': 'analysis_123'}}
+        
+        statuses = task_manager.get_task_statuses(['task_1', 'task_2'])
+        
+        backend.mget.assert_called_once_with([b'key-task_1', b'key-task_2'])
+        assert statuses['task_1']['state'] == 'SUCCESS'
+        assert statuses['task_1']['result']['analysis_id'] == 'analysis_123'
+        assert statuses['task_2']['state'] == 'PENDING'
+        assert statuses['task_2']['ready'] == False
+    
+    @patch('app.async_processing.task_manager.AsyncResult')
+    def test_get_task_statuses_falls_back_without_mget(self, mock_async_result, task_manager):
+        """Test batch status lookup falls back to per-task lookups"""
+        task_manager.celery_app.backend = Mock(spec=[])
+        mock_result = Mock()
+        mock_result.state = 'PENDING'
+        mock_result.info = None
+        mock_async_result.return_value = mock_result
+        
+        statuses = task_manager.get_task_statuses(['task_1', 'task_2'])
+        
+        assert set(statuses) == {'task_1', 'task_2'}
+        assert mock_async_result.call_count == 2
+    
     @patch('app.async_processing.task_manager.AsyncResult')
     def test_cancel_task_success(self, mock_async_result, task_manager):
         """Test successful task cancellation"""
@@ -533,4 +563,115 @@ class TestAsyncAPI:
             assert response.status_code == 503
             data = json.loads(response.data)
             assert data['status'] == 'unhealthy'
-            assert data['workers'] == 0
\ No newline at end of file
+            assert data['workers'] == 0
+
+
+class TestAsyncStatusCaching:
+    """Test caching of polled async status endpoints"""
+    
+    @pytest.fixture
+    def task_manager(self):
+        """Stub the shared TaskManager and clear the status cache around each test"""
+        async_routes._status_cache.clear()
+        manager = Mock()
+        with patch.object(async_routes, '_get_task_manager', return_value=manager):
+            yield manager
+        async_routes._status_cache.clear()
+    
+    def test_task_status_cached_within_ttl(self, client, task_manager):
+        """Test repeated polls within TASK_STATUS_TTL query the backend once"""
+        task_manager.get_task_status.return_value = {'task_id': 'task_123', 'state': 'PROGRESS'}
+        
+        first = client.get('/api/async/tasks/task_123/status')
+        second = client.get('/api/async/tasks/task_123/status')
+        
+        assert first.status_code == second.status_code == 200
+        assert first.get_json() == second.get_json() == {'task_id': 'task_123', 'state': 'PROGRESS'}
+        task_manager.get_task_status.assert_called_once_with('task_123')
+    
+    def test_task_status_refetched_after_ttl(self, client, task_manager):
+        """Test polls after TASK_STATUS_TTL query the backend again"""
+        task_manager.get_task_status.return_value = {'task_id': 'task_123', 'state': 'PROGRESS'}
+        
+        with patch.object(async_routes, 'TASK_STATUS_TTL', 0):
+            client.get('/api/async/tasks/task_123/status')
+            client.get('/api/async/tasks/task_123/status')
+        
+        assert task_manager.get_task_status.call_count == 2
+    
+    def test_cancel_invalidates_cached_status(self, client, task_manager):
+        """Test cancelling a task drops its cached status"""
+        task_manager.get_task_status.side_effect = [
+            {'task_id': 'task_123', 'state': 'PROGRESS'},
+            {'task_id': 'task_123', 'state': 'REVOKED'}
+        ]
+        task_manager.cancel_task.return_value = True
+        
+        client.get('/api/async/tasks/task_123/status')
+        assert client.post('/api/async/tasks/task_123/cancel').status_code == 200
+        response = client.get('/api/async/tasks/task_123/status')
+        
+        assert response.get_json()['state'] == 'REVOKED'
+        assert task_manager.get_task_status.call_count == 2
+    
+    def test_task_history_cached_per_query(self, client, task_manager):
+        """Test history is cached per limit and task type"""
+        task_manager.get_task_history.return_value = [{'task_id': 'task_123'}]
+        
+        client.get('/api/async/tasks/history?limit=10')
+        response = client.get('/api/async/tasks/history?limit=10')
+        client.get('/api/async/tasks/history?limit=20')
+        
+        assert response.get_json() == {'task_history': [{'task_id': 'task_123'}], 'count': 1, 'limit': 10}
+        assert task_manager.get_task_history.call_count == 2
+    
+    def test_active_tasks_body_reused(self, client, task_manager):
+        """Test polls within the TTL return the same encoded body"""
+        task_manager.get_active_tasks.return_value = [{'task_id': 'task_123', 'name': 'analyze_contract_async'}]
+        
+        first = client.get('/api/async/tasks/active')
+        second = client.get('/api/async/tasks/active')
+        
+        assert first.data == second.data
+        assert second.get_json()['count'] == 1
+        task_manager.get_active_tasks.assert_called_once_with()
+    
+    def test_batch_status_fetches_only_uncached_tasks(self, client, task_manager):
+        """Test the batch endpoint serves cached statuses and fetches the rest in one call"""
+        task_manager.get_task_status.return_value = {'task_id': 'task_1', 'state': 'SUCCESS'}
+        task_manager.get_task_statuses.return_value = {'task_2': {'task_id': 'task_2', 'state': 'PENDING'}}
+        client.get('/api/async/tasks/task_1/status')
+        
+        response = client.post('/api/async/tasks/status', json={'task_ids': ['task_1', 'task_2', 'task_1']})
+        
+        assert response.status_code == 200
+        assert response.get_json() == {
+            'statuses': {
+                'task_1': {'task_id': 'task_1', 'state': 'SUCCESS'},
+                'task_2': {'task_id': 'task_2', 'state': 'PENDING'}
+            },
+            'count': 2
+        }
+        task_manager.get_task_statuses.assert_called_once_with(['task_2'])
+        
+        # Fetched statuses are cached for single-task polls too
+        client.get('/api/async/tasks/task_2/status')
+        task_manager.get_task_status.assert_called_once_with('task_1')
+    
+    def test_batch_status_accepts_max_batch(self, client, task_manager):
+        """Test exactly MAX_STATUS_BATCH IDs are accepted"""
+        task_ids = [f'task_{i}' for i in range(async_routes.MAX_STATUS_BATCH)]
+        task_manager.get_task_statuses.side_effect = lambda ids: {i: {'task_id': i} for i in ids}
+        
+        response = client.post('/api/async/tasks/status', json={'task_ids': task_ids})
+        
+        assert response.status_code == 200
+        assert response.get_json()['count'] == async_routes.MAX_STATUS_BATCH
+    
+    @pytest.mark.parametrize('task_ids', [[], [f'task_{i}' for i in range(101)]])
+    def test_batch_status_rejects_bad_batch_size(self, client, task_manager, task_ids):
+        """Test empty batches and batches over 100 IDs are rejected before any backend query"""
+        response = client.post('/api/async/tasks/status', json={'task_ids': task_ids})
+        
+        assert response.status_code == 400
+        task_manager.get_task_statuses.assert_not_called()
\ No newline at end of file
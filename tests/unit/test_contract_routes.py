@@ -0,0 +1,224 @@
+"""
+Unit tests for contract route upload handling
+"""
+
+import hashlib
+import io
+import json
+import pytest
+from unittest.mock import Mock, patch
+
+from app.api.routes import contracts
+
+
+@pytest.fixture
+def upload_dir(app, tmp_path):
+    """Point uploads at a temporary directory"""
+    app.config['UPLOAD_FOLDER'] = str(tmp_path)
+    return tmp_path
+
+
+class TestContractUpload:
+    """Test suite for the contract upload endpoint"""
+
+    def test_upload_streams_file_to_disk(self, client, upload_dir):
+        """Test the uploaded bytes are written to the upload directory and recorded"""
+        content = b'PK\x03\x04' + b'x' * (contracts.UPLOAD_COPY_CHUNK_SIZE + 10)
+        repository = Mock()
+
+        with patch.object(contracts, 'contract_repository', repository), \
+             patch.object(contracts, 'queue_security_event') as queue_event, \
+             patch.object(contracts.security_validator, 'validate_file_content',
+                          return_value={'validation_passed': True}) as validate:
+            response = client.post(
+                '/api/contracts/upload',
+                data={'file': (io.BytesIO(content), 'Master Agreement.docx')},
+                content_type='multipart/form-data'
+            )
+
+        assert response.status_code == 200
+        saved = list(upload_dir.iterdir())
+        assert len(saved) == 1
+        assert saved[0].name.endswith('_Master_Agreement.docx')
+        assert saved[0].read_bytes() == content
+
+        contract = repository.create_from_domain.call_args[0][0]
+        assert contract.file_path == str(saved[0])
+        assert contract.file_size == len(content)
+        assert response.get_json()['contract']['file_size'] == len(content)
+
+        # The hash is taken while saving rather than by a separate validation read
+        assert validate.call_args.kwargs == {'hash_content': False}
+        assert queue_event.call_args.kwargs['details']['file_hash'] == hashlib.sha256(content).hexdigest()
+
+
+    def test_oversized_upload_rejected_before_parsing(self, app, client, upload_dir):
+        """Test a Content-Length over the limit gets 413 without reading the form"""
+        app.config['MAX_CONTENT_LENGTH'] = 1024
+
+        with patch.object(contracts.security_validator, 'validate_file_content') as validate:
+            response = client.post(
+                '/api/contracts/upload',
+                data={'file': (io.BytesIO(b'x' * 4096), 'big.docx')},
+                content_type='multipart/form-data'
+            )
+
+        assert response.status_code == 413
+        validate.assert_not_called()
+        assert list(upload_dir.iterdir()) == []
+
+    def test_non_multipart_upload_rejected(self, client):
+        """Test requests without a multipart body are rejected up front"""
+        response = client.post('/api/contracts/upload', json={'file': 'contract.docx'})
+
+        assert response.status_code == 400
+        assert response.get_json()['success'] is False
+
+
+    def test_upload_failure_audit_omits_traceback(self, client, upload_dir):
+        """Test failed uploads are audited without formatting a traceback outside debug logging"""
+        repository = Mock()
+        repository.create_from_domain.side_effect = RuntimeError('database unavailable')
+
+        with patch.object(contracts, 'contract_repository', repository), \
+             patch.object(contracts, 'queue_security_event') as queue_event, \
+             patch.object(contracts.security_validator, 'validate_file_content',
+                          return_value={'validation_passed': True}):
+            response = client.post(
+                '/api/contracts/upload',
+                data={'file': (io.BytesIO(b'PK\x03\x04docx'), 'contract.docx')},
+                content_type='multipart/form-data'
+            )
+
+        assert response.status_code == 500
+        assert queue_event.call_args.kwargs['details'] == {'error': 'database unavailable'}
+
+
+class TestContractDeletion:
+    """Test suite for contract deletion endpoints"""
+
+    def test_clear_all_skips_missing_files(self, client, tmp_path):
+        """Test clearing removes existing files and ignores ones already gone"""
+        existing = tmp_path / 'contract_a.docx'
+        existing.write_bytes(b'docx')
+        repository = Mock()
+        repository.iter_all.return_value = [
+            Mock(file_path=str(existing)),
+            Mock(file_path=str(tmp_path / 'contract_missing.docx'))
+        ]
+
+        with patch.object(contracts, 'contract_repository', repository):
+            response = client.post('/api/contracts/clear')
+
+        assert response.status_code == 200
+        assert response.get_json()['message'] == 'Cleared 1 contracts successfully'
+        assert not existing.exists()
+        repository.clear_all_contracts.assert_called_once()
+
+    def test_clear_all_unlinks_in_bounded_batches(self, client, tmp_path):
+        """Test files are unlinked batch by batch as rows stream from the repository"""
+        files = [tmp_path / f'contract_{i}.docx' for i in range(5)]
+        streamed = []
+
+        def iter_all():
+            for path in files:
+                streamed.append(path)
+                yield Mock(file_path=str(path))
+
+        repository = Mock()
+        repository.iter_all.side_effect = iter_all
+        unlinked = []
+
+        def unlink(file_path):
+            # Rows are pulled only one batch ahead of the unlinks
+            assert len(streamed) - len(unlinked) <= 2
+            unlinked.append(file_path)
+            return 1
+
+        with patch.object(contracts, 'contract_repository', repository), \
+                patch.object(contracts, 'CLEAR_UNLINK_BATCH', 2), \
+                patch.object(contracts, 'CLEAR_UNLINK_WORKERS', 1), \
+                patch.object(contracts, '_safe_unlink', side_effect=unlink):
+            response = client.post('/api/contracts/clear')
+
+        assert response.status_code == 200
+        assert response.get_json()['message'] == 'Cleared 5 contracts successfully'
+        assert unlinked == [str(path) for path in files]
+
+    @pytest.mark.parametrize('endpoint', ['/api/clear-contracts', '/api/clear-files'])
+    def test_legacy_clear_endpoints_clear_contracts(self, client, tmp_path, endpoint):
+        """Test legacy clear endpoints delete files and rows like /api/contracts/clear"""
+        existing = tmp_path / 'contract_a.docx'
+        existing.write_bytes(b'docx')
+        repository = Mock()
+        repository.iter_all.return_value = [Mock(file_path=str(existing))]
+
+        with patch.object(contracts, 'contract_repository', repository):
+            response = client.post(endpoint)
+
+        assert response.status_code == 200
+        assert response.get_json()['message'] == 'Cleared 1 contracts successfully'
+        assert not existing.exists()
+        repository.clear_all_contracts.assert_called_once()
+
+    def test_safe_unlink_reports_failures_as_not_deleted(self, tmp_path):
+        """Test unlink errors other than a missing file are logged and counted as zero"""
+        target = tmp_path / 'contract_a.docx'
+        target.write_bytes(b'docx')
+
+        assert contracts._safe_unlink(str(target)) == 1
+        assert contracts._safe_unlink(str(target)) == 0
+        with patch.object(contracts.logger, 'warning') as warning:
+            assert contracts._safe_unlink(str(tmp_path)) == 0
+        warning.assert_called_once()
+
+
+class TestContractListing:
+    """Test suite for the contract listing endpoint"""
+
+    def _summaries(self, count):
+        return [Mock(summary={'id': f'contract_{i}'}) for i in range(count)]
+
+    def test_json_listing_by_default(self, client):
+        """Test the default response keeps the JSON envelope"""
+        repository = Mock()
+        repository.get_recent.return_value = self._summaries(2)
+
+        with patch.object(contracts, 'contract_repository', repository):
+            response = client.get('/api/contracts?limit=2')
+
+        assert response.get_json() == {
+            'success': True,
+            'contracts': [{'id': 'contract_0'}, {'id': 'contract_1'}],
+            'total': 2
+        }
+        repository.get_recent.assert_called_once_with(limit=2)
+
+    def test_ndjson_listing_streams_rows(self, client):
+        """Test NDJSON clients get one summary per line"""
+        repository = Mock()
+        repository.iter_recent.return_value = iter(self._summaries(3))
+
+        with patch.object(contracts, 'contract_repository', repository):
+            response = client.get('/api/contracts?limit=50000', headers={'Accept': 'application/x-ndjson'})
+            lines = response.get_data().splitlines()
+
+        assert response.mimetype == 'application/x-ndjson'
+        assert [json.loads(line) for line in lines] == [{'id': f'contract_{i}'} for i in range(3)]
+        repository.iter_recent.assert_called_once_with(limit=contracts.MAX_LIST_LIMIT)
+
+    def test_json_listing_revalidates_with_etag(self, client):
+        """Test an unchanged listing answers If-None-Match with 304"""
+        repository = Mock()
+        repository.get_recent.side_effect = lambda limit: self._summaries(2)
+
+        with patch.object(contracts, 'contract_repository', repository):
+            first = client.get('/api/contracts')
+            cached = client.get('/api/contracts', headers={'If-None-Match': first.headers['ETag']})
+            repository.get_recent.side_effect = lambda limit: self._summaries(3)
+            changed = client.get('/api/contracts', headers={'If-None-Match': first.headers['ETag']})
+
+        assert cached.status_code == 304
+        assert cached.get_data() == b''
+        assert changed.status_code == 200
+        assert changed.get_json()['total'] == 3
@@ -0,0 +1,359 @@
+"""
+Unit tests for dashboard routes and metrics caching
+"""
+
+import pytest
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from app.api.routes import dashboard
+from app.application.services import dashboard_service as service_module
+from app.utils.cache import VersionedStore
+
+
+class TestDashboardMetrics:
+    """Test suite for the dashboard metrics endpoint"""
+
+    def test_metrics_revalidate_with_etag(self, client):
+        """Test polling with a matching ETag returns 304 until the metrics change"""
+        metrics = {'total_contracts': 2, 'total_analyses': 1}
+
+        with patch.object(dashboard.dashboard_service, 'get_dashboard_metrics', side_effect=lambda: dict(metrics)):
+            first = client.get('/api/dashboard/metrics')
+            etag = first.headers['ETag']
+            cached = client.get('/api/dashboard/metrics', headers={'If-None-Match': etag})
+            metrics['total_analyses'] = 2
+            changed = client.get('/api/dashboard/metrics', headers={'If-None-Match': etag})
+
+        assert first.status_code == 200
+        assert first.get_json()['metrics'] == {'total_contracts': 2, 'total_analyses': 1}
+        assert cached.status_code == 304
+        assert changed.status_code == 200
+        assert changed.headers['ETag'] != etag
+
+
+class TestDashboardData:
+    """Test suite for the dashboard data endpoint"""
+
+    def test_data_served_from_cached_json(self, client, metrics_cache):
+        """Test repeat requests reuse the encoded payload inside the success envelope"""
+        payload = {'metrics': {'total_analyses': 1}, 'last_updated': 'now'}
+
+        with patch.object(dashboard.dashboard_service, '_aggregate_dashboard_data', return_value=payload) as aggregate:
+            first = client.get('/api/dashboard/data')
+            second = client.get('/api/dashboard/data')
+
+        aggregate.assert_called_once()
+        assert first.status_code == 200
+        assert first.mimetype == 'application/json'
+        assert first.get_json() == {
+            'success': True,
+            'data': payload,
+            'message': 'Dashboard data retrieved successfully'
+        }
+        assert second.data == first.data
+
+
+class TestDashboardRefresh:
+    """Test suite for the dashboard refresh endpoint"""
+
+    def test_refresh_dispatches_by_type(self, client):
+        """Test each refresh type calls only its service method"""
+        with patch.object(dashboard, 'dashboard_service') as service:
+            service.get_dashboard_metrics.return_value = {'total_contracts': 1}
+            metrics = client.post('/api/dashboard/refresh', json={'refresh_type': 'metrics', 'force_refresh': True})
+            service.get_dashboard_data.return_value = {'metrics': {}}
+            full = client.post('/api/dashboard/refresh')
+
+        assert metrics.status_code == 200
+        assert metrics.get_json()['data'] == {'metrics': {'total_contracts': 1}}
+        service.get_dashboard_metrics.assert_called_once_with(force_refresh=True)
+        assert full.status_code == 200
+        assert full.get_json()['refresh_type'] == 'full'
+        service.refresh_analysis_results.assert_not_called()
+
+    def test_refresh_rejects_unknown_type(self, client):
+        """Test unknown refresh types fail validation"""
+        response = client.post('/api/dashboard/refresh', json={'refresh_type': 'everything'})
+
+        assert response.status_code == 400
+
+
+@contextmanager
+def stored_results(service, results):
+    """Serve results from a results store whose writes reach fresh counters on service"""
+    service.counters = service_module.DashboardCounters()
+    store = VersionedStore()
+    for key, result in results.items():
+        store[key] = result
+        service.counters.record(key, result)
+    with patch('app.api.routes.analysis.analysis_results_store', store):
+        yield
+
+
+@pytest.fixture
+def metrics_cache():
+    """Start each test with no cached metrics"""
+    service_module.invalidate_dashboard_metrics()
+    yield
+    service_module.invalidate_dashboard_metrics()
+
+
+class TestDashboardMetricsCache:
+    """Test suite for DashboardService metrics caching"""
+
+    def test_metrics_calculated_once_per_ttl(self, metrics_cache):
+        """Test repeated polls reuse the cached metrics"""
+        service = service_module.DashboardService()
+        with patch.object(service, '_compute_dashboard_metrics', return_value={'total_contracts': 1}) as compute:
+            assert service.get_dashboard_metrics() == {'total_contracts': 1}
+            assert service.get_dashboard_metrics() == {'total_contracts': 1}
+        compute.assert_called_once()
+
+    def test_force_refresh_and_invalidation_recalculate(self, metrics_cache):
+        """Test force_refresh and invalidate_dashboard_metrics bypass the cache"""
+        service = service_module.DashboardService()
+        with patch.object(service, '_compute_dashboard_metrics', return_value={'total_contracts': 1}) as compute:
+            service.get_dashboard_metrics()
+            service.get_dashboard_metrics(force_refresh=True)
+            service_module.invalidate_dashboard_metrics()
+            service.get_dashboard_metrics()
+        assert compute.call_count == 3
+
+    def test_store_changes_recalculate(self, metrics_cache):
+        """Test analysis store mutations miss the cached metrics without waiting for the TTL"""
+        service = service_module.DashboardService()
+        store = VersionedStore()
+        with patch('app.api.routes.analysis.analysis_results_store', store), \
+                patch.object(service, '_compute_dashboard_metrics', return_value={'total_contracts': 1}) as compute:
+            service.get_dashboard_metrics()
+            service.get_dashboard_metrics()
+            store['new'] = {'status': 'completed'}
+            service.get_dashboard_metrics()
+        assert compute.call_count == 2
+
+    def test_errors_are_not_cached(self, metrics_cache):
+        """Test a failed calculation is retried on the next request"""
+        service = service_module.DashboardService()
+        with patch.object(service, '_compute_dashboard_metrics',
+                          side_effect=[service_module.DashboardDataError('db down'), {'total_contracts': 1}]):
+            with pytest.raises(service_module.DashboardDataError):
+                service.get_dashboard_metrics()
+            assert service.get_dashboard_metrics() == {'total_contracts': 1}
+
+    def test_store_lookups_import_once(self, metrics_cache):
+        """Test store modules are resolved once rather than imported on every metrics call"""
+        from app.api.routes import analysis
+
+        service = service_module.DashboardService()
+        service_module._analysis_routes()
+        service._get_templates_count()
+        with patch('builtins.__import__', side_effect=AssertionError('import during metrics')):
+            assert service_module._analysis_routes() is analysis
+            assert service._get_templates_count() == 0
+
+
+class TestDashboardDataCache:
+    """Test suite for DashboardService dashboard data caching"""
+
+    def test_data_aggregated_once_per_ttl(self, metrics_cache):
+        """Test repeated polls reuse the cached dashboard payload"""
+        service = service_module.DashboardService()
+        with patch.object(service, '_aggregate_dashboard_data', return_value={'metrics': {}}) as aggregate:
+            assert service.get_dashboard_data() == {'metrics': {}}
+            assert service.get_dashboard_data() == {'metrics': {}}
+        aggregate.assert_called_once()
+
+    def test_store_changes_and_force_refresh_reaggregate(self, metrics_cache):
+        """Test analysis store mutations and force_refresh bypass the cached payload"""
+        from app.api.routes.analysis import analysis_results_store
+
+        service = service_module.DashboardService()
+        with patch.object(service, '_aggregate_dashboard_data', return_value={'metrics': {}}) as aggregate:
+            service.get_dashboard_data()
+            analysis_results_store['dashboard-test'] = {'status': 'completed'}
+            try:
+                service.get_dashboard_data()
+            finally:
+                del analysis_results_store['dashboard-test']
+            service.get_dashboard_data(force_refresh=True)
+        assert aggregate.call_count == 3
+
+
+    def test_sources_fetched_in_app_context(self, app, metrics_cache):
+        """Test each source runs on the fetch pool with the caller's app context"""
+        import threading
+        from flask import current_app
+
+        service = service_module.DashboardService()
+        calls = {}
+
+        def fetch(name, value):
+            def run(**kwargs):
+                calls[name] = (threading.current_thread().name, current_app.name)
+                return value
+            return run
+
+        with app.app_context(), \
+                patch.object(service, '_get_analysis_results', fetch('results', [])), \
+                patch.object(service, '_get_contracts_summary', fetch('contracts', [{'id': 'c1'}])), \
+                patch.object(service, '_get_templates_summary', fetch('templates', [])), \
+                patch.object(service, '_get_system_health', fetch('health', {'status': 'healthy'})):
+            data = service.get_dashboard_data()
+
+        assert data['contracts'] == [{'id': 'c1'}]
+        assert data['system_status'] == {'status': 'healthy'}
+        assert data['metrics']['total_contracts'] == 1
+        assert set(calls) == {'results', 'contracts', 'templates', 'health'}
+        assert all(thread.startswith('dashboard-fetch') and name == app.name for thread, name in calls.values())
+
+    def test_undated_results_share_one_timestamp(self, metrics_cache):
+        """Test undated analyses are stamped with the payload's last_updated time"""
+        service = service_module.DashboardService()
+        results = {'a': {'status': 'No Changes'}, 'b': {'status': 'No Changes'}}
+        with stored_results(service, results), \
+                patch.object(service, '_get_contracts_summary', return_value=[]):
+            data = service.get_dashboard_data(force_refresh=True)
+
+        assert {result.date for result in data['analysis_results']} == {data['last_updated']}
+
+
+class TestDashboardSystemHealth:
+    """Test suite for the background-refreshed system health snapshot"""
+
+    def test_reads_return_snapshot_and_refresh_in_background(self):
+        """Test health reads never probe inline and stale snapshots refresh on the fetch pool"""
+        service = service_module.DashboardService()
+        initial = service._get_system_health()
+        submitted = []
+
+        with patch.object(service_module._fetch_executor, 'submit', side_effect=lambda *args: submitted.append(args)), \
+                patch.object(service, '_probe_system_health', return_value={'status': 'degraded'}) as probe:
+            assert service._get_system_health() == initial
+            assert submitted == []
+
+            with patch.object(service_module, 'HEALTH_REFRESH_INTERVAL', 0):
+                assert service._get_system_health() == initial
+                assert service._get_system_health() == initial
+            assert len(submitted) == 1
+            probe.assert_not_called()
+
+            _, app, refresh = submitted[0]
+            service_module._call_in_app_context(app, refresh)
+
+        assert service._get_system_health() == {'status': 'degraded'}
+
+
+class TestDashboardAnalysisResults:
+    """Test suite for DashboardService analysis result retrieval"""
+
+    RESULTS = {
+        'old': {'status': 'No Changes', 'date': '2000-01-01T00:00:00'},
+        'new': {'status': 'Changes - HIGH RISK', 'date': '2999-01-01T00:00:00'},
+        'mid': {'status': 'Changes - LOW RISK', 'date': '2020-01-01T00:00:00'},
+    }
+
+    def test_results_sorted_and_limited(self):
+        """Test results come newest first and limit keeps only the most recent"""
+        service = service_module.DashboardService()
+        with stored_results(service, self.RESULTS):
+            everything = service._get_analysis_results()
+            latest = service.refresh_analysis_results(limit=2)
+
+        assert [result.id for result in everything] == ['new', 'mid', 'old']
+        assert [result.id for result in latest] == ['new', 'mid']
+
+    def test_result_views_serialize_as_objects(self, app):
+        """Test slotted result rows encode like the dicts they replace"""
+        service = service_module.DashboardService()
+        with stored_results(service, {'only': self.RESULTS['new']}):
+            results = service.refresh_analysis_results()
+
+        assert not hasattr(results[0], '__dict__')
+        assert app.json.loads(app.json.dumps(results)) == [{
+            'id': 'only',
+            'contract': 'Unknown Contract',
+            'template': 'Unknown Template',
+            'similarity': 0,
+            'status': 'Changes - HIGH RISK',
+            'date': '2999-01-01T00:00:00',
+            'reviewer': 'System',
+            'changes_count': 0
+        }]
+
+    def test_metrics_read_precomputed_counters(self, metrics_cache):
+        """Test metrics come from the counters without reading the result list"""
+        counters = service_module.DashboardCounters()
+        for key, result in self.RESULTS.items():
+            counters.record(key, result)
+        service = service_module.DashboardService()
+        service.counters = counters
+        with patch.object(service, '_iter_analysis_results') as iter_results:
+            metrics = service.get_dashboard_metrics()
+
+        iter_results.assert_not_called()
+        assert metrics['total_analyses'] == 3
+        assert metrics['pending_reviews'] == 1
+        assert metrics['recent_analyses'] == 1
+
+
+class TestDashboardCounters:
+    """Test suite for the pre-aggregated analysis counters"""
+
+    def test_replace_and_discard_undo_contributions(self):
+        """Test replacing or removing a result adjusts every counter"""
+        counters = service_module.DashboardCounters()
+        counters.record('a', {'status': 'Changes - HIGH RISK'})
+        counters.record('b', {'status': 'No Changes', 'date': 'not a date'})
+        counters.record('a', {'status': 'No Changes', 'date': '2000-01-01T00:00:00'})
+        assert (counters.total, counters.pending, counters.recent_sum()) == (2, 0, 0)
+
+        counters.record('b', {'status': 'NEEDS REVIEW'})
+        counters.discard('a')
+        counters.discard('missing')
+        assert (counters.total, counters.pending, counters.recent_sum()) == (1, 1, 1)
+
+    def test_newest_keys_follow_date_order(self):
+        """Test keys are kept in date order across inserts, replacements and removals"""
+        counters = service_module.DashboardCounters()
+        counters.record('a', {'date': '2020-01-01T00:00:00'})
+        counters.record('b', {'date': '2021-01-01T00:00:00'})
+        counters.record('c', {'date': '2019-01-01T00:00:00'})
+        counters.record('c', {'date': '2022-01-01T00:00:00'})
+        counters.discard('a')
+
+        assert counters.newest_keys() == ['c', 'b']
+
+    def test_pending_status_match_ignores_case(self):
+        """Test pending-review statuses match anywhere in the status, in any case"""
+        counters = service_module.DashboardCounters()
+        for key, status in enumerate(['Changes - high risk', 'Needs Review', 'Changes - LOW RISK', None]):
+            counters.record(key, {'status': status})
+
+        assert counters.pending == 2
+
+    def test_epoch_timestamp_preferred_over_iso_date(self):
+        """Test date_ts stored at ingestion decides recency without parsing the ISO date"""
+        import time
+
+        counters = service_module.DashboardCounters()
+        counters.record('fresh', {'date': 'unparseable', 'date_ts': time.time()})
+        counters.record('stale', {'date': '2999-01-01T00:00:00', 'date_ts': 0.0})
+
+        assert counters.recent_sum() == 1
+
+    def test_results_store_updates_shared_counters(self):
+        """Test writes, deletes and LRU evictions in the results store reach the counters"""
+        from app.api.routes import analysis
+
+        counters = service_module.DashboardCounters()
+        store = analysis._CountedResultsStore(maxsize=2)
+        with patch.object(analysis, 'analysis_counters', counters):
+            store['a'] = {'status': 'HIGH RISK'}
+            store['b'] = {'status': 'HIGH RISK'}
+            store['c'] = {'status': 'No Changes'}
+            assert (counters.total, counters.pending) == (2, 1)
+            del store['b']
+            assert (counters.total, counters.pending) == (1, 0)
+            store.clear()
+        assert counters.total == 0
@@ -102,6 +102,21 @@ class TestContractModel:
             assert summary['filename'] == "Test Contract.docx"
             assert summary['file_size'] == 1024
             assert summary['status'] == 'uploaded'
+    
+    def test_contract_summary_cache_invalidation(self, app, test_contract):
+        """Test cached summary is rebuilt after a summarised field changes"""
+        with app.app_context():
+            contract_model = ContractModel.from_domain_object(test_contract)
+            summary = contract_model.summary
+            
+            assert contract_model.summary is summary
+            
+            contract_model.status = 'analyzed'
+            contract_model.analysis_count = 1
+            
+            assert contract_model.summary is not summary
+            assert contract_model.summary['status'] == 'analyzed'
+            assert contract_model.summary['analysis_count'] == 1
 
 
 class TestAnalysisResultModel:
@@ -207,6 +222,19 @@ class TestContractRepository:
             assert len(recent) == 1
             assert recent[0].id == "test_contract_001"
     
+    def test_iter_summary_rows(self, app, test_contract):
+        """Test streaming contract summary columns without loading models"""
+        with app.app_context():
+            repo = ContractRepository()
+            repo.create_from_domain(test_contract)
+            
+            rows = list(repo.iter_summary_rows())
+            assert len(rows) == 1
+            assert tuple(rows[0]) == (
+                "test_contract_001", "test_contract.docx", "Test Contract.docx",
+                test_contract.upload_timestamp, "uploaded"
+            )
+    
     def test_contract_exists(self, app, test_contract):
         """Test checking if contract exists"""
         with app.app_context():
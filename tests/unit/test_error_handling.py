@@ -88,6 +88,18 @@ class TestValidationHandler:
                 ValidationHandler.validate_contract_id(contract_id)
             assert expected_message in str(exc_info.value)
     
+    def test_validate_contract_id_rejects_trailing_newline(self):
+        """Test a trailing newline cannot slip past the format check"""
+        with pytest.raises(ValidationError):
+            ValidationHandler.validate_contract_id("contract_123\n")
+    
+    def test_validate_contract_id_repeat_calls(self):
+        """Test repeated validation returns the same result and still rejects invalid IDs"""
+        for _ in range(2):
+            assert ValidationHandler.validate_contract_id("contract_123") == "contract_123"
+            with pytest.raises(ValidationError):
+                ValidationHandler.validate_contract_id("contract-123")
+    
     def test_validate_analysis_id_valid(self):
         """Test valid analysis ID validation"""
         valid_ids = ["analysis_123", "test-analysis", "ANALYSIS_001", "abc123_def-456"]
@@ -0,0 +1,102 @@
+"""
+Unit tests for the orjson JSON provider
+"""
+
+import json
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+
+import pytest
+from unittest.mock import patch
+from flask import Flask, jsonify, request
+from werkzeug.exceptions import BadRequest
+from flask.json.provider import DefaultJSONProvider
+
+from app.utils.api import json_provider
+from app.utils.api.json_provider import HAS_ORJSON, OrjsonProvider, init_json_provider
+
+pytestmark = pytest.mark.skipif(not HAS_ORJSON, reason="orjson not installed")
+
+
+@pytest.fixture
+def flask_app():
+    """Create a bare Flask app using the orjson provider"""
+    app = Flask(__name__)
+    init_json_provider(app)
+    return app
+
+
+class TestOrjsonProvider:
+    """Test suite for OrjsonProvider"""
+
+    def test_provider_installed(self, flask_app):
+        """Test init_json_provider swaps in the orjson provider"""
+        assert isinstance(flask_app.json, OrjsonProvider)
+
+    def test_matches_default_provider_output(self, flask_app):
+        """Test serialized output matches Flask's default provider"""
+        payload = {
+            'b': 1,
+            'a': [1.5, None, True],
+            'when': datetime(2024, 1, 2, 3, 4, 5),
+            'amount': Decimal('10.50'),
+            'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'name': 'café'
+        }
+        default = DefaultJSONProvider(flask_app)
+
+        assert json.loads(flask_app.json.dumps(payload)) == json.loads(default.dumps(payload))
+        assert flask_app.json.dumps({'b': 1, 'a': 2}) == '{"a":2,"b":1}'
+
+    def test_non_string_keys(self, flask_app):
+        """Test integer dict keys are serialized as strings"""
+        assert json.loads(flask_app.json.dumps({1: 'x'})) == {'1': 'x'}
+
+    def test_falls_back_for_big_integers(self, flask_app):
+        """Test values orjson rejects are handled by the stdlib encoder"""
+        assert json.loads(flask_app.json.dumps({'n': 2 ** 70})) == {'n': 2 ** 70}
+
+    def test_enums_and_domain_objects(self, flask_app):
+        """Test enums serialize as values and domain objects via to_dict"""
+        class Classification(Enum):
+            CRITICAL = 'critical'
+
+        class Change:
+            def to_dict(self):
+                return {'classification': Classification.CRITICAL}
+
+        payload = {'change': Change(), 'n': 2 ** 70, 'type': Classification.CRITICAL}
+
+        assert json.loads(flask_app.json.dumps(payload)) == {
+            'change': {'classification': 'critical'},
+            'n': 2 ** 70,
+            'type': 'critical'
+        }
+
+    def test_jsonify_response(self, flask_app):
+        """Test jsonify builds a JSON response through the provider"""
+        with flask_app.app_context():
+            response = jsonify({'status': 'ok'})
+
+        assert response.mimetype == 'application/json'
+        assert response.get_json() == {'status': 'ok'}
+
+    def test_loads_bytes(self, flask_app):
+        """Test request bodies can be parsed from bytes"""
+        assert flask_app.json.loads(b'{"a": [1, 2]}') == {'a': [1, 2]}
+
+    def test_request_bodies_parsed_with_orjson(self, flask_app):
+        """Test request.get_json() goes through the orjson provider"""
+        with patch.object(json_provider.orjson, 'loads', wraps=json_provider.orjson.loads) as loads:
+            with flask_app.test_request_context(method='POST', json={'contract_id': 'c1'}):
+                assert request.get_json() == {'contract_id': 'c1'}
+        loads.assert_called_once()
+
+    def test_malformed_request_body(self, flask_app):
+        """Test invalid JSON still maps to a 400 / silent None"""
+        with flask_app.test_request_context(method='POST', data='{bad', content_type='application/json'):
+            assert request.get_json(silent=True) is None
+            with pytest.raises(BadRequest):
+                request.get_json()
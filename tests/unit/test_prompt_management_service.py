@@ -0,0 +1,33 @@
+"""
+Unit tests for PromptManagementService storage
+"""
+
+import json
+import pytest
+
+from app.core.services.prompt_management_service import PromptManagementService, PromptStorageError
+
+
+class TestPromptStorage:
+    """Test suite for loading saved prompts"""
+
+    def test_saved_prompts_override_defaults(self, tmp_path):
+        """Test saved prompts are parsed and merged over the defaults"""
+        prompts_file = tmp_path / 'prompts.json'
+        prompts_file.write_text(json.dumps({
+            'custom': {'name': 'Café', 'description': 'Custom', 'template': '{x}', 'variables': ['x']}
+        }), encoding='utf-8')
+
+        prompts = PromptManagementService(str(prompts_file)).list_all_prompts()
+
+        assert prompts['custom']['name'] == 'Café'
+        assert prompts['custom']['metadata']['source'] == 'custom'
+        assert 'contract_analysis' in prompts
+
+    def test_invalid_json_raises_storage_error(self, tmp_path):
+        """Test a corrupt prompts file surfaces as PromptStorageError"""
+        prompts_file = tmp_path / 'prompts.json'
+        prompts_file.write_text('{"custom": ', encoding='utf-8')
+
+        with pytest.raises(PromptStorageError):
+            PromptManagementService(str(prompts_file)).list_all_prompts()
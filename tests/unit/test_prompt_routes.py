@@ -0,0 +1,226 @@
+"""
+Unit tests for prompt management routes
+"""
+
+import json
+import pytest
+from unittest.mock import patch
+
+from app.api.routes import prompts
+
+
+@pytest.fixture
+def prompt_cache():
+    """Start each test with no cached prompt reads"""
+    prompts.invalidate_prompt_cache()
+    yield
+    prompts.invalidate_prompt_cache()
+
+
+class TestPromptListing:
+    """Test suite for prompt read endpoints"""
+
+    def test_requests_share_one_service(self, client, prompt_cache):
+        """Test handlers reuse the module-level service instead of building one per request"""
+        with patch.object(prompts, 'PromptManagementService') as service_class, \
+                patch.object(prompts.prompt_service, 'list_all_prompts', return_value={'p1': {}}):
+            response = client.get('/api/prompts')
+
+        assert response.status_code == 200
+        assert response.get_json()['count'] == 1
+        service_class.assert_not_called()
+
+    def test_reads_cached_until_write(self, client, prompt_cache):
+        """Test repeat GETs skip the service until a save invalidates the cache"""
+        prompt = {'name': 'Test', 'description': 'Test prompt', 'template': 'Hello {name}'}
+
+        with patch.object(prompts.prompt_service, 'list_all_prompts', return_value={'p1': prompt}) as list_all, \
+                patch.object(prompts.prompt_service, 'get_prompt_by_id', return_value=prompt) as get_by_id, \
+                patch.object(prompts.prompt_service, 'save_prompt', return_value=True):
+            client.get('/api/prompts')
+            client.get('/api/prompts')
+            client.get('/api/prompts/p1')
+            client.get('/api/prompts/p1')
+            saved = client.put('/api/prompts/p1', json=prompt)
+            client.get('/api/prompts')
+
+        assert saved.status_code == 200
+        assert list_all.call_count == 2
+        get_by_id.assert_called_once_with('p1')
+
+    def test_legacy_ids_resolve_to_current_prompts(self, client, prompt_cache):
+        """Test legacy frontend ids are mapped before reaching the service"""
+        with patch.object(prompts.prompt_service, 'get_prompt_by_id', return_value={'name': 'Analysis'}) as get_by_id, \
+                patch.object(prompts.prompt_service, 'list_prompt_backups', return_value=[]) as list_backups:
+            client.get('/api/prompts/individual_analysis')
+            client.get('/api/prompts/custom_prompt')
+            client.get('/api/prompts/backups/ultra_fast')
+
+        assert [c.args[0] for c in get_by_id.call_args_list] == ['contract_analysis', 'custom_prompt']
+        list_backups.assert_called_once_with('change_classification')
+
+    def test_legacy_and_current_ids_share_cache_entry(self, client, prompt_cache):
+        """Test legacy and current ids for one prompt reuse the same cached read"""
+        with patch.object(prompts.prompt_service, 'get_prompt_by_id', return_value={'name': 'Analysis'}) as get_by_id:
+            legacy = client.get('/api/prompts/batch_analysis')
+            current = client.get('/api/prompts/contract_analysis')
+
+        assert legacy.get_json()['prompt'] == current.get_json()['prompt']
+        get_by_id.assert_called_once_with('contract_analysis')
+
+    def test_missing_prompt_returns_404(self, client, prompt_cache):
+        """Test unknown prompts share the static not-found body"""
+        with patch.object(prompts.prompt_service, 'get_prompt_by_id', return_value=None), \
+                patch.object(prompts.prompt_service, 'delete_prompt', return_value=False):
+            missing = client.get('/api/prompts/unknown')
+            deleted = client.delete('/api/prompts/unknown')
+
+        assert missing.status_code == 404
+        assert deleted.status_code == 404
+        assert missing.get_json() == deleted.get_json() == {'success': False, 'error': 'Prompt not found'}
+
+    def test_get_revalidates_with_etag(self, client, prompt_cache):
+        """Test a matching If-None-Match returns 304 until the prompt changes"""
+        prompt = {'name': 'Test', 'description': 'Test prompt', 'template': 'Hello {name}'}
+
+        with patch.object(prompts.prompt_service, 'get_prompt_by_id', side_effect=lambda _: dict(prompt)):
+            first = client.get('/api/prompts/p1')
+            etag = first.headers['ETag']
+            cached = client.get('/api/prompts/p1', headers={'If-None-Match': etag})
+            prompt['template'] = 'Hi {name}'
+            prompts.invalidate_prompt_cache()
+            changed = client.get('/api/prompts/p1', headers={'If-None-Match': etag})
+
+        assert first.status_code == 200
+        assert 'no-cache' in first.headers['Cache-Control']
+        assert cached.status_code == 304
+        assert changed.status_code == 200
+        assert changed.get_json()['prompt']['template'] == 'Hi {name}'
+
+    def test_listing_streams_ndjson_when_requested(self, client, prompt_cache):
+        """Test NDJSON clients get one prompt per line"""
+        catalog = {'p1': {'name': 'One'}, 'p2': {'name': 'Two'}}
+
+        with patch.object(prompts.prompt_service, 'list_all_prompts', return_value=catalog):
+            response = client.get('/api/prompts', headers={'Accept': 'application/x-ndjson'})
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert lines == [{'id': 'p1', 'name': 'One'}, {'id': 'p2', 'name': 'Two'}]
+
+    def test_stats_alias_serves_statistics(self, client, prompt_cache):
+        """Test /prompts/stats is routed straight to the statistics view"""
+        with patch.object(prompts.prompt_service, 'get_prompt_statistics', return_value={'total_prompts': 3}):
+            alias = client.get('/api/prompts/stats')
+            statistics = client.get('/api/prompts/statistics')
+
+        assert alias.status_code == 200
+        assert alias.get_json() == statistics.get_json()
+        assert alias.get_json()['statistics'] == {'total_prompts': 3}
+
+    def test_bundle_combines_prompts_and_statistics(self, client, prompt_cache):
+        """Test the bundle returns both parts and fills the shared cache"""
+        with patch.object(prompts.prompt_service, 'list_all_prompts', return_value={'p1': {}}) as list_all, \
+                patch.object(prompts.prompt_service, 'get_prompt_statistics', return_value={'total_prompts': 1}):
+            bundle = client.get('/api/prompts/bundle')
+            listing = client.get('/api/prompts')
+
+        assert bundle.status_code == 200
+        body = bundle.get_json()
+        assert body['prompts'] == {'p1': {}}
+        assert body['statistics'] == {'total_prompts': 1}
+        assert listing.get_json()['count'] == 1
+        list_all.assert_called_once()
+
+    def test_warmup_fills_cache(self, app, prompt_cache):
+        """Test warming loads the listing and statistics before any request"""
+        with patch.object(prompts.prompt_service, 'list_all_prompts', return_value={'p1': {}}) as list_all, \
+                patch.object(prompts.prompt_service, 'get_prompt_statistics', return_value={'total_prompts': 1}):
+            with app.app_context():
+                prompts.warm_prompt_cache()
+            response = app.test_client().get('/api/prompts')
+
+        assert response.get_json()['count'] == 1
+        list_all.assert_called_once()
+        assert prompts._prompt_cache.get('statistics') == {'total_prompts': 1}
+
+    def test_unexpected_errors_use_blueprint_handler(self, client, prompt_cache):
+        """Test uncaught exceptions become the JSON 500 labelled for the failing view"""
+        with patch.object(prompts.prompt_service, 'get_prompt_statistics', side_effect=RuntimeError('disk gone')), \
+                patch.object(prompts.prompt_service, 'list_prompt_backups', side_effect=RuntimeError('disk gone')):
+            statistics = client.get('/api/prompts/statistics')
+            backups = client.get('/api/prompts/backups/p1')
+
+        assert statistics.status_code == 500
+        assert statistics.get_json() == {
+            'success': False,
+            'error': 'Failed to retrieve statistics',
+            'message': 'An unexpected error occurred'
+        }
+        assert backups.status_code == 500
+        assert backups.get_json()['error'] == 'Failed to retrieve backups'
+
+
+class TestPromptRequestValidation:
+    """Test suite for prompt request schemas"""
+
+    def test_defaults_not_shared_between_requests(self):
+        """Test omitted collections load as fresh containers on every request"""
+        first = prompts.prompt_schema.load({'name': 'A', 'description': 'B', 'template': 'C'})
+        first['variables'].append('leaked')
+        second = prompts.prompt_schema.load({'name': 'A', 'description': 'B', 'template': 'C'})
+        preview = prompts.preview_schema.load({'template': 'C'})
+
+        assert second['variables'] == []
+        assert preview == {'template': 'C', 'prompt_type': '', 'sample_data': {}}
+
+    def test_invalid_body_returns_400(self, client):
+        """Test missing required fields keep the existing 400 response shape"""
+        response = client.put('/api/prompts/p1', json={'name': 'A'})
+
+        assert response.status_code == 400
+        body = response.get_json()
+        assert body['error'] == 'Request validation failed'
+        assert set(body['details']) == {'description', 'template'}
+
+    def test_validate_checks_request_shape_inline(self, client):
+        """Test /prompts/validate rejects bad bodies with the schema error shape"""
+        valid = client.post('/api/prompts/validate', json={'template': 'Hi {name}', 'variables': ['name']})
+        missing = client.post('/api/prompts/validate', json={'variables': ['name']})
+        wrong_types = client.post('/api/prompts/validate', json={'template': 1, 'variables': 'name'})
+
+        assert valid.status_code == 200
+        assert valid.get_json()['validation']['valid'] is True
+        assert missing.status_code == 400
+        assert missing.get_json()['details'] == {'template': ['Missing data for required field.']}
+        assert wrong_types.status_code == 400
+        assert set(wrong_types.get_json()['details']) == {'template', 'variables'}
+
+    def test_malformed_json_treated_as_empty_body(self, client):
+        """Test unparseable bodies get the JSON 400 validation response"""
+        response = client.put('/api/prompts/p1', data='{not json', content_type='application/json')
+
+        assert response.status_code == 400
+        assert set(response.get_json()['details']) == {'name', 'description', 'template'}
+
+
+class TestPromptPreview:
+    """Test suite for the prompt preview endpoint"""
+
+    def test_preview_uses_sample_data_for_legacy_type(self, client):
+        """Test legacy prompt types preview with the shared sample data"""
+        response = client.post('/api/prompts/preview', json={
+            'template': 'Was: {original_text} Now: {modified_text}',
+            'prompt_type': 'ultra_fast'
+        })
+
+        assert response.status_code == 200
+        body = response.get_json()
+        assert body['sample_data_used']['context'] == 'Payment terms section of service agreement'
+        assert 'Payment due within 45 days' in body['preview']['rendered_prompt']
+        assert prompts._get_sample_data_for_type('unknown') is prompts._DEFAULT_SAMPLE_DATA
+        for legacy_type, prompt_type in prompts.PROMPT_TYPE_MAPPING.items():
+            assert prompts._get_sample_data_for_type(legacy_type) is prompts._SAMPLE_DATA_BY_TYPE[prompt_type]
+        with pytest.raises(TypeError):
+            prompts._get_sample_data_for_type('ultra_fast')['context'] = 'changed'
@@ -0,0 +1,108 @@
+"""
+Unit tests for security audit logging
+"""
+
+import json
+import pytest
+from unittest.mock import Mock, call, patch
+
+from app.utils.security.audit import (
+    APIAccessEvent, BackgroundAuditWriter, SecurityAuditor, SecurityEvent, SecurityEventType
+)
+
+
+def _event(status_code: int = 200) -> APIAccessEvent:
+    return APIAccessEvent('/api/contracts', 'GET', status_code, 0.01, '127.0.0.1', 'pytest')
+
+
+class TestBackgroundAuditWriter:
+    """Test suite for BackgroundAuditWriter"""
+
+    def test_writes_synchronously_until_started(self):
+        """Test events are logged inline before the writer thread starts"""
+        auditor = Mock()
+        writer = BackgroundAuditWriter(auditor)
+
+        writer.submit_api_access(_event())
+
+        auditor.log_api_access.assert_called_once_with(*_event())
+
+    def test_flush_writes_queued_events_in_batch(self):
+        """Test flush drains every queued event, even beyond one batch"""
+        auditor = Mock()
+        writer = BackgroundAuditWriter(auditor, batch_size=2)
+        writer._thread = Mock()  # Queue events without running the thread
+
+        writer.submit_api_access(_event(200))
+        writer.submit_api_access(_event(404))
+        writer.submit_api_access(_event(500))
+        auditor.log_api_access.assert_not_called()
+
+        writer.flush()
+
+        assert auditor.log_api_access.call_args_list == [
+            call(*_event(200)), call(*_event(404)), call(*_event(500))
+        ]
+        assert writer._queue.empty()
+
+    def test_drain_respects_batch_size(self):
+        """Test a batch never exceeds batch_size"""
+        writer = BackgroundAuditWriter(Mock(), batch_size=2)
+        writer._thread = Mock()
+        for _ in range(3):
+            writer.submit_api_access(_event())
+
+        assert len(writer._drain([])) == 2
+        assert len(writer._drain([])) == 1
+
+    def test_security_events_written_in_background(self):
+        """Test queued security and API access events are written in queue order"""
+        auditor = Mock()
+        writer = BackgroundAuditWriter(auditor)
+        writer._thread = Mock()
+        event = SecurityEvent(SecurityEventType.ANALYSIS_DELETED, {'analysis_id': 'a1'}, user_ip='127.0.0.1')
+
+        writer.submit_security_event(event)
+        writer.submit_api_access(_event())
+        auditor.log_security_event.assert_not_called()
+
+        writer.flush()
+
+        assert auditor.mock_calls == [call.log_security_event(*event), call.log_api_access(*_event())]
+
+    def test_full_queue_drops_events(self):
+        """Test events beyond max_queued are dropped with a warning instead of blocking"""
+        auditor = Mock()
+        writer = BackgroundAuditWriter(auditor, max_queued=1)
+        writer._thread = Mock()
+
+        writer.submit_api_access(_event(200))
+        writer.submit_api_access(_event(500))
+
+        auditor.logger.warning.assert_called_once()
+        writer.flush()
+        auditor.log_api_access.assert_called_once_with(*_event(200))
+
+
+class TestSecurityAuditor:
+    """Test suite for SecurityAuditor log formatting"""
+
+    def test_event_logged_as_json(self):
+        """Test events are written as JSON that round-trips non-ASCII details"""
+        auditor = SecurityAuditor()
+        with patch.object(auditor.logger, 'info') as log_info:
+            auditor.log_security_event(
+                SecurityEventType.FILE_UPLOAD, {'filename': 'Vertrag_Müller.docx', 1: 'int key'}
+            )
+
+        event = json.loads(log_info.call_args[0][0])
+        assert event['event_type'] == 'file_upload'
+        assert event['details'] == {'filename': 'Vertrag_Müller.docx', '1': 'int key'}
+
+    def test_event_with_unsupported_value_falls_back(self):
+        """Test values orjson rejects are still encoded by the json module"""
+        auditor = SecurityAuditor()
+        with patch.object(auditor.logger, 'info') as log_info:
+            auditor.log_security_event(SecurityEventType.FILE_UPLOAD, {'size': 2 ** 70})
+
+        assert json.loads(log_info.call_args[0][0])['details'] == {'size': 2 ** 70}
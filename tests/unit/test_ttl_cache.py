@@ -0,0 +1,102 @@
+"""
+Unit tests for the in-process TTL cache
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from app.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test suite for TTLCache"""
+
+    def test_set_and_get(self):
+        """Test stored values are returned before expiry"""
+        cache = TTLCache(default_ttl=10)
+        cache.set('key', {'value': 1})
+        assert cache.get('key') == {'value': 1}
+
+    def test_missing_key_returns_default(self):
+        """Test default is returned for unknown keys"""
+        cache = TTLCache()
+        assert cache.get('missing') is None
+        assert cache.get('missing', 'fallback') == 'fallback'
+
+    def test_entry_expires(self):
+        """Test entries are dropped once their ttl has passed"""
+        cache = TTLCache(default_ttl=5)
+        with patch('app.utils.cache.ttl_cache.time.monotonic', return_value=100.0):
+            cache.set('key', 'value')
+        with patch('app.utils.cache.ttl_cache.time.monotonic', return_value=104.9):
+            assert cache.get('key') == 'value'
+        with patch('app.utils.cache.ttl_cache.time.monotonic', return_value=105.0):
+            assert cache.get('key') is None
+        assert len(cache) == 0
+
+    def test_get_or_set_calls_factory_once(self):
+        """Test factory is only invoked on a miss"""
+        cache = TTLCache(default_ttl=10)
+        factory = Mock(return_value=42)
+
+        assert cache.get_or_set('key', factory) == 42
+        assert cache.get_or_set('key', factory) == 42
+        factory.assert_called_once()
+
+    def test_get_or_set_concurrent_misses_share_one_call(self):
+        """Test threads missing the same key wait for one factory call"""
+        cache = TTLCache(default_ttl=10)
+        calls = []
+
+        def factory():
+            calls.append(1)
+            time.sleep(0.05)
+            return 'value'
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_set('key', factory)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ['value'] * 8
+        assert len(calls) == 1
+        assert cache._loading == {}
+
+    def test_get_or_set_caches_falsy_values(self):
+        """Test empty results are cached rather than recomputed"""
+        cache = TTLCache(default_ttl=10)
+        factory = Mock(return_value=[])
+
+        cache.get_or_set('key', factory)
+        cache.get_or_set('key', factory)
+        factory.assert_called_once()
+
+    def test_delete_and_clear(self):
+        """Test explicit invalidation"""
+        cache = TTLCache()
+        cache.set('a', 1)
+        cache.set('b', 2)
+
+        cache.delete('a')
+        assert cache.get('a') is None
+        assert cache.get('b') == 2
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_maxsize_evicts_oldest(self):
+        """Test the oldest entry is evicted when the cache is full"""
+        cache = TTLCache(default_ttl=10, maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.set('c', 3)
+
+        assert cache.get('a') is None
+        assert cache.get('b') == 2
+        assert cache.get('c') == 3
@@ -0,0 +1,98 @@
+"""
+Unit tests for the versioned in-memory store
+"""
+
+from app.utils.cache import LRUStore, VersionedStore
+
+
+class TestVersionedStore:
+    """Test suite for VersionedStore"""
+
+    def test_starts_at_version_zero(self):
+        """Test a new store has not been mutated"""
+        store = VersionedStore({'a': 1})
+        assert store.version == 0
+        assert store['a'] == 1
+
+    def test_mutations_bump_version(self):
+        """Test every mutating operation changes the version"""
+        store = VersionedStore()
+        versions = [store.version]
+
+        store['a'] = 1
+        versions.append(store.version)
+        store.update(b=2)
+        versions.append(store.version)
+        store.setdefault('c', 3)
+        versions.append(store.version)
+        store.pop('a')
+        versions.append(store.version)
+        del store['b']
+        versions.append(store.version)
+        store.clear()
+        versions.append(store.version)
+
+        assert len(set(versions)) == len(versions)
+
+    def test_reads_do_not_bump_version(self):
+        """Test lookups leave the version unchanged"""
+        store = VersionedStore()
+        store['a'] = 1
+        version = store.version
+
+        store.get('a')
+        list(store.items())
+        store.setdefault('a', 2)
+
+        assert store.version == version
+
+
+class TestLRUStore:
+    """Test suite for LRUStore"""
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest entry is dropped once maxsize is exceeded"""
+        store = LRUStore(maxsize=2)
+        store['a'] = 1
+        store['b'] = 2
+        store['c'] = 3
+
+        assert list(store) == ['b', 'c']
+
+    def test_touch_refreshes_recency(self):
+        """Test touched entries survive eviction"""
+        store = LRUStore(maxsize=2)
+        store['a'] = 1
+        store['b'] = 2
+        store.touch('a')
+        store['c'] = 3
+
+        assert list(store) == ['a', 'c']
+
+    def test_touch_ignores_missing_keys(self):
+        """Test touching an unknown key is a no-op"""
+        store = LRUStore(maxsize=2)
+        store.touch('missing')
+        assert len(store) == 0
+
+    def test_snapshot_is_a_copy(self):
+        """Test snapshots are unaffected by later mutations"""
+        store = LRUStore(maxsize=2)
+        store['a'] = 1
+        snapshot = store.snapshot()
+
+        store['b'] = 2
+        store.touch('a')
+
+        assert snapshot == [('a', 1)]
+
+    def test_eviction_bumps_version(self):
+        """Test evictions invalidate views built from the store"""
+        store = LRUStore(maxsize=1)
+        store['a'] = 1
+        version = store.version
+
+        store['b'] = 2
+
+        assert store.version > version
+        assert 'a' not in store